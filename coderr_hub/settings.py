@@ -11,6 +11,11 @@ def env_bool(key: str, default: bool = False) -> bool:
     return os.getenv(key, str(default)).strip().lower() in {"1", "true", "yes", "on"}
 
 
+def env_int(key: str, default: int = 0) -> int:
+    raw = os.getenv(key, "").strip()
+    return int(raw) if raw else default
+
+
 def env_list(key: str, default: str = "") -> list[str]:
     raw = os.getenv(key, default).strip()
     if not raw:
@@ -90,9 +95,45 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # A file instead of the shared in-memory database, so that the
+        # concurrency tests wait for locks like the real database does.
+        "TEST": {"NAME": BASE_DIR / "test_db.sqlite3"},
+    }
+}
+
+# Cache (local memory by default; point at redis/memcached in production)
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "coderr"),
     }
 }
 
+# Seconds a public offers list response stays cached (0 disables the cache)
+OFFERS_LIST_CACHE_TIMEOUT = env_int("OFFERS_LIST_CACHE_TIMEOUT", 300)
+
+# Build offers list rows with SQL-side JSON aggregation (SQLite) instead of serializers
+OFFERS_LIST_FAST_PATH = env_bool("OFFERS_LIST_FAST_PATH", True)
+
+# Filter/order/page the offers list on an in-memory NumPy catalog (requires numpy)
+OFFERS_LIST_CATALOG = env_bool("OFFERS_LIST_CATALOG", False)
+# Seconds before the catalog is fully reloaded to pick up writes of other processes (0 = never)
+OFFERS_CATALOG_MAX_AGE = env_int("OFFERS_CATALOG_MAX_AGE", 300)
+
+# Build Offer.image variants on a background thread pool (False: inline after commit)
+OFFER_IMAGE_VARIANTS_ASYNC = env_bool("OFFER_IMAGE_VARIANTS_ASYNC", True)
+
+# Days after their last change that closed orders are moved to the archive table
+ORDERS_ARCHIVE_AFTER_DAYS = env_int("ORDERS_ARCHIVE_AFTER_DAYS", 90)
+
+# Seconds an `Idempotency-Key` of a create request (orders, offers) is remembered
+IDEMPOTENCY_KEY_TTL = env_int("IDEMPOTENCY_KEY_TTL", 86400)
+# Seconds a retry waits for an unfinished first attempt before taking over its
+# key (keep it above the request timeout)
+IDEMPOTENCY_LOCK_TIMEOUT = env_int("IDEMPOTENCY_LOCK_TIMEOUT", 60)
+
 # I18N
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -6,7 +6,8 @@ from django.conf.urls.static import static
 from offers_app.api.views import OfferDetailViewSet
 from offers_app.api.redirects import offerdetail_redirect
 
-from orders_app.api.views import OrderCountView, CompletedOrderCountView
+from orders_app.api.views import OrderCountView, CompletedOrderCountView, OrderStatsView
+from reviews_app.api.views import RatingSummaryView
 
 
 urlpatterns = [
@@ -24,8 +25,10 @@ urlpatterns = [
     path("api/orders/", include("orders_app.api.urls")),
     path("api/order-count/<int:business_user_id>/", OrderCountView.as_view(), name="order-count"),
     path("api/completed-order-count/<int:business_user_id>/", CompletedOrderCountView.as_view(), name="completed-order-count"),
+    path("api/order-stats/", OrderStatsView.as_view(), name="order-stats"),
 
     path("api/reviews/", include("reviews_app.api.urls")),
+    path("api/rating-summary/<int:business_user_id>/", RatingSummaryView.as_view(), name="rating-summary"),
 
     path("api/base-info/", include("core.api.urls")),
 ]
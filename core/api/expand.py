@@ -0,0 +1,31 @@
+"""
+Helpers for the `?expand=` query parameter.
+
+`expand` takes a comma separated list of relation names whose full payload
+should be embedded in the response instead of ids/links, e.g.
+`?expand=details` or `?expand=reviewer,business_user`.
+"""
+
+EXPAND_PARAM = "expand"
+
+
+def get_expand_fields(request):
+    """
+    Return the set of requested expansions (empty without a request).
+    """
+    if request is None:
+        return set()
+
+    params = getattr(request, "query_params", request.GET)
+
+    expand = set()
+    for value in params.getlist(EXPAND_PARAM):
+        expand.update(part.strip() for part in value.split(",") if part.strip())
+    return expand
+
+
+def is_expanded(context, name):
+    """
+    Return True if `name` was requested via `?expand=` in the serializer context.
+    """
+    return name in get_expand_fields(context.get("request"))
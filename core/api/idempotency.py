@@ -0,0 +1,184 @@
+"""
+`Idempotency-Key` support for create endpoints.
+
+A client that retries a POST sends the same `Idempotency-Key` header with
+every attempt. The first attempt claims the key (one row per user, endpoint
+and key; the unique constraint lets only one of several parallel attempts
+win) and stores its response. Later attempts with the same key get that
+response replayed (`Idempotent-Replayed: true`) without running the view
+again.
+
+- the same key with a different request body: 422
+- the same key while the first attempt is still running: 409; an attempt
+  that did not finish within `IDEMPOTENCY_LOCK_TIMEOUT` seconds (e.g. its
+  worker was killed) loses its claim to the next retry, and if it still
+  finishes later its transaction is rolled back
+- failed attempts (non-2xx) release the key, so the client may retry
+- keys expire after `IDEMPOTENCY_KEY_TTL` seconds
+"""
+
+import functools
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.models import IdempotencyKey
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+def get_key_ttl():
+    return timedelta(seconds=getattr(settings, "IDEMPOTENCY_KEY_TTL", 86400))
+
+
+def get_lock_timeout():
+    return timedelta(seconds=getattr(settings, "IDEMPOTENCY_LOCK_TIMEOUT", 60))
+
+
+class ClaimLost(Exception):
+    """
+    The claim of a running attempt was taken over by a retry.
+    """
+
+
+def request_fingerprint(request):
+    """
+    Hash of method, path and body; uploaded files count by name.
+    """
+    data = request.data
+    if hasattr(data, "getlist"):
+        data = {key: data.getlist(key) for key in data}
+
+    payload = json.dumps(
+        [request.method, request.path, data], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def take_over(record):
+    """
+    Move the lapsed claim of an unfinished attempt to the current one; only
+    one of several parallel retries wins. Returns True if this one won.
+    """
+    locked_until = timezone.now() + get_lock_timeout()
+    won = IdempotencyKey.objects.filter(
+        pk=record.pk, status_code__isnull=True, locked_until=record.locked_until
+    ).update(locked_until=locked_until)
+    record.locked_until = locked_until
+    return bool(won)
+
+
+def claim_key(user, scope, key, request_hash):
+    """
+    Return (record, created). Known keys cost one read; an expired row of the
+    same key is replaced and a lapsed in-flight claim is taken over. `record`
+    is None if a parallel attempt removed the row it lost against.
+    """
+    lookup = {"user": user, "scope": scope, "key": key}
+    record = IdempotencyKey.objects.filter(**lookup).first()
+    if record is not None:
+        now = timezone.now()
+        if record.expires_at <= now:
+            record.delete()
+        elif (
+            record.status_code is None
+            and record.request_hash == request_hash
+            and (record.locked_until is None or record.locked_until <= now)
+        ):
+            return record, take_over(record)
+        else:
+            return record, False
+
+    try:
+        with transaction.atomic():
+            now = timezone.now()
+            record = IdempotencyKey.objects.create(
+                **lookup,
+                request_hash=request_hash,
+                expires_at=now + get_key_ttl(),
+                locked_until=now + get_lock_timeout(),
+            )
+        return record, True
+    except IntegrityError:
+        return IdempotencyKey.objects.filter(**lookup).first(), False
+
+
+def release(record):
+    """
+    Delete the claim unless a retry has taken it over.
+    """
+    IdempotencyKey.objects.filter(pk=record.pk, locked_until=record.locked_until).delete()
+
+
+def replay(record, request_hash):
+    if record is not None and record.request_hash != request_hash:
+        return Response(
+            {"detail": f"{IDEMPOTENCY_HEADER} was already used for a different request."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    if record is None or record.status_code is None:
+        return Response(
+            {"detail": f"A request with this {IDEMPOTENCY_HEADER} is still being processed."},
+            status=status.HTTP_409_CONFLICT,
+        )
+    return Response(
+        record.response_body, status=record.status_code, headers={REPLAYED_HEADER: "true"}
+    )
+
+
+def idempotent(scope):
+    """
+    Decorate a viewset `create` so that it honors the `Idempotency-Key` header.
+
+    Requests without the header are handled as before. The view and the
+    stored response are committed together.
+    """
+
+    def decorator(view_method):
+        @functools.wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key = request.headers.get(IDEMPOTENCY_HEADER)
+            if key is None or not request.user.is_authenticated:
+                return view_method(self, request, *args, **kwargs)
+
+            if not key or len(key) > MAX_KEY_LENGTH:
+                return Response(
+                    {"detail": f"{IDEMPOTENCY_HEADER} must be 1 to {MAX_KEY_LENGTH} characters."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            request_hash = request_fingerprint(request)
+            record, created = claim_key(request.user, scope, key, request_hash)
+            if not created:
+                return replay(record, request_hash)
+
+            try:
+                with transaction.atomic():
+                    response = view_method(self, request, *args, **kwargs)
+                    if not status.is_success(response.status_code):
+                        release(record)
+                        return response
+
+                    stored = IdempotencyKey.objects.filter(
+                        pk=record.pk, locked_until=record.locked_until
+                    ).update(status_code=response.status_code, response_body=response.data)
+                    if not stored:
+                        raise ClaimLost()
+            except ClaimLost:
+                return replay(None, request_hash)
+            except Exception:
+                release(record)
+                raise
+            return response
+
+        return wrapper
+
+    return decorator
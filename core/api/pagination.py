@@ -0,0 +1,246 @@
+"""
+Shared keyset (cursor) pagination.
+
+A cursor encodes the sort key values of the row at the edge of a page plus its
+id. The neighbouring page is then read as a range, e.g.
+`WHERE (updated_at, id) < (:last_updated_at, :last_id) ORDER BY ... LIMIT n`,
+so deep pages cost the same as the first one and no COUNT(*) is needed.
+
+Query params:
+- cursor: opaque token from a previous `next`/`previous` link
+- page_size: int (bounded by max_page_size)
+"""
+
+import base64
+import binascii
+import datetime
+import decimal
+import json
+import uuid
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _json_default(value):
+    # Full precision on purpose: DjangoJSONEncoder truncates datetimes to
+    # milliseconds, which would skip or repeat rows at page boundaries.
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor.")
+
+
+def encode_cursor(values, reverse=False):
+    """
+    Encode sort key values (+ direction) into an opaque, URL-safe token.
+    """
+    payload = json.dumps({"v": values, "r": reverse}, default=_json_default)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """
+    Decode a token created by `encode_cursor`.
+
+    Returns:
+        tuple[list, bool]: (sort key values, reverse)
+
+    Raises:
+        NotFound: if the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return list(payload["v"]), bool(payload.get("r", False))
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise NotFound("Invalid cursor.")
+
+
+def resolve_field(model, path):
+    """
+    Return the model field for an ordering path (may span relations with "__").
+    """
+    *relations, name = path.split("__")
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    return model._meta.pk if name == "pk" else model._meta.get_field(name)
+
+
+def cursor_values(model, ordering, values):
+    """
+    Convert decoded cursor values with the ordering fields' `to_python()`.
+
+    Raises:
+        NotFound: if a value does not fit its field (tampered token)
+    """
+    try:
+        converted = [
+            resolve_field(model, term.lstrip("-")).to_python(value)
+            for term, value in zip(ordering, values)
+        ]
+    except (DjangoValidationError, TypeError, ValueError):
+        raise NotFound("Invalid cursor.")
+    if any(value is None for value in converted):
+        raise NotFound("Invalid cursor.")
+    return converted
+
+
+def keyset_filter(ordering, values):
+    """
+    Build a Q selecting rows strictly after `values` in `ordering`.
+
+    Args:
+        ordering: e.g. ["-updated_at", "-id"]
+        values: sort key values of the last row, same length as ordering
+
+    Example:
+        ["-updated_at", "-id"], [t, 5] ->
+        Q(updated_at__lt=t) | Q(updated_at=t, id__lt=5)
+    """
+    condition = Q()
+    for index, term in enumerate(ordering):
+        field = term.lstrip("-")
+        lookup = "lt" if term.startswith("-") else "gt"
+
+        step = Q(**{f"{field}__{lookup}": values[index]})
+        for prev_term, prev_value in zip(ordering[:index], values):
+            step &= Q(**{prev_term.lstrip("-"): prev_value})
+        condition |= step
+    return condition
+
+
+def reverse_ordering(ordering):
+    return [term[1:] if term.startswith("-") else f"-{term}" for term in ordering]
+
+
+def row_value(row, field):
+    """
+    Read `field` (may span relations with "__") from a model instance or dict row.
+    """
+    if isinstance(row, dict):
+        return row[field]
+    for attr in field.split("__"):
+        row = getattr(row, attr)
+    return row
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over an ordering with a unique `id` tie-breaker.
+
+    The ordering is taken from the queryset (e.g. as set by OrderingFilter);
+    every term must be listed in `ordering_fields`. `id` is appended
+    (in the direction of the first term) unless already present.
+
+    With `opt_in = True` the list stays unpaginated (a plain array) unless
+    the request sends `cursor` (empty for the first page) or `page_size`.
+
+    Response shape:
+        {"next": url|null, "previous": url|null, "results": [...]}
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 6
+    page_size_query_param = "page_size"
+    max_page_size = None
+    ordering_fields = ()
+    default_ordering = ("-id",)
+    opt_in = False
+
+    invalid_ordering_message = "Cursor pagination does not support this ordering."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        requested = self.cursor_query_param in params or self.page_size_query_param in params
+        if self.opt_in and not requested:
+            return None
+
+        self.view = view
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+
+        token = request.query_params.get(self.cursor_query_param)
+        values, self.reverse = decode_cursor(token) if token else (None, False)
+        if values is not None:
+            if len(values) != len(self.ordering):
+                raise NotFound("Invalid cursor.")
+            values = cursor_values(queryset.model, self.ordering, values)
+
+        ordering = reverse_ordering(self.ordering) if self.reverse else self.ordering
+        if values is not None:
+            queryset = queryset.filter(keyset_filter(ordering, values))
+
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+
+        self.rows = rows
+        return rows
+
+    def get_page_size(self, request):
+        """
+        Same rules as PageNumberPagination: positive ints only, capped by max_page_size.
+        """
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, TypeError, ValueError):
+            return self.page_size
+
+        if size <= 0:
+            return self.page_size
+        if self.max_page_size:
+            return min(size, self.max_page_size)
+        return size
+
+    def get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by) or list(self.default_ordering)
+        if not any(term.lstrip("-") in ("id", "pk") for term in ordering):
+            ordering.append("-id" if ordering[0].startswith("-") else "id")
+
+        allowed = set(self.ordering_fields) | {"id", "pk"}
+        if any(not isinstance(term, str) or term.lstrip("-") not in allowed for term in ordering):
+            raise ValidationError({self.cursor_query_param: [self.invalid_ordering_message]})
+        return ordering
+
+    def get_cursor_link(self, row, reverse):
+        if row is None:
+            return None
+        values = [row_value(row, term.lstrip("-")) for term in self.ordering]
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, encode_cursor(values, reverse)
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.rows:
+            return None
+        return self.get_cursor_link(self.rows[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.rows:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.get_cursor_link(self.rows[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
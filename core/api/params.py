@@ -0,0 +1,34 @@
+"""
+Parsing helpers for query parameters shared by several endpoints.
+"""
+
+from rest_framework.exceptions import ValidationError
+
+
+def parse_id_list(query_params, name, max_ids):
+    """
+    Parse ids from a repeatable and/or comma separated query param,
+    e.g. `?user_id=1,2&user_id=3`.
+
+    Returns:
+        list[int]: the ids in request order, duplicates dropped
+
+    Raises:
+        ValidationError: (keyed by `name`) for a non-integer part, no ids or
+        more than `max_ids` ids
+    """
+    ids = []
+    for value in query_params.getlist(name):
+        for part in value.split(","):
+            try:
+                pk = int(part)
+            except ValueError:
+                raise ValidationError({name: f"'{part}' is not a valid id."})
+            if pk not in ids:
+                ids.append(pk)
+
+    if not ids:
+        raise ValidationError({name: "At least one id is required."})
+    if len(ids) > max_ids:
+        raise ValidationError({name: f"At most {max_ids} ids are allowed."})
+    return ids
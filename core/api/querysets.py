@@ -0,0 +1,89 @@
+"""
+Read several querysets of one model as a single ordered sequence.
+
+Instead of `WHERE a = :x OR b = :x ORDER BY ...`, which cannot use the
+per-column indexes, each part (`WHERE a = :x ...`, `WHERE b = :x ...`) runs
+as its own index-backed query and the already sorted results are merged in
+Python. Slices are pushed down to every part, so a page of n rows reads at
+most n rows per part.
+"""
+
+import heapq
+
+from .pagination import row_value
+
+
+def sort_rows(rows, ordering):
+    """
+    Sort rows in place by ordering terms with mixed directions (stable sorts,
+    last term first).
+    """
+    for term in reversed(ordering):
+        field = term.lstrip("-")
+        rows.sort(key=lambda row: row_value(row, field), reverse=term.startswith("-"))
+    return rows
+
+
+class MergedQuerySet:
+    """
+    Ordered, de-duplicated (by pk) union of querysets over the same model.
+
+    Supports what the list views, filter backends and KeysetPagination use:
+    filter(), order_by(), slicing/iteration, `model` and `query.order_by`.
+    """
+
+    def __init__(self, querysets):
+        self.querysets = list(querysets)
+        self.model = self.querysets[0].model
+
+    @property
+    def query(self):
+        return self.querysets[0].query
+
+    @property
+    def ordering(self):
+        return [term for term in self.query.order_by if isinstance(term, str)]
+
+    def _chain(self, method, *args, **kwargs):
+        return MergedQuerySet(getattr(qs, method)(*args, **kwargs) for qs in self.querysets)
+
+    def filter(self, *args, **kwargs):
+        return self._chain("filter", *args, **kwargs)
+
+    def order_by(self, *ordering):
+        return self._chain("order_by", *ordering)
+
+    def __getitem__(self, k):
+        if not isinstance(k, slice) or k.step is not None or (k.start or 0) < 0:
+            raise TypeError("MergedQuerySet only supports forward slices.")
+
+        start, stop = k.start or 0, k.stop
+        parts = [list(qs[:stop]) for qs in self.querysets]
+        rows = self.merge(parts)
+        return rows[start:stop]
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __len__(self):
+        return len(self[:])
+
+    def merge(self, parts):
+        ordering = self.ordering
+        directions = {term.startswith("-") for term in ordering}
+
+        if len(directions) == 1:
+            def key(row):
+                return tuple(row_value(row, term.lstrip("-")) for term in ordering)
+
+            merged = heapq.merge(*parts, key=key, reverse=directions.pop())
+        else:
+            merged = sort_rows([row for part in parts for row in part], ordering)
+
+        seen = set()
+        rows = []
+        for row in merged:
+            if row.pk not in seen:
+                seen.add(row.pk)
+                rows.append(row)
+        return rows
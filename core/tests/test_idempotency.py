@@ -0,0 +1,239 @@
+import threading
+import time
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from core.models import IdempotencyKey
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.serializers import OrderCreateSerializer
+from orders_app.models import Order
+from profiles_app.models import Profile
+
+OFFER_PAYLOAD = {
+    "title": "Logo",
+    "image": None,
+    "description": "Desc",
+    "details": [
+        {
+            "title": title,
+            "revisions": index + 1,
+            "delivery_time_in_days": 5 + index,
+            "price": 100 * (index + 1),
+            "features": ["X"],
+            "offer_type": offer_type,
+        }
+        for index, (title, offer_type) in enumerate(
+            [("Basic", "basic"), ("Standard", "standard"), ("Premium", "premium")]
+        )
+    ],
+}
+
+
+def create_offer_detail(business):
+    offer = Offer.objects.create(user=business, title="Logo", description="desc")
+    return OfferDetail.objects.create(
+        offer=offer, title="Logo Design", revisions=3, delivery_time_in_days=5,
+        price="150.00", features=[], offer_type="basic",
+    )
+
+
+class IdempotencyKeyTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.detail = create_offer_detail(self.business)
+
+    def post_order(self, key, offer_detail_id=None):
+        self.client.force_authenticate(user=self.customer)
+        return self.client.post(
+            reverse("orders-list"),
+            {"offer_detail_id": offer_detail_id or self.detail.id},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_order_retry_replays_the_first_response(self):
+        first = self.post_order("order-1")
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("Idempotent-Replayed", first)
+
+        with mock.patch.object(OrderCreateSerializer, "create") as create:
+            with self.assertNumQueries(1):
+                retry = self.post_order("order-1")
+        create.assert_not_called()
+
+        self.assertEqual(retry.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(Order.objects.count(), 1)
+
+        self.post_order("order-2")
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_offer_retry_creates_one_offer_with_three_details(self):
+        self.client.force_authenticate(user=self.business)
+        responses = [
+            self.client.post(
+                reverse("offers-list"), OFFER_PAYLOAD, format="json", HTTP_IDEMPOTENCY_KEY="offer-1"
+            )
+            for _ in range(3)
+        ]
+
+        self.assertEqual({response.status_code for response in responses}, {status.HTTP_201_CREATED})
+        self.assertEqual(len({response.json()["id"] for response in responses}), 1)
+        self.assertEqual(Offer.objects.filter(title="Logo", user=self.business).count(), 2)
+        self.assertEqual(OfferDetail.objects.count(), 1 + 3)
+
+    def test_reusing_a_key_for_another_request_returns_422(self):
+        self.post_order("order-1")
+        other = create_offer_detail(self.business)
+
+        response = self.post_order("order-1", offer_detail_id=other.id)
+
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_keys_are_scoped_per_user(self):
+        self.post_order("shared")
+        other = User.objects.create_user(username="cust2", password="pw123456")
+        Profile.objects.create(user=other, type="customer")
+
+        self.client.force_authenticate(user=other)
+        response = self.client.post(
+            reverse("orders-list"), {"offer_detail_id": self.detail.id},
+            format="json", HTTP_IDEMPOTENCY_KEY="shared",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Order.objects.count(), 2)
+
+    def test_failed_requests_release_the_key(self):
+        response = self.post_order("order-1", offer_detail_id=999999)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+        response = self.post_order("order-1")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def create_in_flight_key(self, locked_until):
+        return IdempotencyKey.objects.create(
+            user=self.customer, scope="orders:create", key="order-1",
+            request_hash="",
+            expires_at=timezone.now() + timedelta(hours=1),
+            locked_until=locked_until,
+        )
+
+    def test_in_flight_key_returns_409(self):
+        self.create_in_flight_key(timezone.now() + timedelta(seconds=30))
+        with mock.patch("core.api.idempotency.request_fingerprint", return_value=""):
+            response = self.post_order("order-1")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Order.objects.exists())
+
+    def test_retry_takes_over_a_lapsed_claim(self):
+        # The worker of the first attempt died without finishing or releasing it.
+        self.create_in_flight_key(timezone.now() - timedelta(seconds=1))
+        with mock.patch("core.api.idempotency.request_fingerprint", return_value=""):
+            response = self.post_order("order-1")
+            replayed = self.post_order("order-1")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(replayed["Idempotent-Replayed"], "true")
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_attempt_that_lost_its_claim_is_rolled_back(self):
+        def finish_after_takeover(serializer, validated_data):
+            # A retry takes the key over while this attempt is still running.
+            IdempotencyKey.objects.update(locked_until=timezone.now() + timedelta(minutes=5))
+            return original_create(serializer, validated_data)
+
+        original_create = OrderCreateSerializer.create
+        with mock.patch.object(OrderCreateSerializer, "create", finish_after_takeover):
+            response = self.post_order("order-1")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Order.objects.exists())
+        self.assertIsNone(IdempotencyKey.objects.get().status_code)
+
+    def test_expired_keys_run_again_and_are_purged(self):
+        self.post_order("order-1")
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        response = self.post_order("order-1")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertNotIn("Idempotent-Replayed", response)
+        self.assertEqual(Order.objects.count(), 2)
+
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        out = StringIO()
+        call_command("purge_idempotency_keys", stdout=out)
+        self.assertFalse(IdempotencyKey.objects.exists())
+        self.assertIn("Deleted 1 expired idempotency key(s).", out.getvalue())
+
+
+class IdempotencyConcurrencyTests(TransactionTestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.detail = create_offer_detail(self.business)
+
+    def test_parallel_duplicates_create_exactly_one_order(self):
+        attempts = 5
+        barrier = threading.Barrier(attempts)
+        responses = []
+        original_create = OrderCreateSerializer.create
+
+        def slow_create(serializer, validated_data):
+            # Keep the winner in flight while the other attempts arrive.
+            time.sleep(0.2)
+            return original_create(serializer, validated_data)
+
+        def attempt():
+            client = APIClient()
+            client.force_authenticate(user=self.customer)
+            barrier.wait()
+            try:
+                responses.append(
+                    client.post(
+                        reverse("orders-list"), {"offer_detail_id": self.detail.id},
+                        format="json", HTTP_IDEMPOTENCY_KEY="order-1",
+                    )
+                )
+            finally:
+                connection.close()
+
+        with mock.patch.object(OrderCreateSerializer, "create", slow_create):
+            threads = [threading.Thread(target=attempt) for _ in range(attempts)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        codes = sorted(response.status_code for response in responses)
+        self.assertEqual(codes, [status.HTTP_201_CREATED] + [status.HTTP_409_CONFLICT] * (attempts - 1))
+        self.assertEqual(Order.objects.count(), 1)
+
+        client = APIClient()
+        client.force_authenticate(user=self.customer)
+        replay = client.post(
+            reverse("orders-list"), {"offer_detail_id": self.detail.id},
+            format="json", HTTP_IDEMPOTENCY_KEY="order-1",
+        )
+        self.assertEqual(replay.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(replay["Idempotent-Replayed"], "true")
+        self.assertEqual(Order.objects.count(), 1)
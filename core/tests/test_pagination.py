@@ -0,0 +1,43 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from core.api.pagination import encode_cursor
+from profiles_app.models import Profile
+
+
+class TamperedCursorTests(TestCase):
+    """
+    Well-formed tokens carrying values that do not fit the ordering fields
+    must be rejected like malformed ones, not reach the database.
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        user = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=user, type="customer")
+        self.user = user
+
+    def assert_invalid_cursor(self, url, values, **params):
+        response = self.client.get(url, {"cursor": encode_cursor(values), **params})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, (url, values))
+        self.assertEqual(response.data["detail"], "Invalid cursor.")
+
+    def test_public_offers_list(self):
+        for values in (["abc", 1], [[1], {"a": 1}], [None, 1], ["2024-01-01T00:00:00Z", "x"]):
+            self.assert_invalid_cursor("/api/offers/", values)
+        self.assert_invalid_cursor("/api/offers/", ["cheap", 1], ordering="min_price")
+
+    def test_authenticated_lists(self):
+        self.client.force_authenticate(user=self.user)
+        for url in ("/api/orders/", "/api/reviews/"):
+            self.assert_invalid_cursor(url, ["abc", 1])
+            self.assert_invalid_cursor(url, [[1], {"a": 1}])
+        self.assert_invalid_cursor("/api/reviews/", ["five", 1], ordering="rating")
+
+    def test_valid_values_still_page(self):
+        response = self.client.get(
+            "/api/offers/", {"cursor": encode_cursor(["2024-01-01T00:00:00+00:00", 1])}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
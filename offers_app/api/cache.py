@@ -0,0 +1,115 @@
+"""
+Versioned response cache for the public offers list (and its facets).
+
+Cache keys embed a global "offers version". Every Offer/OfferDetail write
+(and user name changes shown in `user_details`) bumps the version via
+offers_app.signals, so stale entries are never read again and simply expire.
+
+Settings:
+- CACHES["default"]: backend used for entries, version and counters
+- OFFERS_LIST_CACHE_TIMEOUT: seconds; 0 disables the cache
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = "offers:version"
+HITS_KEY = "offers:list:hits"
+MISSES_KEY = "offers:list:misses"
+
+# Only these params influence the list response; anything else is ignored so
+# junk params cannot be used to bypass the cache.
+CACHED_QUERY_PARAMS = (
+    "count",
+    "creator_id",
+    "cursor",
+    "expand",
+    "feature",
+    "feature_tier",
+    "max_delivery_time",
+    "min_price",
+    "ordering",
+    "page",
+    "page_size",
+    "search",
+)
+
+
+def get_cache_timeout():
+    return getattr(settings, "OFFERS_LIST_CACHE_TIMEOUT", 300)
+
+
+def _incr(key, start):
+    """
+    Increment a counter, (re)creating it if missing or evicted.
+    """
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, start, timeout=None)
+        return cache.incr(key)
+
+
+def get_offers_version():
+    """
+    Return the current offers version.
+
+    A missing/evicted version is re-seeded from the clock so it can never fall
+    back to a value whose cache entries still exist.
+    """
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_offers_version():
+    """
+    Invalidate every cached offers response.
+    """
+    return _incr(VERSION_KEY, time.time_ns())
+
+
+def build_cache_key(request, prefix="offers:list", query_params=CACHED_QUERY_PARAMS):
+    """
+    Build a cache key from the host, the current version and the normalized
+    query string (whitelisted `query_params`, sorted, page=1 dropped).
+    """
+    params = []
+    for name in query_params:
+        values = sorted(v.strip() for v in request.query_params.getlist(name))
+        if name == "page" and values == ["1"]:
+            continue
+        if values:
+            params.append((name, values))
+
+    raw = repr((request.get_host(), request.is_secure(), params))
+    digest = hashlib.sha256(raw.encode()).hexdigest()
+    return f"{prefix}:{get_offers_version()}:{digest}"
+
+
+def record_hit():
+    _incr(HITS_KEY, 0)
+
+
+def record_miss():
+    _incr(MISSES_KEY, 0)
+
+
+def get_cache_stats():
+    """
+    Return hit/miss counters and the current version.
+    """
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else 0.0,
+        "version": get_offers_version(),
+    }
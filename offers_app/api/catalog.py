@@ -0,0 +1,84 @@
+"""
+Serve the offers list from the in-memory catalog (offers_app.catalog).
+
+The catalog filters, orders and pages the offer ids; only the rows of the
+requested page are fetched from the database by primary key and rendered as
+usual (fast path rows or OfferListSerializer instances).
+
+Requests the catalog cannot answer fall back to the regular queryset path:
+- `search` (needs the FTS index)
+- `cursor` pagination (keyset conditions run in SQL)
+- orderings other than a single updated_at/min_price term
+- invalid filter values (reported as 400 by the regular path)
+- `feature` (answered by the OfferFeature index)
+"""
+
+from rest_framework.settings import api_settings
+
+from offers_app.catalog import ORDERING_FIELDS, catalog_enabled, offer_catalog
+from .filters import OfferOrderingFilter
+
+
+class CatalogRows:
+    """
+    Sequence over catalog-selected ids; each slice fetches its rows from
+    `queryset` by primary key, in catalog order.
+
+    Pagination classes only take len() and slices, so they work on it
+    unchanged.
+    """
+
+    def __init__(self, ids, queryset):
+        self.ids = ids
+        self.queryset = queryset
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, k):
+        if not isinstance(k, slice):
+            return self[k:k + 1][0]
+
+        pks = self.ids[k].tolist()
+        rows = {
+            row["id"] if isinstance(row, dict) else row.pk: row
+            for row in self.queryset.filter(pk__in=pks)
+        }
+        # Offers deleted since the catalog was synced are skipped.
+        return [rows[pk] for pk in pks if pk in rows]
+
+
+def catalog_rows(view, request, queryset):
+    """
+    Return CatalogRows for the list request, or None if the catalog is
+    disabled or cannot answer it.
+
+    `queryset` (unfiltered) is used to fetch the page rows.
+    """
+    if not catalog_enabled():
+        return None
+
+    params = request.query_params
+    cursor_param = view.paginator.cursor_class.cursor_query_param
+    if params.get(api_settings.SEARCH_PARAM) or cursor_param in params:
+        return None
+
+    filterset = view.filterset_class(params, queryset=queryset, request=request)
+    if not filterset.is_valid():
+        return None
+
+    ordering = OfferOrderingFilter().get_ordering(request, queryset, view)
+    if len(ordering) != 1 or ordering[0].lstrip("-") not in ORDERING_FIELDS:
+        return None
+
+    filters = filterset.form.cleaned_data
+    if filters.get("feature"):
+        return None
+
+    ids = offer_catalog.select(
+        ordering[0],
+        creator_id=filters.get("creator_id"),
+        min_price=filters.get("min_price"),
+        max_delivery_time=filters.get("max_delivery_time"),
+    )
+    return CatalogRows(ids, queryset)
@@ -0,0 +1,75 @@
+"""
+Facet counts for the offers search page sidebar.
+
+All facets come from one grouped aggregate query over the filtered offers:
+GROUP BY creator with one conditional COUNT per price and delivery-time
+bucket. Bucket totals are summed from the per-creator rows.
+
+Buckets are half-open ranges [from, to) on the stored min_price and
+min_delivery_time (days) columns; a null bound is open-ended.
+"""
+
+from django.db.models import Count, Q
+
+PRICE_BUCKETS = [(None, 50), (50, 100), (100, 250), (250, 500), (500, 1000), (1000, None)]
+DELIVERY_TIME_BUCKETS = [(None, 2), (2, 4), (4, 8), (8, 15), (15, None)]
+
+FACETS = {
+    "price": ("min_price", PRICE_BUCKETS),
+    "delivery_time": ("min_delivery_time", DELIVERY_TIME_BUCKETS),
+}
+
+# Only the params that change the filtered offers are part of the cache key.
+FACET_QUERY_PARAMS = (
+    "creator_id",
+    "feature",
+    "feature_tier",
+    "max_delivery_time",
+    "min_price",
+    "search",
+)
+
+
+def bucket_filter(field, low, high):
+    condition = Q()
+    if low is not None:
+        condition &= Q(**{f"{field}__gte": low})
+    if high is not None:
+        condition &= Q(**{f"{field}__lt": high})
+    return condition
+
+
+def compute_facets(queryset):
+    """
+    Return total, price/delivery-time bucket counts and per-creator counts
+    (most offers first) for a filtered Offer queryset.
+    """
+    aggregates = {"total": Count("id")}
+    for name, (field, buckets) in FACETS.items():
+        for index, (low, high) in enumerate(buckets):
+            aggregates[f"{name}_{index}"] = Count("id", filter=bucket_filter(field, low, high))
+
+    rows = list(
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .order_by()
+        .values("user_id", "user__username")
+        .annotate(**aggregates)
+        .order_by("-total", "user_id")
+    )
+
+    facets = {"count": sum(row["total"] for row in rows)}
+    for name, (field, buckets) in FACETS.items():
+        facets[name] = [
+            {
+                "from": low,
+                "to": high,
+                "count": sum(row[f"{name}_{index}"] for row in rows),
+            }
+            for index, (low, high) in enumerate(buckets)
+        ]
+    facets["creators"] = [
+        {"creator_id": row["user_id"], "username": row["user__username"], "count": row["total"]}
+        for row in rows
+    ]
+    return facets
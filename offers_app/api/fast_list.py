@@ -0,0 +1,148 @@
+"""
+Single-query fast path for the offers list.
+
+Instead of one page query + one `details` prefetch query + Offer/User/
+OfferDetail instances + SerializerMethodField calls per row, the database
+builds each row's `details` links and `user_details` with JSON functions
+(json_group_array/json_object on SQLite) in correlated subqueries. The view paginates a `.values()`
+queryset and hands plain dicts to the renderer.
+
+Counting, filtering and ordering run on the plain offers query; only the
+sliced page is wrapped as `WHERE id IN (<page>)` and gets the JSON columns,
+so SQLite never builds JSON for rows that are sorted or paged away.
+
+The output is identical to OfferListSerializer: scalar values are formatted
+by the serializer's own field instances.
+
+Settings:
+- OFFERS_LIST_FAST_PATH: bool, enables the fast path (SQLite only)
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.db.models import JSONField, QuerySet
+from django.db.models.expressions import RawSQL
+
+from core.api.expand import get_expand_fields
+from offers_app.models import Offer, OfferDetail
+from .serializers import OfferListSerializer
+
+SUPPORTED_VENDORS = {"sqlite"}
+
+VALUE_FIELDS = [
+    "id",
+    "user_id",
+    "title",
+    "image",
+    "image_small",
+    "description",
+    "created_at",
+    "updated_at",
+    "min_price",
+    "min_delivery_time",
+]
+
+# Written as SQL once instead of ORM expressions (JSONObject, Concat, ...):
+# resolving and compiling those on every request cost more than the query.
+OFFER_TABLE = Offer._meta.db_table
+
+DETAIL_LINKS_SQL = f"""(
+    SELECT JSON_GROUP_ARRAY(JSON_OBJECT('id', d.id, 'url', '/offerdetails/' || d.id || '/'))
+    FROM {OfferDetail._meta.db_table} d
+    WHERE d.offer_id = {OFFER_TABLE}.id
+)"""
+
+USER_JSON_SQL = f"""(
+    SELECT JSON_OBJECT(
+        'first_name', COALESCE(u.first_name, ''),
+        'last_name', COALESCE(u.last_name, ''),
+        'username', u.username
+    )
+    FROM {get_user_model()._meta.db_table} u
+    WHERE u.id = {OFFER_TABLE}.user_id
+)"""
+
+
+def fast_path_enabled(queryset, request):
+    """
+    The fast path only renders detail links; `?expand=details` uses the serializer.
+    """
+    return (
+        getattr(settings, "OFFERS_LIST_FAST_PATH", True)
+        and connections[queryset.db].vendor in SUPPORTED_VENDORS
+        and "details" not in get_expand_fields(request)
+    )
+
+
+def as_list_rows(queryset):
+    """
+    Turn a (filtered, ordered) Offer queryset into a `.values()` queryset whose
+    rows carry the details links (`detail_links`) and user fields (`user_json`)
+    as JSON built in SQL.
+    """
+    return (
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .values(*VALUE_FIELDS)
+        .annotate(
+            detail_links=RawSQL(DETAIL_LINKS_SQL, [], output_field=JSONField()),
+            user_json=RawSQL(USER_JSON_SQL, [], output_field=JSONField()),
+        )
+    )
+
+
+class OfferRowQuerySet(QuerySet):
+    """
+    Offer queryset whose slices evaluate to `as_list_rows` dicts.
+
+    Pagination classes only count, filter, order and slice, so they work on
+    it unchanged while each page still costs a single query.
+    """
+
+    def __getitem__(self, k):
+        if not isinstance(k, slice):
+            return super().__getitem__(k)
+
+        offers = QuerySet(model=self.model, query=self.query.chain(), using=self._db)
+        return as_list_rows(offers.filter(pk__in=offers.values("pk")[k]))
+
+
+def list_rows(queryset):
+    """
+    Wrap a filtered, ordered Offer queryset as an OfferRowQuerySet.
+    """
+    return OfferRowQuerySet(model=queryset.model, query=queryset.query.chain(), using=queryset.db)
+
+
+class OfferRowRenderer:
+    """
+    Convert `as_list_rows` rows into OfferListSerializer-shaped dicts.
+    """
+
+    def __init__(self, request):
+        self.fields = OfferListSerializer(context={"request": request}).fields
+        self.image_field = Offer._meta.get_field("image")
+
+    def image(self, name):
+        if not name:
+            return None
+        return self.fields["image"].file_url(
+            self.image_field.attr_class(None, self.image_field, name)
+        )
+
+    def __call__(self, row):
+        fields = self.fields
+        return {
+            "id": row["id"],
+            "user": row["user_id"],
+            "title": row["title"],
+            "image": self.image(row["image_small"] or row["image"]),
+            "description": row["description"],
+            "created_at": fields["created_at"].to_representation(row["created_at"]),
+            "updated_at": fields["updated_at"].to_representation(row["updated_at"]),
+            "details": row["detail_links"] or [],
+            "min_price": fields["min_price"].to_representation(row["min_price"]),
+            "min_delivery_time": row["min_delivery_time"],
+            "user_details": row["user_json"],
+        }
@@ -0,0 +1,53 @@
+"""
+Top features of all offers, computed from the OfferFeature index.
+
+Query params:
+- offer_type: basic|standard|premium (only count features of that tier)
+- limit: int, number of features (default 10, max 50)
+"""
+
+from django.db.models import Count, Min
+from rest_framework.exceptions import ValidationError
+
+from offers_app.models import OfferDetail, OfferFeature
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+
+TOP_FEATURES_QUERY_PARAMS = ("limit", "offer_type")
+
+
+def parse_top_features_params(query_params):
+    """
+    Validate the query params; returns (offer_type or None, limit).
+    """
+    offer_type = query_params.get("offer_type") or None
+    if offer_type is not None and offer_type not in dict(OfferDetail.OFFER_TYPE_CHOICES):
+        raise ValidationError({"offer_type": "Must be one of basic, standard, premium."})
+
+    try:
+        limit = int(query_params.get("limit", DEFAULT_LIMIT))
+    except ValueError:
+        raise ValidationError({"limit": "A valid integer is required."})
+    if limit < 1:
+        raise ValidationError({"limit": "Must be at least 1."})
+    return offer_type, min(limit, MAX_LIMIT)
+
+
+def compute_top_features(offer_type=None, limit=DEFAULT_LIMIT):
+    """
+    Return the features listed by the most offers (most first).
+
+    Spellings are grouped by the normalized key; `feature` is one of the
+    entered spellings.
+    """
+    features = OfferFeature.objects.all()
+    if offer_type:
+        features = features.filter(offer_type=offer_type)
+
+    rows = (
+        features.values("key")
+        .annotate(feature=Min("name"), offers=Count("offer", distinct=True))
+        .order_by("-offers", "key")[:limit]
+    )
+    return [{"feature": row["feature"], "offers": row["offers"]} for row in rows]
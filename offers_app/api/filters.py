@@ -1,11 +1,17 @@
 """
-django-filter FilterSet for the offers list endpoint.
-Supports filtering by creator, minimum price, and maximum delivery time.
+Filter backends for the offers list endpoint:
+- OfferFilter: django-filter FilterSet (creator, minimum price, maximum delivery time,
+  feature via the OfferFeature index)
+- OfferSearchFilter: `search=` backed by the SQLite FTS5 index
+- OfferOrderingFilter: OrderingFilter that understands the `rank` relevance ordering
 """
 
 import django_filters
+from django.db.models import F
+from rest_framework.filters import OrderingFilter, SearchFilter
 
-from offers_app.models import Offer
+from offers_app.models import Offer, OfferDetail, OfferFeature, normalize_feature
+from offers_app.search import build_match_query, search_index_available
 
 
 class OfferFilter(django_filters.FilterSet):
@@ -14,8 +20,10 @@ class OfferFilter(django_filters.FilterSet):
 
     Query params:
         - creator_id: int (maps to Offer.user_id)
-        - min_price: decimal (gte on annotated/field min_price)
-        - max_delivery_time: int (lte on annotated/field min_delivery_time)
+        - min_price: decimal (gte on the indexed Offer.min_price column)
+        - max_delivery_time: int (lte on the indexed Offer.min_delivery_time column)
+        - feature: str (some detail lists the feature, case-insensitive)
+        - feature_tier: basic|standard|premium (restricts `feature` to that detail)
     """
 
     creator_id = django_filters.NumberFilter(field_name="user_id")
@@ -23,7 +31,73 @@ class OfferFilter(django_filters.FilterSet):
     max_delivery_time = django_filters.NumberFilter(
         field_name="min_delivery_time", lookup_expr="lte"
     )
+    feature = django_filters.CharFilter(method="filter_feature")
+    feature_tier = django_filters.ChoiceFilter(
+        choices=OfferDetail.OFFER_TYPE_CHOICES, method="filter_feature_tier"
+    )
 
     class Meta:
         model = Offer
-        fields = ["creator_id", "min_price", "max_delivery_time"]
+        fields = ["creator_id", "min_price", "max_delivery_time", "feature", "feature_tier"]
+
+    def filter_feature(self, queryset, name, value):
+        """
+        Semi-join on the (key, offer_type, offer) index of OfferFeature.
+        """
+        features = OfferFeature.objects.filter(key=normalize_feature(value))
+        tier = self.form.cleaned_data.get("feature_tier")
+        if tier:
+            features = features.filter(offer_type=tier)
+        return queryset.filter(pk__in=features.values("offer_id"))
+
+    def filter_feature_tier(self, queryset, name, value):
+        # Applied by filter_feature; a tier without a feature filters nothing.
+        return queryset
+
+
+class OfferSearchFilter(SearchFilter):
+    """
+    Full-text search over title/description using the FTS5 index.
+
+    Every term must occur (as a substring) in title or description, like
+    DRF's SearchFilter. Matching rows are annotated with `search_rank`
+    (bm25, lower is more relevant) for `ordering=rank`.
+
+    Falls back to the LIKE-based SearchFilter (view.search_fields) when the
+    index is not available or a term is shorter than 3 characters.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        match = build_match_query(terms)
+        if match is None or not search_index_available(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+
+        return queryset.filter(search_index__document=match).alias(
+            search_rank=F("search_index__rank")
+        )
+
+
+class OfferOrderingFilter(OrderingFilter):
+    """
+    OrderingFilter that maps `ordering=rank` (search relevance, best match
+    first) to the `search_rank` alias added by OfferSearchFilter.
+
+    `rank` is dropped when the request has no full-text search, so the
+    remaining/default ordering is used instead.
+    """
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        ordering = super().remove_invalid_fields(queryset, fields, view, request)
+        ranked = "search_rank" in queryset.query.annotations
+
+        result = []
+        for term in ordering:
+            if term.lstrip("-") != "rank":
+                result.append(term)
+            elif ranked:
+                result.append(term.replace("rank", "search_rank"))
+        return result
@@ -11,9 +11,29 @@ DRF will return a plain list instead of the paginated dict.
 Query params:
 - page: int
 - page_size: int (bounded by max_page_size)
+- count: "false" skips the COUNT(*) query ("count" is returned as null)
+- cursor: opt-in keyset mode; pass it empty for the first page, then follow
+  the `next`/`previous` links ({"next", "previous", "results"}, no count)
 """
 
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core.api.pagination import KeysetPagination
+
+
+class OffersCursorPagination(KeysetPagination):
+    """
+    Keyset pagination for offers, sorted by updated_at or min_price plus id.
+    """
+
+    page_size = 6
+    page_size_query_param = "page_size"
+    max_page_size = 3
+    ordering_fields = ("updated_at", "min_price")
+    default_ordering = ("-updated_at",)
 
 
 class OffersPagination(PageNumberPagination):
@@ -25,8 +45,80 @@ class OffersPagination(PageNumberPagination):
         {"count", "next", "previous", "results"}.
         - `page_size_query_param` allows the client to request smaller/larger pages.
         - `max_page_size` caps the requested size.
+        - `?count=false` keeps the shape but skips the COUNT(*) query.
+        - `?cursor=` switches to OffersCursorPagination.
     """
 
     page_size = 6
     page_size_query_param = "page_size"
     max_page_size = 3
+    count_query_param = "count"
+    cursor_class = OffersCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+
+        if self.cursor_class.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+
+        if request.query_params.get(self.count_query_param, "").lower() in {"0", "false", "no"}:
+            return self.paginate_queryset_without_count(queryset, request)
+
+        self.has_next = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def paginate_queryset_without_count(self, queryset, request):
+        """
+        Fetch one row beyond the page to detect a next page instead of counting.
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            self.page_number = 0
+        if self.page_number < 1:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset: offset + page_size + 1])
+        if not rows and self.page_number != 1:
+            raise NotFound(self.invalid_page_message)
+
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if self.has_next is None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.has_next is None:
+            return super().get_previous_link()
+        if self.page_number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        if self.has_next is None:
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "count": None,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
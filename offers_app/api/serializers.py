@@ -1,6 +1,7 @@
 """
 Serializers for offers and offer details, including:
-- list/retrieve payloads
+- list/retrieve payloads (`?expand=details` embeds full details instead of links;
+  `image` points to the small/large variant once it has been processed)
 - create payload validation (3 details required: basic/standard/premium)
 - partial update payload for offer and nested details by offer_type
 """
@@ -8,6 +9,7 @@ Serializers for offers and offer details, including:
 from django.db import transaction
 from rest_framework import serializers
 
+from core.api.expand import is_expanded
 from offers_app.models import Offer, OfferDetail
 
 
@@ -30,15 +32,35 @@ class OfferUserDetailsSerializer(serializers.Serializer):
     username = serializers.CharField()
 
 
+class OfferImageVariantField(serializers.ImageField):
+    """
+    Read-only image URL that prefers a processed variant (see
+    offers_app.images) and falls back to the original upload.
+    """
+
+    def __init__(self, variant, **kwargs):
+        self.variant = variant
+        kwargs.update(source="*", read_only=True)
+        super().__init__(**kwargs)
+
+    def to_representation(self, offer):
+        return self.file_url(getattr(offer, self.variant) or offer.image)
+
+    def file_url(self, file):
+        return super().to_representation(file)
+
+
 class OfferListSerializer(serializers.ModelSerializer):
     """
     Offer list serializer including:
     - details links
-    - annotated fields (min_price, min_delivery_time)
+    - stored aggregates (min_price, min_delivery_time)
     - embedded user_details
+    - the small image variant
     """
 
     user = serializers.IntegerField(source="user_id", read_only=True)
+    image = OfferImageVariantField("image_small")
     details = serializers.SerializerMethodField()
     min_price = serializers.DecimalField(max_digits=7, decimal_places=2, read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
@@ -62,8 +84,11 @@ class OfferListSerializer(serializers.ModelSerializer):
 
     def get_details(self, obj):
         """
-        Build simple relative URLs for offer details.
+        Build simple relative URLs for offer details, or embed them fully
+        with `?expand=details`.
         """
+        if is_expanded(self.context, "details"):
+            return OfferDetailResponseSerializer(obj.details.all(), many=True).data
         return [{"id": d.id, "url": f"/offerdetails/{d.id}/"} for d in obj.details.all()]
 
     def get_user_details(self, obj):
@@ -132,13 +157,23 @@ class OfferCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """
         Create Offer and associated OfferDetail rows in a single transaction.
+
+        min_price/min_delivery_time are taken from the payload directly and
+        the feature index is rebuilt explicitly, since bulk_create does not
+        trigger the post_save signals.
         """
         details_data = validated_data.pop("details")
         request = self.context["request"]
 
-        offer = Offer.objects.create(user=request.user, **validated_data)
+        offer = Offer.objects.create(
+            user=request.user,
+            min_price=min(d["price"] for d in details_data),
+            min_delivery_time=min(d["delivery_time_in_days"] for d in details_data),
+            **validated_data,
+        )
 
         OfferDetail.objects.bulk_create([OfferDetail(offer=offer, **d) for d in details_data])
+        OfferDetail.objects.filter(offer=offer).rebuild_features()
 
         return offer
 
@@ -175,10 +210,12 @@ class OfferResponseSerializer(serializers.ModelSerializer):
 
 class OfferRetrieveSerializer(serializers.ModelSerializer):
     """
-    Offer retrieve serializer including annotated fields and absolute detail URLs.
+    Offer retrieve serializer including stored aggregates, absolute detail URLs
+    and the large image variant.
     """
 
     user = serializers.IntegerField(source="user_id", read_only=True)
+    image = OfferImageVariantField("image_large")
     details = serializers.SerializerMethodField()
     min_price = serializers.DecimalField(max_digits=7, decimal_places=2, read_only=True)
     min_delivery_time = serializers.IntegerField(read_only=True)
@@ -200,8 +237,12 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
 
     def get_details(self, obj):
         """
-        Build absolute URLs to /api/offerdetails/<id>/ based on request host.
+        Build absolute URLs to /api/offerdetails/<id>/ based on request host,
+        or embed the details fully with `?expand=details`.
         """
+        if is_expanded(self.context, "details"):
+            return OfferDetailResponseSerializer(obj.details.all(), many=True).data
+
         request = self.context.get("request")
         base = request.build_absolute_uri("/")[:-1] if request else ""
         return [{"id": d.id, "url": f"{base}/api/offerdetails/{d.id}/"} for d in obj.details.all()]
@@ -269,4 +310,6 @@ class OfferPatchSerializer(serializers.ModelSerializer):
                     setattr(detail, field, val)
                 detail.save()
 
+            instance.refresh_aggregates()
+
         return instance
@@ -2,25 +2,38 @@
 ViewSets for offers and offer details.
 
 OffersViewSet:
-- list: public (AllowAny)
+- list: public (AllowAny), served from a versioned response cache and,
+  optionally, the in-memory offer catalog
 - retrieve: authenticated
-- create: authenticated + business profile
+- create: authenticated + business profile (honors the `Idempotency-Key` header)
 - partial_update/update/destroy: authenticated + offer owner
+- facets: public, price/delivery-time/creator counts of the filtered offers
+- top_features: public, most listed detail features
+- cache_stats: admin only, hit/miss counters of the list cache
 
 OfferDetailViewSet:
 - read-only, authenticated
 """
 
-from django.db.models import DecimalField, IntegerField, Min
-from django.db.models.functions import Coalesce
+from django.core.cache import cache
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets
-from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.decorators import action
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 
+from core.api.idempotency import idempotent
 from offers_app.models import Offer, OfferDetail
-from .filters import OfferFilter
+from .cache import build_cache_key, get_cache_stats, get_cache_timeout, record_hit, record_miss
+from .catalog import catalog_rows
+from .facets import FACET_QUERY_PARAMS, compute_facets
+from .features import (
+    TOP_FEATURES_QUERY_PARAMS,
+    compute_top_features,
+    parse_top_features_params,
+)
+from .fast_list import OfferRowRenderer, as_list_rows, fast_path_enabled, list_rows
+from .filters import OfferFilter, OfferOrderingFilter, OfferSearchFilter
 from .pagination import OffersPagination
 from .permissions import IsBusinessUser, IsOfferOwner
 from .serializers import (
@@ -35,38 +48,24 @@ from .serializers import (
 
 class OffersViewSet(viewsets.ModelViewSet):
     """
-    Offer CRUD endpoint with filtering/search/ordering and annotated aggregates.
+    Offer CRUD endpoint with filtering/search/ordering on stored aggregates.
     """
 
     pagination_class = OffersPagination
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OfferSearchFilter, OfferOrderingFilter]
     filterset_class = OfferFilter
     search_fields = ["title", "description"]
-    ordering_fields = ["updated_at", "min_price"]
+    ordering_fields = ["updated_at", "min_price", "rank"]
     ordering = ["-updated_at"]
 
     def get_queryset(self):
         """
-        Build queryset with optimized relations and (for list/retrieve) annotate:
-        - min_price
-        - min_delivery_time
-        """
-        querryset = Offer.objects.select_related("user").prefetch_related("details")
-
-        if self.action in ["list", "retrieve"]:
-            querryset = querryset.annotate(
-                min_price=Coalesce(
-                    Min("details__price"),
-                    0,
-                    output_field=DecimalField(max_digits=7, decimal_places=2),
-                ),
-                min_delivery_time=Coalesce(
-                    Min("details__delivery_time_in_days"),
-                    0,
-                    output_field=IntegerField(),
-                ),
-            )
-        return querryset
+        Build queryset with optimized relations.
+
+        min_price/min_delivery_time are stored (indexed) columns on Offer, so
+        filtering and ordering on them needs no GROUP BY over OfferDetail.
+        """
+        return Offer.objects.select_related("user").prefetch_related("details")
 
     def get_serializer_class(self):
         """
@@ -90,11 +89,120 @@ class OffersViewSet(viewsets.ModelViewSet):
             return [IsAuthenticated()]
         if self.action in ["partial_update", "update", "destroy"]:
             return [IsAuthenticated(), IsOfferOwner()]
+        if self.action == "cache_stats":
+            return [IsAuthenticated(), IsAdminUser()]
         return [AllowAny()]
 
+    def list(self, request, *args, **kwargs):
+        """
+        Public offers list, cached per normalized query string.
+
+        The `X-Cache` response header reports HIT or MISS.
+        """
+        timeout = get_cache_timeout()
+        if not timeout:
+            return self.list_uncached(request, *args, **kwargs)
+
+        key = build_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            record_hit()
+            response = Response(data)
+            response["X-Cache"] = "HIT"
+            return response
+
+        record_miss()
+        response = self.list_uncached(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout)
+        response["X-Cache"] = "MISS"
+        return response
+
+    def list_uncached(self, request, *args, **kwargs):
+        """
+        Build the list response.
+
+        Rows come from the single-query JSON fast path (see fast_list) unless
+        it is disabled, in which case OfferListSerializer renders instances.
+        With OFFERS_LIST_CATALOG the in-memory catalog picks the page ids and
+        only those rows are fetched (see catalog).
+        """
+        queryset = self.get_queryset()
+        fast = fast_path_enabled(queryset, request)
+
+        rows = catalog_rows(self, request, as_list_rows(queryset) if fast else queryset)
+        if rows is None:
+            if not fast:
+                return super().list(request, *args, **kwargs)
+            rows = list_rows(self.filter_queryset(queryset))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(self.render_rows(page, fast))
+        return Response(self.render_rows(rows[:], fast))
+
+    def render_rows(self, rows, fast):
+        if not fast:
+            return self.get_serializer(rows, many=True).data
+        render_row = OfferRowRenderer(self.request)
+        return [render_row(row) for row in rows]
+
+    def cached_data(self, request, prefix, query_params, build):
+        """
+        Return `build()`, cached under the offers version like the list.
+        """
+        timeout = get_cache_timeout()
+        if not timeout:
+            return build()
+
+        key = build_cache_key(request, prefix, query_params)
+        data = cache.get(key)
+        if data is None:
+            data = build()
+            cache.set(key, data, timeout)
+        return data
+
+    @action(detail=False, methods=["get"])
+    def facets(self, request, *args, **kwargs):
+        """
+        Facet counts for the current filter/search selection in one grouped
+        query (see facets).
+        """
+        data = self.cached_data(
+            request,
+            "offers:facets",
+            FACET_QUERY_PARAMS,
+            lambda: compute_facets(self.filter_queryset(self.get_queryset())),
+        )
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="top-features")
+    def top_features(self, request, *args, **kwargs):
+        """
+        Features listed by the most offers, from the OfferFeature index.
+        """
+        offer_type, limit = parse_top_features_params(request.query_params)
+        data = self.cached_data(
+            request,
+            "offers:top-features",
+            TOP_FEATURES_QUERY_PARAMS,
+            lambda: compute_top_features(offer_type, limit),
+        )
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="cache-stats")
+    def cache_stats(self, request, *args, **kwargs):
+        """
+        Return hit/miss counters and the current version of the list cache.
+        """
+        return Response(get_cache_stats(), status=status.HTTP_200_OK)
+
+    @idempotent("offers:create")
     def create(self, request, *args, **kwargs):
         """
         Create an offer (business users only) and return normalized response.
+
+        Retries with the same `Idempotency-Key` header replay the first response.
         """
         serializer = self.get_serializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
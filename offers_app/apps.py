@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class OffersAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'offers_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .search import on_post_migrate
+
+        post_migrate.connect(on_post_migrate, sender=self)
@@ -0,0 +1,123 @@
+"""
+Helpers for the offer benchmark management commands.
+
+Benchmarks seed their data inside a transaction that is rolled back at the
+end, so they can run against a development database without leaving rows
+behind.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from offers_app.models import Offer, OfferDetail
+
+WORDS = [
+    "logo", "design", "website", "branding", "flyer", "seo", "marketing",
+    "illustration", "video", "editing", "copywriting", "translation", "shop",
+    "wordpress", "social", "media", "animation", "photo", "retouch", "poster",
+    "packaging", "app", "mobile", "landing", "page", "newsletter", "podcast",
+]
+
+# Filler vocabulary so descriptions are not built from the handful of search terms.
+SYLLABLES = ["ka", "lo", "mi", "ne", "tu", "ra", "si", "po", "de", "vu", "ha", "ze"]
+FILLER = [a + b + c for a in SYLLABLES for b in SYLLABLES for c in SYLLABLES]
+
+
+class RollbackBenchmark(Exception):
+    """Raised internally to discard the seeded benchmark data."""
+
+
+@contextmanager
+def rolled_back():
+    """
+    Run the block in a transaction that is always rolled back.
+    """
+    try:
+        with transaction.atomic():
+            yield
+            raise RollbackBenchmark
+    except RollbackBenchmark:
+        pass
+
+
+def seed_offers(count, users=100, batch_size=5000, seed=42):
+    """
+    Bulk-create `count` offers (each with basic/standard/premium details)
+    spread over `users` new users. Stored min values are set directly and the
+    feature index is rebuilt per batch.
+
+    Returns:
+        list[int]: ids of the created users
+    """
+    rng = random.Random(seed)
+
+    created_users = User.objects.bulk_create(
+        [User(username=f"bench_user_{i}") for i in range(users)]
+    )
+    user_ids = [u.id for u in created_users]
+    if not user_ids[0]:
+        user_ids = list(
+            User.objects.filter(username__startswith="bench_user_").values_list("id", flat=True)
+        )
+
+    created = 0
+    while created < count:
+        size = min(batch_size, count - created)
+        offers = []
+        tiers = []
+        for _ in range(size):
+            prices = sorted(Decimal(rng.randint(10, 2000)) for _ in range(3))
+            days = sorted(rng.randint(1, 30) for _ in range(3))
+            offers.append(
+                Offer(
+                    user_id=rng.choice(user_ids),
+                    title=" ".join(rng.sample(WORDS, 3)).title(),
+                    description=" ".join(rng.choices(FILLER, k=18) + rng.sample(WORDS, 2)),
+                    min_price=prices[0],
+                    min_delivery_time=days[0],
+                )
+            )
+            tiers.append(list(zip(prices, days)))
+
+        offers = Offer.objects.bulk_create(offers)
+        if not offers[0].pk:
+            last_ids = Offer.objects.order_by("-id").values_list("id", flat=True)[:size]
+            for offer, pk in zip(offers, sorted(last_ids)):
+                offer.pk = pk
+
+        details = []
+        for offer, offer_tiers in zip(offers, tiers):
+            for offer_type, (price, days) in zip(["basic", "standard", "premium"], offer_tiers):
+                details.append(
+                    OfferDetail(
+                        offer_id=offer.pk,
+                        title=offer_type.title(),
+                        revisions=rng.randint(1, 5),
+                        delivery_time_in_days=days,
+                        price=price,
+                        features=rng.sample(WORDS, 3),
+                        offer_type=offer_type,
+                    )
+                )
+        OfferDetail.objects.bulk_create(details, batch_size=batch_size)
+        OfferDetail.objects.filter(offer_id__in=[offer.pk for offer in offers]).rebuild_features()
+        created += size
+
+    return user_ids
+
+
+def best_of(fn, repeat=5):
+    """
+    Call `fn` `repeat` times and return the fastest wall time in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
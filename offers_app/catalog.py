@@ -0,0 +1,290 @@
+"""
+Optional in-memory columnar catalog for the public offers list.
+
+Filtering on creator/min_price/max_delivery_time and ordering by
+updated_at/min_price only touch a few numeric columns. The catalog keeps
+those columns for all offers in NumPy arrays (per process):
+- one id-indexed array per column (value lookup by offer id)
+- one SortedColumn per column: (value, id) pairs sorted by value, then id,
+  so a range filter is two binary searches and an ordering is a slice
+
+The list view asks the catalog for the ordered ids and fetches only the rows
+of the requested page from the database (see offers_app.api.catalog).
+
+Writes mark offers dirty through signals; dirty offers are re-read and
+patched into the arrays before the next query. The catalog remembers the
+offers version (offers_app.api.cache) it reflects: own writes advance it
+together with their dirty marks, any other change of the shared version
+(writes of other processes) triggers a full reload. This keeps the catalog
+at least as fresh as the shared list cache, which would otherwise store
+stale pages under the new version. OFFERS_CATALOG_MAX_AGE remains as a
+backstop, e.g. for a per-process cache backend.
+
+Settings:
+- OFFERS_LIST_CATALOG: bool, serve the offers list from the catalog (needs numpy)
+- OFFERS_CATALOG_MAX_AGE: int, seconds between full reloads (0 = never)
+"""
+
+import math
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+
+from offers_app.api.cache import get_offers_version
+from offers_app.models import Offer
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+COLUMNS = ("user_id", "min_price", "min_delivery_time", "updated_at")
+ORDERING_FIELDS = ("updated_at", "min_price")
+
+# Above this many dirty offers a full reload is cheaper than patching.
+PATCH_LIMIT = 500
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def catalog_enabled():
+    return np is not None and getattr(settings, "OFFERS_LIST_CATALOG", False)
+
+
+def to_micros(value):
+    """
+    Datetime -> integer microseconds since the epoch (keeps full precision).
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dt_timezone.utc)
+    return (value - EPOCH) // MICROSECOND
+
+
+def to_cents(value):
+    return int(value * 100)
+
+
+def read_columns(queryset):
+    """
+    Read id and COLUMNS of `queryset` as int64 arrays.
+
+    Prices are stored as cents and datetimes as microseconds, so every
+    comparison is exact integer arithmetic.
+    """
+    rows = list(queryset.order_by().values_list("id", *COLUMNS))
+    count = len(rows)
+    ids, user_ids, prices, delivery_times, updated = zip(*rows) if rows else ([],) * 5
+
+    return np.fromiter(ids, np.int64, count), {
+        "user_id": np.fromiter(user_ids, np.int64, count),
+        "min_price": np.fromiter(map(to_cents, prices), np.int64, count),
+        "min_delivery_time": np.fromiter(delivery_times, np.int64, count),
+        "updated_at": np.fromiter(map(to_micros, updated), np.int64, count),
+    }
+
+
+class SortedColumn:
+    """
+    (value, id) pairs of one column, sorted by value and then id.
+    """
+
+    def __init__(self, values, ids):
+        order = np.lexsort((ids, values))
+        self.values = values[order]
+        self.ids = ids[order]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def bounds(self, low=None, high=None):
+        """
+        Index range of the pairs with low <= value <= high (None = open).
+        """
+        start = 0 if low is None else int(np.searchsorted(self.values, low, "left"))
+        stop = len(self.values) if high is None else int(np.searchsorted(self.values, high, "right"))
+        return start, max(start, stop)
+
+    def position(self, value, pk):
+        start, stop = self.bounds(value, value)
+        return start + int(np.searchsorted(self.ids[start:stop], pk))
+
+    # delete/insert build new arrays, so id slices handed out earlier stay valid.
+    def remove(self, value, pk):
+        index = self.position(value, pk)
+        self.values = np.delete(self.values, index)
+        self.ids = np.delete(self.ids, index)
+
+    def insert(self, value, pk):
+        index = self.position(value, pk)
+        self.values = np.insert(self.values, index, value)
+        self.ids = np.insert(self.ids, index, pk)
+
+
+class OfferCatalog:
+    """
+    Per-process columnar copy of the offer list columns.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        """
+        Drop all data; the next query loads the catalog again.
+        """
+        with self.lock:
+            self.loaded_at = None
+            self.version = None
+            self.dirty = set()
+            self.present = None
+            self.columns = {}
+            self.sorted = {}
+
+    @property
+    def loaded(self):
+        return self.loaded_at is not None
+
+    def mark_dirty(self, pks):
+        """
+        Re-read these offers before the next query (no-op until loaded).
+        """
+        with self.lock:
+            if self.loaded:
+                self.dirty.update(pks)
+
+    def follow_version(self, version):
+        """
+        Adopt the version produced by an own write (its offers are marked
+        dirty) if no other write happened since the catalog's version.
+        """
+        with self.lock:
+            if self.loaded and self.version == version - 1:
+                self.version = version
+
+    def load(self):
+        """
+        Read all offers and build the arrays from scratch.
+        """
+        with self.lock:
+            # Read before the rows, so writes during the load cause another one.
+            self.version = get_offers_version()
+            ids, values = read_columns(Offer.objects.all())
+            size = int(ids.max()) + 1 if len(ids) else 0
+
+            self.present = np.zeros(size, dtype=bool)
+            self.present[ids] = True
+            self.columns = {}
+            self.sorted = {}
+            for name in COLUMNS:
+                self.columns[name] = np.zeros(size, dtype=np.int64)
+                self.columns[name][ids] = values[name]
+                self.sorted[name] = SortedColumn(values[name], ids)
+
+            self.dirty = set()
+            self.loaded_at = time.monotonic()
+
+    def grow(self, max_pk):
+        size = len(self.present)
+        if max_pk < size:
+            return
+        new_size = max(max_pk + 1, size * 2)
+        present = np.zeros(new_size, dtype=bool)
+        present[:size] = self.present
+        self.present = present
+        for name in COLUMNS:
+            column = np.zeros(new_size, dtype=np.int64)
+            column[:size] = self.columns[name]
+            self.columns[name] = column
+
+    def patch(self, pks):
+        """
+        Re-read the given offers and move their entries to the new positions.
+        Offers that no longer exist are removed.
+        """
+        ids, values = read_columns(Offer.objects.filter(pk__in=pks))
+        self.grow(max(pks))
+
+        for pk in pks:
+            if self.present[pk]:
+                for name in COLUMNS:
+                    self.sorted[name].remove(self.columns[name][pk], pk)
+                self.present[pk] = False
+
+        for index, pk in enumerate(ids.tolist()):
+            self.present[pk] = True
+            for name in COLUMNS:
+                value = values[name][index]
+                self.columns[name][pk] = value
+                self.sorted[name].insert(value, pk)
+
+    def sync(self):
+        """
+        Bring the catalog up to date: load, reload when the offers version
+        moved or the catalog expired, or apply pending dirty offers.
+        """
+        with self.lock:
+            max_age = getattr(settings, "OFFERS_CATALOG_MAX_AGE", 300)
+            expired = self.loaded and max_age and time.monotonic() - self.loaded_at > max_age
+            stale = self.loaded and self.version != get_offers_version()
+            if not self.loaded or stale or expired or len(self.dirty) > PATCH_LIMIT:
+                self.load()
+            elif self.dirty:
+                pks = sorted(self.dirty)
+                self.dirty = set()
+                self.patch(pks)
+
+    def select(self, ordering, creator_id=None, min_price=None, max_delivery_time=None):
+        """
+        Return the ids of the matching offers as an int64 array in list order.
+
+        `ordering` is one of updated_at/min_price, optionally prefixed with
+        "-"; ties are broken by id in the same direction. The filters mirror
+        OfferFilter (creator_id ==, min_price >=, max_delivery_time <= on
+        min_delivery_time).
+        """
+        field = ordering.lstrip("-")
+        if field not in ORDERING_FIELDS:
+            raise ValueError(f"Unsupported catalog ordering: {ordering}")
+
+        ranges = {}
+        if creator_id is not None:
+            ranges["user_id"] = (math.ceil(creator_id), math.floor(creator_id))
+        if min_price is not None:
+            ranges["min_price"] = (math.ceil(min_price * 100), None)
+        if max_delivery_time is not None:
+            ranges["min_delivery_time"] = (None, math.floor(max_delivery_time))
+
+        with self.lock:
+            self.sync()
+            return self.matching_ids(field, ranges)[:: -1 if ordering.startswith("-") else 1]
+
+    def matching_ids(self, field, ranges):
+        # Start from the smallest candidate set; the ordering column's own
+        # range is already in order and wins ties.
+        bounds = {name: self.sorted[name].bounds(*limits) for name, limits in ranges.items()}
+        bounds.setdefault(field, (0, len(self.sorted[field])))
+        name = min(bounds, key=lambda n: (bounds[n][1] - bounds[n][0], n != field))
+
+        start, stop = bounds[name]
+        ids = self.sorted[name].ids[start:stop]
+        for other, (low, high) in ranges.items():
+            if other == name:
+                continue
+            values = self.columns[other][ids]
+            keep = np.ones(len(ids), dtype=bool)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            ids = ids[keep]
+
+        if name != field:
+            ids = ids[np.lexsort((ids, self.columns[field][ids]))]
+        return ids
+
+
+offer_catalog = OfferCatalog()
@@ -0,0 +1,139 @@
+"""
+Image variant pipeline for Offer.image.
+
+Uploads are processed once into fixed-width, re-encoded (WebP) copies with
+all metadata (EXIF, XMP, ICC) stripped:
+- image_small: used by the offers list
+- image_large: used by the offer retrieve endpoint
+
+Processing runs after commit on a small thread pool, outside the request
+thread. Until it finishes, the serializers fall back to the original image.
+
+Settings:
+- OFFER_IMAGE_VARIANTS_ASYNC: bool, process on the thread pool (False runs
+  the work inline after commit, e.g. for tests and management commands)
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.db.models import Q
+from PIL import Image, ImageOps
+
+from offers_app.api.cache import bump_offers_version
+from offers_app.models import Offer
+
+logger = logging.getLogger(__name__)
+
+# field name -> maximum width in pixels (smaller images are not upscaled)
+VARIANTS = {
+    "image_small": 480,
+    "image_large": 1280,
+}
+VARIANT_FORMAT = "WEBP"
+VARIANT_EXTENSION = ".webp"
+VARIANT_QUALITY = 80
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="offer-images")
+    return _executor
+
+
+def render_variant(image, width):
+    """
+    Resize `image` to at most `width` pixels wide and encode it without metadata.
+    """
+    if image.width > width:
+        height = max(1, round(image.height * width / image.width))
+        image = image.resize((width, height), Image.Resampling.LANCZOS)
+    else:
+        image = image.copy()
+    image.info.clear()
+
+    buffer = BytesIO()
+    image.save(buffer, format=VARIANT_FORMAT, quality=VARIANT_QUALITY)
+    return ContentFile(buffer.getvalue())
+
+
+def open_source(field_file):
+    """
+    Load the original upload, upright (EXIF orientation applied) and in RGB(A).
+    """
+    with field_file.open("rb"), Image.open(field_file) as image:
+        image = ImageOps.exif_transpose(image)
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def process_offer_image(offer_id):
+    """
+    (Re)build the variants of one offer from its current image.
+
+    The variants are only stored if the image did not change meanwhile;
+    replaced variant files are deleted. Returns True if variants were written.
+    """
+    offer = Offer.objects.filter(pk=offer_id).first()
+    if offer is None:
+        return False
+
+    source_name = offer.image.name or ""
+    storage = offer.image.storage
+    old_names = [getattr(offer, field).name for field in VARIANTS if getattr(offer, field)]
+
+    names = {field: "" for field in VARIANTS}
+    if source_name:
+        image = open_source(offer.image)
+        stem = os.path.splitext(os.path.basename(source_name))[0]
+        for field, width in VARIANTS.items():
+            variant = getattr(offer, field)
+            variant.save(f"{stem}_{width}w{VARIANT_EXTENSION}", render_variant(image, width), save=False)
+            names[field] = variant.name
+
+    unchanged = Q(image=source_name) if source_name else Q(image="") | Q(image__isnull=True)
+    updated = Offer.objects.filter(unchanged, pk=offer_id).update(**names)
+    if not updated:
+        # The image was replaced while processing; its own job takes over.
+        for name in names.values():
+            if name:
+                storage.delete(name)
+        return False
+
+    for name in old_names:
+        storage.delete(name)
+    bump_offers_version()
+    return bool(source_name)
+
+
+def run_process_offer_image(offer_id):
+    """
+    Thread pool entry point: process one offer and release the DB connection.
+    """
+    try:
+        process_offer_image(offer_id)
+    except Exception:
+        logger.exception("Could not build image variants for offer %s", offer_id)
+    finally:
+        connection.close()
+
+
+def schedule_image_processing(offer_id):
+    """
+    Build the offer's variants once the current transaction commits.
+    """
+    def submit():
+        if getattr(settings, "OFFER_IMAGE_VARIANTS_ASYNC", True):
+            get_executor().submit(run_process_offer_image, offer_id)
+        else:
+            process_offer_image(offer_id)
+
+    transaction.on_commit(submit)
@@ -0,0 +1,86 @@
+"""
+Compare the in-memory offer catalog with the ORM path of the offers list.
+
+Seeds offers inside a rolled-back transaction, times the catalog load and an
+incremental patch, then times full list requests (cache disabled) through
+the view with and without OFFERS_LIST_CATALOG.
+
+Usage:
+    python manage.py benchmark_offer_catalog --offers 1000000
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+
+from offers_app.api.views import OffersViewSet
+from offers_app.benchmarks import best_of, rolled_back, seed_offers
+from offers_app.catalog import np, offer_catalog
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    help = "Benchmark the in-memory offer catalog against the ORM path of the offers list."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offers", type=int, default=1_000_000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        if np is None:
+            raise CommandError("numpy is not installed.")
+
+        factory = APIRequestFactory()
+        view = OffersViewSet.as_view({"get": "list"})
+        scenarios = {
+            "default page": {},
+            "page 100": {"page": 100},
+            "ordering=min_price": {"ordering": "min_price"},
+            "min_price>=1500": {"min_price": 1500},
+            "max_delivery_time<=2": {"max_delivery_time": 2, "ordering": "-min_price"},
+            "creator_id + min_price": {"creator_id": 0, "min_price": 500},
+            "count=false": {"count": "false", "ordering": "-min_price"},
+        }
+
+        def run(params):
+            response = view(factory.get("/api/offers/", params, HTTP_HOST="localhost"))
+            response.render()
+
+        with rolled_back(), override_settings(OFFERS_LIST_CACHE_TIMEOUT=0):
+            self.stdout.write(f"Seeding {options['offers']} offers ...")
+            user_ids = seed_offers(options["offers"])
+            scenarios["creator_id + min_price"]["creator_id"] = user_ids[0]
+
+            offer_catalog.reset()
+            start = time.perf_counter()
+            offer_catalog.load()
+            self.stdout.write(f"Catalog load: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+            offer = Offer.objects.order_by("?").first()
+            offer.title = f"{offer.title} (updated)"
+            offer.save()
+            start = time.perf_counter()
+            offer_catalog.sync()
+            self.stdout.write(f"Incremental patch (1 offer): {(time.perf_counter() - start) * 1000:.2f} ms")
+
+            self.stdout.write(
+                f"{'scenario':<24}{'orm ms':>10}{'queries':>9}{'catalog ms':>12}{'queries':>9}"
+            )
+            for name, params in scenarios.items():
+                results = []
+                for enabled in (False, True):
+                    with override_settings(OFFERS_LIST_CATALOG=enabled):
+                        run(params)
+                        connection.queries_log.clear()
+                        with CaptureQueriesContext(connection) as queries:
+                            run(params)
+                        results += [best_of(lambda: run(params), options["repeat"]), len(queries)]
+
+                self.stdout.write(
+                    f"{name:<24}{results[0]:>10.2f}{results[1]:>9}{results[2]:>12.2f}{results[3]:>9}"
+                )
+
+            offer_catalog.reset()
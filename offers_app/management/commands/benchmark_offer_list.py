@@ -0,0 +1,63 @@
+"""
+Compare the JSON-aggregation fast path of the offers list with the
+serializer path.
+
+Seeds offers inside a rolled-back transaction and times full list requests
+(cache disabled) through the view, reporting wall time and query count.
+
+Usage:
+    python manage.py benchmark_offer_list --offers 100000
+"""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory
+
+from offers_app.api.views import OffersViewSet
+from offers_app.benchmarks import best_of, rolled_back, seed_offers
+
+
+class Command(BaseCommand):
+    help = "Benchmark the SQL JSON fast path of the offers list against the serializer path."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offers", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        factory = APIRequestFactory()
+        view = OffersViewSet.as_view({"get": "list"})
+        scenarios = {
+            "default page": {},
+            "page_size=3": {"page_size": 3},
+            "ordering=min_price": {"ordering": "min_price"},
+            "cursor, page_size=3": {"cursor": "", "page_size": 3},
+            "search=logo": {"search": "logo"},
+            "creator_id + min_price": {"creator_id": 0, "min_price": 500},
+        }
+
+        def run(params):
+            response = view(factory.get("/api/offers/", params, HTTP_HOST="localhost"))
+            response.render()
+
+        with rolled_back(), override_settings(OFFERS_LIST_CACHE_TIMEOUT=0):
+            self.stdout.write(f"Seeding {options['offers']} offers ...")
+            user_ids = seed_offers(options["offers"])
+            scenarios["creator_id + min_price"]["creator_id"] = user_ids[0]
+
+            self.stdout.write(
+                f"{'scenario':<24}{'serializer ms':>15}{'queries':>9}{'fast ms':>10}{'queries':>9}"
+            )
+            for name, params in scenarios.items():
+                results = []
+                for fast in (False, True):
+                    with override_settings(OFFERS_LIST_FAST_PATH=fast):
+                        run(params)
+                        with CaptureQueriesContext(connection) as queries:
+                            run(params)
+                        results += [best_of(lambda: run(params), options["repeat"]), len(queries)]
+
+                self.stdout.write(
+                    f"{name:<24}{results[0]:>15.2f}{results[1]:>9}{results[2]:>10.2f}{results[3]:>9}"
+                )
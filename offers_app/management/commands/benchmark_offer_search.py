@@ -0,0 +1,61 @@
+"""
+Compare the FTS5-backed offer search against DRF's LIKE-based SearchFilter.
+
+Seeds offers inside a rolled-back transaction and times, per search term,
+what the list endpoint executes: the filtered COUNT plus the first page.
+
+Usage:
+    python manage.py benchmark_offer_search --offers 100000
+"""
+
+from django.core.management.base import BaseCommand
+from rest_framework.filters import SearchFilter
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from offers_app.api.filters import OfferSearchFilter
+from offers_app.api.views import OffersViewSet
+from offers_app.benchmarks import best_of, rolled_back, seed_offers
+from offers_app.models import Offer
+from offers_app.search import search_index_available
+
+
+class Command(BaseCommand):
+    help = "Benchmark FTS5 offer search against the LIKE search path."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--offers", type=int, default=100_000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--terms",
+            default="logo,podcast design,kalomi,nomatchterm",
+            help="Comma separated search strings.",
+        )
+
+    def handle(self, *args, **options):
+        if not search_index_available():
+            self.stderr.write("FTS5 search index is not available on this database.")
+            return
+
+        factory = APIRequestFactory()
+        view = OffersViewSet()
+
+        with rolled_back():
+            self.stdout.write(f"Seeding {options['offers']} offers ...")
+            seed_offers(options["offers"])
+
+            self.stdout.write(f"{'search':<20}{'matches':>10}{'LIKE ms':>12}{'FTS5 ms':>12}")
+            for term in options["terms"].split(","):
+                request = Request(factory.get("/api/offers/", {"search": term}))
+
+                def run(backend):
+                    queryset = backend.filter_queryset(request, Offer.objects.all(), view)
+                    count = queryset.count()
+                    list(queryset.order_by("-updated_at").values_list("id", flat=True)[:6])
+                    return count
+
+                matches = run(OfferSearchFilter())
+                like_ms = best_of(lambda: run(SearchFilter()), options["repeat"])
+                fts_ms = best_of(lambda: run(OfferSearchFilter()), options["repeat"])
+
+                self.stdout.write(f"{term:<20}{matches:>10}{like_ms:>12.1f}{fts_ms:>12.1f}")
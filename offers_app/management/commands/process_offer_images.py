@@ -0,0 +1,53 @@
+"""
+Backfill/rebuild the image variants (image_small/image_large) of offers.
+
+By default only offers with an image but without variants are processed.
+
+Usage:
+    python manage.py process_offer_images
+    python manage.py process_offer_images --all
+    python manage.py process_offer_images --offer-id 3 --offer-id 7
+"""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from offers_app.images import process_offer_image
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    help = "Build the resized image variants of Offer.image."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--offer-id",
+            type=int,
+            action="append",
+            dest="offer_ids",
+            help="Only process the given offer (can be passed multiple times).",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Rebuild variants that already exist.",
+        )
+
+    def handle(self, *args, **options):
+        offers = Offer.objects.exclude(Q(image="") | Q(image__isnull=True))
+        if options["offer_ids"]:
+            offers = offers.filter(pk__in=options["offer_ids"])
+        elif not options["all"]:
+            offers = offers.filter(Q(image_small="") | Q(image_small__isnull=True))
+
+        processed = failed = 0
+        for offer_id in offers.order_by("pk").values_list("pk", flat=True).iterator():
+            try:
+                processed += process_offer_image(offer_id)
+            except (OSError, ValueError) as exc:
+                failed += 1
+                self.stderr.write(f"Offer {offer_id}: {exc}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Processed images of {processed} offer(s), {failed} failed.")
+        )
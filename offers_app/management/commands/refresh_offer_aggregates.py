@@ -0,0 +1,34 @@
+"""
+Backfill/repair the stored min_price and min_delivery_time columns on Offer.
+
+Usage:
+    python manage.py refresh_offer_aggregates
+    python manage.py refresh_offer_aggregates --offer-id 3 --offer-id 7
+"""
+
+from django.core.management.base import BaseCommand
+
+from offers_app.api.cache import bump_offers_version
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    help = "Recompute Offer.min_price and Offer.min_delivery_time from OfferDetail rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--offer-id",
+            type=int,
+            action="append",
+            dest="offer_ids",
+            help="Only refresh the given offer (can be passed multiple times).",
+        )
+
+    def handle(self, *args, **options):
+        offers = Offer.objects.all()
+        if options["offer_ids"]:
+            offers = offers.filter(pk__in=options["offer_ids"])
+
+        updated = offers.refresh_aggregates()
+        bump_offers_version()
+        self.stdout.write(self.style.SUCCESS(f"Refreshed aggregates for {updated} offer(s)."))
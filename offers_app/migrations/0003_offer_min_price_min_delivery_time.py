@@ -0,0 +1,45 @@
+# Generated by Django 5.2.11 on 2026-10-18 04:48
+
+from django.db import migrations, models
+from django.db.models import DecimalField, IntegerField, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_min_values(apps, schema_editor):
+    Offer = apps.get_model("offers_app", "Offer")
+    OfferDetail = apps.get_model("offers_app", "OfferDetail")
+
+    details = OfferDetail.objects.filter(offer=OuterRef("pk")).order_by().values("offer")
+    Offer.objects.update(
+        min_price=Coalesce(
+            Subquery(details.annotate(value=Min("price")).values("value")),
+            0,
+            output_field=DecimalField(max_digits=7, decimal_places=2),
+        ),
+        min_delivery_time=Coalesce(
+            Subquery(details.annotate(value=Min("delivery_time_in_days")).values("value")),
+            0,
+            output_field=IntegerField(),
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0002_offerdetail_features_offerdetail_offer_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time',
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.DecimalField(db_index=True, decimal_places=2, default=0, max_digits=7),
+        ),
+        migrations.RunPython(backfill_min_values, migrations.RunPython.noop),
+    ]
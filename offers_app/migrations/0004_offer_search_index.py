@@ -0,0 +1,39 @@
+# Generated by Django 5.2.11 on 2026-10-18 04:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from offers_app.search import drop_search_index, ensure_search_index
+
+
+def create_search_index(apps, schema_editor):
+    ensure_search_index(schema_editor.connection.alias)
+
+
+def remove_search_index(apps, schema_editor):
+    drop_search_index(schema_editor.connection.alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0003_offer_min_price_min_delivery_time'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferSearchIndex',
+            fields=[
+                ('offer', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_index', serialize=False, to='offers_app.offer')),
+                ('title', models.TextField()),
+                ('description', models.TextField()),
+                ('document', models.TextField(db_column='offers_app_offer_fts')),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'offers_app_offer_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_search_index, remove_search_index),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-18 05:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0005_offer_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='image_large',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='offers/variants/'),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='image_small',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='offers/variants/'),
+        ),
+    ]
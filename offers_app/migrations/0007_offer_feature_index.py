@@ -0,0 +1,53 @@
+# Generated by Django 5.2.11 on 2026-10-18 05:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_features(apps, schema_editor):
+    OfferDetail = apps.get_model("offers_app", "OfferDetail")
+    OfferFeature = apps.get_model("offers_app", "OfferFeature")
+
+    rows = []
+    for detail in OfferDetail.objects.only("id", "offer_id", "offer_type", "features").iterator():
+        keys = set()
+        for name in detail.features or []:
+            key = " ".join(str(name).split()).casefold()[:255]
+            if key and key not in keys:
+                keys.add(key)
+                rows.append(
+                    OfferFeature(
+                        offer_id=detail.offer_id,
+                        detail_id=detail.id,
+                        offer_type=detail.offer_type,
+                        key=key,
+                        name=str(name).strip()[:255],
+                    )
+                )
+    OfferFeature.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0006_offer_image_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferFeature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('offer_type', models.CharField(choices=[('basic', 'Basic'), ('standard', 'Standard'), ('premium', 'Premium')], max_length=20)),
+                ('key', models.CharField(max_length=255)),
+                ('name', models.CharField(max_length=255)),
+                ('detail', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feature_index', to='offers_app.offerdetail')),
+                ('offer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='feature_index', to='offers_app.offer')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['key', 'offer_type', 'offer'], name='offer_feature_lookup_idx')],
+                'constraints': [models.UniqueConstraint(fields=('detail', 'key'), name='unique_offer_feature_per_detail')],
+            },
+        ),
+        migrations.RunPython(backfill_features, migrations.RunPython.noop),
+    ]
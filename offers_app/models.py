@@ -1,5 +1,32 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import DecimalField, IntegerField, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+class OfferQuerySet(models.QuerySet):
+    def refresh_aggregates(self):
+        """
+        Recompute the stored min_price/min_delivery_time columns from the
+        current OfferDetail rows in a single UPDATE.
+
+        Returns:
+            int: number of updated offers
+        """
+        details = OfferDetail.objects.filter(offer=OuterRef("pk")).order_by().values("offer")
+
+        return self.update(
+            min_price=Coalesce(
+                Subquery(details.annotate(value=Min("price")).values("value")),
+                0,
+                output_field=DecimalField(max_digits=7, decimal_places=2),
+            ),
+            min_delivery_time=Coalesce(
+                Subquery(details.annotate(value=Min("delivery_time_in_days")).values("value")),
+                0,
+                output_field=IntegerField(),
+            ),
+        )
 
 
 class Offer(models.Model):
@@ -10,14 +37,72 @@ class Offer(models.Model):
     )
     title = models.CharField(max_length=255)
     image = models.ImageField(upload_to="offers/", null=True, blank=True)
+    # Resized, re-encoded copies of `image`, written by offers_app.images.
+    image_small = models.ImageField(
+        upload_to="offers/variants/", null=True, blank=True, editable=False
+    )
+    image_large = models.ImageField(
+        upload_to="offers/variants/", null=True, blank=True, editable=False
+    )
     description = models.TextField()
 
+    # Denormalized from OfferDetail, kept current by refresh_aggregates().
+    min_price = models.DecimalField(max_digits=7, decimal_places=2, default=0, db_index=True)
+    min_delivery_time = models.PositiveIntegerField(default=0, db_index=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    objects = OfferQuerySet.as_manager()
 
     def __str__(self):
         return self.title
 
+    def refresh_aggregates(self):
+        """
+        Recompute min_price/min_delivery_time for this offer and reload them.
+        """
+        Offer.objects.filter(pk=self.pk).refresh_aggregates()
+        self.refresh_from_db(fields=["min_price", "min_delivery_time"])
+
+
+def normalize_feature(name):
+    """
+    Lookup key of a feature: whitespace collapsed, case-folded, at most 255 chars.
+    """
+    return " ".join(str(name).split()).casefold()[:255]
+
+
+class OfferDetailQuerySet(models.QuerySet):
+    def rebuild_features(self):
+        """
+        Replace the OfferFeature rows of these details with their current
+        `features` list (one row per distinct normalized feature).
+
+        Returns:
+            int: number of written index rows
+        """
+        rows = []
+        for detail in self.only("id", "offer_id", "offer_type", "features"):
+            keys = set()
+            for name in detail.features or []:
+                key = normalize_feature(name)
+                if key and key not in keys:
+                    keys.add(key)
+                    rows.append(
+                        OfferFeature(
+                            offer_id=detail.offer_id,
+                            detail_id=detail.id,
+                            offer_type=detail.offer_type,
+                            key=key,
+                            name=str(name).strip()[:255],
+                        )
+                    )
+
+        OfferFeature.objects.filter(detail__in=self.values("pk")).delete()
+        OfferFeature.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
 
 class OfferDetail(models.Model):
     OFFER_TYPE_CHOICES = [
@@ -43,5 +128,60 @@ class OfferDetail(models.Model):
         choices=OFFER_TYPE_CHOICES,
     )
 
+    objects = OfferDetailQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.offer.title} – {self.offer_type}"
+
+
+class OfferFeature(models.Model):
+    """
+    Normalized index of OfferDetail.features, one row per detail and feature.
+
+    Kept current by OfferDetailQuerySet.rebuild_features() (via signals);
+    `key` is the normalized lookup value, `name` the text as entered.
+    """
+
+    offer = models.ForeignKey(Offer, on_delete=models.CASCADE, related_name="feature_index")
+    detail = models.ForeignKey(OfferDetail, on_delete=models.CASCADE, related_name="feature_index")
+    offer_type = models.CharField(max_length=20, choices=OfferDetail.OFFER_TYPE_CHOICES)
+    key = models.CharField(max_length=255)
+    name = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["detail", "key"], name="unique_offer_feature_per_detail"),
+        ]
+        indexes = [
+            models.Index(fields=["key", "offer_type", "offer"], name="offer_feature_lookup_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.offer_type})"
+
+
+class OfferSearchIndex(models.Model):
+    """
+    Read-only mapping of the SQLite FTS5 index over Offer.title/description.
+
+    The virtual table and its sync triggers are created by offers_app.search;
+    this model only exists so the ORM can join against it.
+    """
+
+    offer = models.OneToOneField(
+        Offer,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="search_index",
+    )
+    title = models.TextField()
+    description = models.TextField()
+
+    # FTS5 hidden columns: `<table> = 'query'` is a MATCH, `rank` is bm25().
+    document = models.TextField(db_column="offers_app_offer_fts")
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = "offers_app_offer_fts"
@@ -0,0 +1,140 @@
+"""
+SQLite FTS5 full-text index for offer search.
+
+The index is an external-content FTS5 table over offers_app_offer(title,
+description) using the trigram tokenizer, so MATCH keeps the substring
+semantics of the previous `LIKE '%term%'` search (for terms of 3+ chars).
+It is kept in sync by SQL triggers, which also cover bulk_create and
+QuerySet.update.
+
+SQLite drops triggers when Django remakes a table during a migration, so
+`ensure_search_index` runs after every migrate and reinstalls + rebuilds the
+index when a trigger is missing.
+"""
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from offers_app.models import OfferSearchIndex
+
+INDEX_TABLE = OfferSearchIndex._meta.db_table
+MIN_TERM_LENGTH = 3
+
+TRIGGERS = {
+    f"{INDEX_TABLE}_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS {INDEX_TABLE}_ai AFTER INSERT ON offers_app_offer BEGIN
+            INSERT INTO {INDEX_TABLE}(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+    """,
+    f"{INDEX_TABLE}_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS {INDEX_TABLE}_ad AFTER DELETE ON offers_app_offer BEGIN
+            INSERT INTO {INDEX_TABLE}({INDEX_TABLE}, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+        END
+    """,
+    f"{INDEX_TABLE}_au": f"""
+        CREATE TRIGGER IF NOT EXISTS {INDEX_TABLE}_au
+        AFTER UPDATE OF title, description ON offers_app_offer BEGIN
+            INSERT INTO {INDEX_TABLE}({INDEX_TABLE}, rowid, title, description)
+            VALUES ('delete', old.id, old.title, old.description);
+            INSERT INTO {INDEX_TABLE}(rowid, title, description)
+            VALUES (new.id, new.title, new.description);
+        END
+    """,
+}
+
+_available = {}
+
+
+def ensure_search_index(using=DEFAULT_DB_ALIAS):
+    """
+    Create the FTS5 table and triggers if missing, rebuilding the index when
+    anything had to be (re)created. No-op on non-SQLite backends.
+
+    Returns:
+        bool: True if the index is available on this database
+    """
+    connection = connections[using]
+    _available.pop(using, None)
+
+    if connection.vendor != "sqlite":
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name = %s OR (type = 'trigger' AND name LIKE %s)",
+            [INDEX_TABLE, f"{INDEX_TABLE}_%"],
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+
+        if INDEX_TABLE in existing and set(TRIGGERS) <= existing:
+            return True
+
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {INDEX_TABLE} USING fts5("
+            "title, description, content='offers_app_offer', content_rowid='id', "
+            "tokenize='trigram')"
+        )
+        for sql in TRIGGERS.values():
+            cursor.execute(sql)
+        cursor.execute(f"INSERT INTO {INDEX_TABLE}({INDEX_TABLE}) VALUES ('rebuild')")
+
+    return True
+
+
+def drop_search_index(using=DEFAULT_DB_ALIAS):
+    """
+    Remove the FTS5 table and its triggers (migration rollback).
+    """
+    connection = connections[using]
+    _available.pop(using, None)
+
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        for name in TRIGGERS:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        cursor.execute(f"DROP TABLE IF EXISTS {INDEX_TABLE}")
+
+
+def search_index_available(using=DEFAULT_DB_ALIAS):
+    """
+    Return True if the FTS5 index exists on the given database (cached per alias).
+    """
+    if using not in _available:
+        connection = connections[using]
+        _available[using] = (
+            connection.vendor == "sqlite"
+            and INDEX_TABLE in connection.introspection.table_names()
+        )
+    return _available[using]
+
+
+def build_match_query(terms):
+    """
+    Build an FTS5 query requiring every term, each as a quoted phrase.
+
+    Returns None if a term is too short for the trigram tokenizer, in which
+    case the caller should fall back to LIKE search.
+    """
+    if any(len(term) < MIN_TERM_LENGTH for term in terms):
+        return None
+    return " AND ".join('"{}"'.format(term.replace('"', '""')) for term in terms)
+
+
+def rebuild_search_index(using=DEFAULT_DB_ALIAS):
+    """
+    Rebuild the FTS5 index from offers_app_offer.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"INSERT INTO {INDEX_TABLE}({INDEX_TABLE}) VALUES ('rebuild')")
+
+
+def on_post_migrate(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    post_migrate hook: reinstall triggers dropped by table remakes.
+    """
+    connection = connections[using]
+    if connection.vendor == "sqlite" and INDEX_TABLE in connection.introspection.table_names():
+        ensure_search_index(using)
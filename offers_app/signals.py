@@ -0,0 +1,101 @@
+"""
+Signal handlers keeping denormalized offer data in sync with writes:
+- stored min_price/min_delivery_time on Offer
+- the offers response cache version
+- the OfferFeature index of OfferDetail.features
+- dirty offers of the in-memory offer catalog
+- image variants (scheduled when Offer.image changes)
+
+Bulk operations (bulk_create, QuerySet.update) do not send these signals and
+must refresh the affected offers / bump the version themselves.
+"""
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from offers_app.api.cache import bump_offers_version
+from offers_app.catalog import offer_catalog
+from offers_app.images import schedule_image_processing
+from offers_app.models import Offer, OfferDetail
+
+USER_DISPLAY_FIELDS = {"first_name", "last_name", "username"}
+
+
+def invalidate_offers_cache():
+    """
+    Bump the offers version now and again after commit.
+
+    The second bump drops entries that concurrent requests built from
+    pre-commit data under the first bumped version. The catalog of this
+    process follows both bumps, since the write marks its offers dirty.
+    """
+    offer_catalog.follow_version(bump_offers_version())
+    transaction.on_commit(lambda: offer_catalog.follow_version(bump_offers_version()))
+
+
+def mark_catalog_dirty(pk):
+    """
+    Re-read the offer in the catalog now and again after commit (see above).
+    """
+    offer_catalog.mark_dirty([pk])
+    transaction.on_commit(lambda: offer_catalog.mark_dirty([pk]))
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def refresh_offer_aggregates(sender, instance, **kwargs):
+    """
+    Recompute min_price/min_delivery_time of the offer owning the detail.
+    """
+    Offer.objects.filter(pk=instance.offer_id).refresh_aggregates()
+    mark_catalog_dirty(instance.offer_id)
+    invalidate_offers_cache()
+
+
+@receiver(post_save, sender=OfferDetail)
+def rebuild_detail_features(sender, instance, update_fields=None, **kwargs):
+    """
+    Re-index the detail's features (deleted details cascade to their rows).
+    """
+    if update_fields is not None and not {"features", "offer_type"} & set(update_fields):
+        return
+    OfferDetail.objects.filter(pk=instance.pk).rebuild_features()
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_on_offer_write(sender, instance, **kwargs):
+    mark_catalog_dirty(instance.pk)
+    invalidate_offers_cache()
+
+
+@receiver(post_init, sender=Offer)
+def remember_offer_image(sender, instance, **kwargs):
+    image = instance.__dict__.get("image")
+    instance._original_image = getattr(image, "name", image) or ""
+
+
+@receiver(post_save, sender=Offer)
+def process_changed_offer_image(sender, instance, created, **kwargs):
+    """
+    Build image variants for new and replaced images (and drop them when the
+    image is removed).
+    """
+    name = instance.image.name or ""
+    if name != instance._original_image or (created and name):
+        schedule_image_processing(instance.pk)
+    instance._original_image = name
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_on_user_rename(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Offer payloads embed user names; ignore saves that cannot change them
+    (e.g. last_login updates).
+    """
+    if created:
+        return
+    if update_fields is None or USER_DISPLAY_FIELDS & set(update_fields):
+        invalidate_offers_cache()
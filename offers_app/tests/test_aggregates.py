@@ -0,0 +1,107 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.apps import apps
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from offers_app.models import Offer, OfferDetail
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+def offer_payload():
+    return {
+        "title": "Offer",
+        "image": None,
+        "description": "Desc",
+        "details": [
+            {"title": "Basic", "revisions": 1, "delivery_time_in_days": 9,
+             "price": 150, "features": [], "offer_type": "basic"},
+            {"title": "Standard", "revisions": 2, "delivery_time_in_days": 4,
+             "price": 90, "features": [], "offer_type": "standard"},
+            {"title": "Premium", "revisions": 3, "delivery_time_in_days": 12,
+             "price": 300, "features": [], "offer_type": "premium"},
+        ],
+    }
+
+
+class OfferStoredAggregatesTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.owner = User.objects.create_user(username="owner", password="pw123456")
+        ensure_profile(self.owner, "business")
+        self.client.force_authenticate(user=self.owner)
+
+    def test_create_stores_min_values(self):
+        res = self.client.post("/api/offers/", offer_payload(), format="json")
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        offer = Offer.objects.get(pk=res.data["id"])
+        self.assertEqual(offer.min_price, Decimal("90.00"))
+        self.assertEqual(offer.min_delivery_time, 4)
+
+    def test_patch_details_updates_min_values(self):
+        res = self.client.post("/api/offers/", offer_payload(), format="json")
+        offer_id = res.data["id"]
+
+        payload = {"details": [{"offer_type": "basic", "price": "20.00", "delivery_time_in_days": 2}]}
+        res = self.client.patch(f"/api/offers/{offer_id}/", payload, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        offer = Offer.objects.get(pk=offer_id)
+        self.assertEqual(offer.min_price, Decimal("20.00"))
+        self.assertEqual(offer.min_delivery_time, 2)
+
+    def test_direct_detail_writes_keep_min_values_current(self):
+        offer = Offer.objects.create(user=self.owner, title="A", description="B")
+        cheap = OfferDetail.objects.create(
+            offer=offer, title="Basic", revisions=1, delivery_time_in_days=3,
+            price="10.00", features=[], offer_type="basic"
+        )
+        OfferDetail.objects.create(
+            offer=offer, title="Premium", revisions=1, delivery_time_in_days=8,
+            price="80.00", features=[], offer_type="premium"
+        )
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, Decimal("10.00"))
+        self.assertEqual(offer.min_delivery_time, 3)
+
+        cheap.delete()
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, Decimal("80.00"))
+        self.assertEqual(offer.min_delivery_time, 8)
+
+    def test_refresh_command_repairs_drifted_values(self):
+        res = self.client.post("/api/offers/", offer_payload(), format="json")
+        Offer.objects.filter(pk=res.data["id"]).update(min_price=0, min_delivery_time=0)
+
+        out = StringIO()
+        call_command("refresh_offer_aggregates", stdout=out)
+
+        offer = Offer.objects.get(pk=res.data["id"])
+        self.assertEqual(offer.min_price, Decimal("90.00"))
+        self.assertEqual(offer.min_delivery_time, 4)
+        self.assertIn("1 offer(s)", out.getvalue())
+
+    def test_list_filters_use_stored_columns(self):
+        self.client.post("/api/offers/", offer_payload(), format="json")
+
+        res = self.client.get("/api/offers/?min_price=90&max_delivery_time=4")
+        self.assertEqual(res.data["count"], 1)
+        self.assertEqual(res.data["results"][0]["min_price"], "90.00")
+
+        res = self.client.get("/api/offers/?min_price=91")
+        self.assertEqual(res.data["count"], 0)
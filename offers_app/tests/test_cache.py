@@ -0,0 +1,102 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.apps import apps
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from offers_app.models import Offer, OfferDetail
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+class OffersListCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.owner = User.objects.create_user(username="owner", password="pw123456")
+        ensure_profile(self.owner, "business")
+
+        self.offer = Offer.objects.create(user=self.owner, title="Logo", description="Desc")
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title="Basic", revisions=1, delivery_time_in_days=5,
+            price="100.00", features=[], offer_type="basic"
+        )
+
+    def test_repeated_request_is_served_from_cache(self):
+        first = self.client.get("/api/offers/?page_size=2&ordering=min_price")
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/offers/?ordering=min_price&page_size=2&utm=x")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+
+    def test_different_filters_use_different_entries(self):
+        self.client.get("/api/offers/?min_price=50")
+        res = self.client.get("/api/offers/?min_price=500")
+        self.assertEqual(res["X-Cache"], "MISS")
+        self.assertEqual(res.data["count"], 0)
+
+    def test_offer_patch_invalidates_cache(self):
+        self.client.get("/api/offers/")
+
+        self.client.force_authenticate(user=self.owner)
+        res = self.client.patch(f"/api/offers/{self.offer.id}/", {"title": "Renamed"}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get("/api/offers/")
+        self.assertEqual(res["X-Cache"], "MISS")
+        self.assertEqual(res.data["results"][0]["title"], "Renamed")
+
+    def test_detail_write_and_offer_delete_invalidate_cache(self):
+        self.client.get("/api/offers/")
+
+        self.detail.price = "40.00"
+        self.detail.save()
+        res = self.client.get("/api/offers/")
+        self.assertEqual(res["X-Cache"], "MISS")
+        self.assertEqual(res.data["results"][0]["min_price"], "40.00")
+
+        self.offer.delete()
+        res = self.client.get("/api/offers/")
+        self.assertEqual(res["X-Cache"], "MISS")
+        self.assertEqual(res.data["count"], 0)
+
+    def test_user_rename_invalidates_cache(self):
+        self.client.get("/api/offers/")
+
+        self.owner.first_name = "Max"
+        self.owner.save()
+        res = self.client.get("/api/offers/")
+        self.assertEqual(res.data["results"][0]["user_details"]["first_name"], "Max")
+
+    def test_cache_stats_admin_only_and_counts(self):
+        self.client.get("/api/offers/")
+        self.client.get("/api/offers/")
+
+        self.client.force_authenticate(user=self.owner)
+        res = self.client.get("/api/offers/cache-stats/")
+        self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+        admin = get_user_model().objects.create_superuser(username="admin", password="pw123456")
+        self.client.force_authenticate(user=admin)
+        res = self.client.get("/api/offers/cache-stats/")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["hits"], 1)
+        self.assertEqual(res.data["misses"], 1)
+
+    @override_settings(OFFERS_LIST_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables_cache(self):
+        self.client.get("/api/offers/")
+        res = self.client.get("/api/offers/")
+        self.assertNotIn("X-Cache", res)
@@ -0,0 +1,138 @@
+from datetime import timedelta
+from unittest import skipIf
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from offers_app.api.cache import bump_offers_version, get_offers_version
+from offers_app.catalog import np, offer_catalog
+from offers_app.models import Offer, OfferDetail
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+@skipIf(np is None, "numpy is not installed")
+@override_settings(OFFERS_LIST_CACHE_TIMEOUT=0, OFFERS_LIST_CATALOG=True)
+class OfferCatalogTests(TestCase):
+    def setUp(self):
+        offer_catalog.reset()
+        self.addCleanup(offer_catalog.reset)
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.biz1 = User.objects.create_user(username="biz1", password="pw123456")
+        ensure_profile(self.biz1, "business")
+        self.biz2 = User.objects.create_user(username="biz2", password="pw123456")
+        ensure_profile(self.biz2, "business")
+
+        now = timezone.now()
+        for i in range(8):
+            owner = self.biz1 if i % 2 else self.biz2
+            self.create_offer(owner, f"Offer {i}", price=100 + (i * 37) % 8 * 10, days=1 + i % 4)
+            # Distinct timestamps so both paths order without ties.
+            Offer.objects.filter(title=f"Offer {i}").update(
+                updated_at=now - timedelta(minutes=(i * 5) % 8)
+            )
+
+    def create_offer(self, owner, title, price, days):
+        offer = Offer.objects.create(user=owner, title=title, description="Beschreibung")
+        for offer_type, extra in [("basic", 0), ("standard", 1), ("premium", 2)]:
+            OfferDetail.objects.create(
+                offer=offer, title=offer_type, revisions=1, delivery_time_in_days=days + extra,
+                price=price + extra, features=["A"], offer_type=offer_type
+            )
+        return offer
+
+    def orm_ids(self, ordering, **filters):
+        tiebreak = "-id" if ordering.startswith("-") else "id"
+        queryset = Offer.objects.filter(**filters).order_by(ordering, tiebreak)
+        return list(queryset.values_list("id", flat=True))
+
+    def assert_same_as_database(self, params):
+        with override_settings(OFFERS_LIST_CATALOG=False):
+            expected = self.client.get("/api/offers/", params)
+        actual = self.client.get("/api/offers/", params)
+
+        self.assertEqual(actual.status_code, expected.status_code)
+        self.assertEqual(actual.content, expected.content)
+        return actual
+
+    def test_select_matches_orm_filters_and_ordering(self):
+        cases = [
+            ("-updated_at", {}, {}),
+            ("min_price", {"min_price": 150}, {"min_price__gte": 150}),
+            ("-min_price", {"max_delivery_time": 2}, {"min_delivery_time__lte": 2}),
+            (
+                "updated_at",
+                {"creator_id": self.biz1.id, "min_price": 120, "max_delivery_time": 3},
+                {"user_id": self.biz1.id, "min_price__gte": 120, "min_delivery_time__lte": 3},
+            ),
+        ]
+        for ordering, catalog_filters, orm_filters in cases:
+            with self.subTest(ordering=ordering, filters=catalog_filters):
+                self.assertEqual(
+                    offer_catalog.select(ordering, **catalog_filters).tolist(),
+                    self.orm_ids(ordering, **orm_filters),
+                )
+
+    def test_list_matches_database_path(self):
+        self.assert_same_as_database({})
+        self.assert_same_as_database({"page_size": 3, "page": 2})
+        self.assert_same_as_database({"ordering": "min_price", "creator_id": self.biz1.id})
+        self.assert_same_as_database({"ordering": "-min_price", "max_delivery_time": 2})
+        self.assert_same_as_database({"min_price": "140.5", "count": "false"})
+        self.assert_same_as_database({"creator_id": 999999})
+
+    def test_list_matches_database_path_without_fast_path(self):
+        with override_settings(OFFERS_LIST_FAST_PATH=False):
+            self.assert_same_as_database({"ordering": "min_price", "page_size": 2})
+
+    def test_list_fetches_only_the_page_rows(self):
+        self.client.get("/api/offers/")
+
+        # COUNT and the page query run on the catalog, leaving the row fetch.
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/offers/", {"page_size": 2})
+        self.assertEqual(response.json()["count"], 8)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_writes_are_patched_without_reload(self):
+        offer_catalog.select("-updated_at")
+        loaded_at = offer_catalog.loaded_at
+
+        created = self.create_offer(self.biz2, "Fresh", price=1, days=1)
+        cheapest = Offer.objects.exclude(pk=created.pk).order_by("min_price", "id").first()
+        OfferDetail.objects.filter(offer=cheapest).first().delete()
+        Offer.objects.filter(title="Offer 3").delete()
+
+        self.assertEqual(offer_catalog.select("min_price").tolist(), self.orm_ids("min_price"))
+        self.assertEqual(offer_catalog.select("-updated_at")[0], created.pk)
+        self.assertEqual(offer_catalog.loaded_at, loaded_at)
+
+    def test_writes_of_other_processes_reload_via_the_offers_version(self):
+        offer_catalog.select("-updated_at")
+        loaded_at = offer_catalog.loaded_at
+
+        # Another process writes: the shared version moves, nothing is marked dirty here.
+        Offer.objects.filter(title="Offer 5").update(min_price=1)
+        bump_offers_version()
+
+        self.assertEqual(offer_catalog.select("min_price").tolist(), self.orm_ids("min_price"))
+        self.assertNotEqual(offer_catalog.loaded_at, loaded_at)
+        self.assertEqual(offer_catalog.version, get_offers_version())
+
+    def test_search_cursor_and_invalid_filters_use_database(self):
+        self.assert_same_as_database({"search": "Offer"})
+        self.assert_same_as_database({"cursor": "", "page_size": 2})
+        response = self.assert_same_as_database({"min_price": "abc"})
+        self.assertEqual(response.status_code, 400)
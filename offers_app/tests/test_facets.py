@@ -0,0 +1,79 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from offers_app.models import Offer, OfferDetail
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+class OfferFacetsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.biz1 = User.objects.create_user(username="biz1", password="pw123456")
+        ensure_profile(self.biz1, "business")
+        self.biz2 = User.objects.create_user(username="biz2", password="pw123456")
+        ensure_profile(self.biz2, "business")
+
+        self.create_offer(self.biz1, "Logo design", price=40, days=1)
+        self.create_offer(self.biz1, "Logo animation", price=120, days=5)
+        self.create_offer(self.biz1, "Website", price=1500, days=20)
+        self.create_offer(self.biz2, "Flyer design", price=60, days=3)
+
+    def create_offer(self, owner, title, price, days):
+        offer = Offer.objects.create(user=owner, title=title, description="Beschreibung")
+        OfferDetail.objects.create(
+            offer=offer, title="Basic", revisions=1, delivery_time_in_days=days,
+            price=price, features=[], offer_type="basic"
+        )
+        return offer
+
+    def counts(self, facet):
+        return [bucket["count"] for bucket in facet]
+
+    def test_facets_count_all_offers_in_one_query(self):
+        with self.assertNumQueries(1):
+            res = self.client.get("/api/offers/facets/")
+
+        self.assertEqual(res.status_code, 200)
+        data = res.json()
+        self.assertEqual(data["count"], 4)
+        self.assertEqual(self.counts(data["price"]), [1, 1, 1, 0, 0, 1])
+        self.assertEqual(data["price"][0], {"from": None, "to": 50, "count": 1})
+        self.assertEqual(self.counts(data["delivery_time"]), [1, 1, 1, 0, 1])
+        self.assertEqual(
+            data["creators"],
+            [
+                {"creator_id": self.biz1.id, "username": "biz1", "count": 3},
+                {"creator_id": self.biz2.id, "username": "biz2", "count": 1},
+            ],
+        )
+
+    def test_facets_honor_filters_and_search(self):
+        data = self.client.get("/api/offers/facets/", {"search": "design", "min_price": 50}).json()
+
+        self.assertEqual(data["count"], 1)
+        self.assertEqual(self.counts(data["price"]), [0, 1, 0, 0, 0, 0])
+        self.assertEqual(data["creators"], [{"creator_id": self.biz2.id, "username": "biz2", "count": 1}])
+
+    def test_facets_are_cached_until_offers_change(self):
+        self.client.get("/api/offers/facets/", {"page": 2, "ordering": "min_price"})
+        with self.assertNumQueries(0):
+            self.client.get("/api/offers/facets/")
+
+        self.create_offer(self.biz2, "Poster", price=300, days=10)
+        data = self.client.get("/api/offers/facets/").json()
+        self.assertEqual(data["count"], 5)
+        self.assertEqual(self.counts(data["price"]), [1, 1, 1, 1, 0, 1])
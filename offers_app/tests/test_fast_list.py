@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.apps import apps
+from rest_framework.test import APIClient
+
+from offers_app.models import Offer, OfferDetail
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+@override_settings(OFFERS_LIST_CACHE_TIMEOUT=0)
+class OffersListFastPathTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.biz1 = User.objects.create_user(
+            username="biz1", password="pw123456", first_name="Ümit", last_name="O'Neil"
+        )
+        ensure_profile(self.biz1, "business")
+        self.biz2 = User.objects.create_user(username="biz2", password="pw123456")
+        ensure_profile(self.biz2, "business")
+
+        for i, (owner, image) in enumerate([
+            (self.biz1, "offers/logo.png"),
+            (self.biz2, None),
+            (self.biz1, "offers/mit leerzeichen.jpg"),
+            (self.biz2, ""),
+        ]):
+            offer = Offer.objects.create(
+                user=owner, title=f"Offer {i} \"quoted\"", description="Beschreibung", image=image
+            )
+            for offer_type, price in [("basic", 99.5 + i), ("standard", 150), ("premium", 1234.56)]:
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1, delivery_time_in_days=3 + i,
+                    price=price, features=["A"], offer_type=offer_type
+                )
+
+        Offer.objects.create(user=self.biz2, title="Without details", description="-")
+
+    def assert_same_bytes(self, params):
+        with override_settings(OFFERS_LIST_FAST_PATH=False):
+            expected = self.client.get("/api/offers/", params)
+        actual = self.client.get("/api/offers/", params)
+
+        self.assertEqual(actual.status_code, expected.status_code)
+        self.assertEqual(actual.content, expected.content)
+        return actual
+
+    def test_output_matches_serializer_byte_for_byte(self):
+        self.assert_same_bytes({})
+        self.assert_same_bytes({"page_size": 3, "page": 2})
+        self.assert_same_bytes({"ordering": "min_price", "creator_id": self.biz1.id})
+        self.assert_same_bytes({"search": "offer", "ordering": "rank"})
+        self.assert_same_bytes({"cursor": "", "page_size": 2})
+        self.assert_same_bytes({"count": "false", "max_delivery_time": 4})
+
+    def test_list_runs_count_and_one_page_query(self):
+        with self.assertNumQueries(2):
+            res = self.client.get("/api/offers/", {"page_size": 3})
+        self.assertEqual(len(res.data["results"]), 3)
+
+        with self.assertNumQueries(1):
+            self.client.get("/api/offers/", {"cursor": "", "page_size": 3})
@@ -0,0 +1,136 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from offers_app.models import Offer, OfferDetail, OfferFeature
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+class OfferFeatureIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.owner = User.objects.create_user(username="owner", password="pw123456")
+        ensure_profile(self.owner, "business")
+
+        self.logo = self.create_offer("Logo", {
+            "basic": ["Logo Design"],
+            "standard": ["Logo design", "Source files"],
+            "premium": ["Logo design", "Source files", "Print ready"],
+        })
+        self.flyer = self.create_offer("Flyer", {
+            "basic": ["Print ready"],
+            "standard": ["Print ready"],
+            "premium": ["Print  READY", "Source files"],
+        })
+        self.empty = self.create_offer("Empty", {"basic": [], "standard": [], "premium": []})
+
+    def create_offer(self, title, features):
+        offer = Offer.objects.create(user=self.owner, title=title, description="Desc")
+        for offer_type, names in features.items():
+            OfferDetail.objects.create(
+                offer=offer, title=offer_type, revisions=1, delivery_time_in_days=3,
+                price=100, features=names, offer_type=offer_type
+            )
+        return offer
+
+    def result_ids(self, params):
+        res = self.client.get("/api/offers/", params)
+        self.assertEqual(res.status_code, 200)
+        return sorted(offer["id"] for offer in res.json()["results"])
+
+    def test_index_rows_follow_detail_writes(self):
+        detail = self.logo.details.get(offer_type="basic")
+        self.assertEqual(
+            list(detail.feature_index.values_list("key", "name")), [("logo design", "Logo Design")]
+        )
+
+        detail.features = ["Logo design", "logo  DESIGN", "Revisions"]
+        detail.save()
+        self.assertEqual(
+            sorted(detail.feature_index.values_list("key", flat=True)), ["logo design", "revisions"]
+        )
+
+        detail.delete()
+        self.assertFalse(OfferFeature.objects.filter(detail_id=detail.id).exists())
+
+    def test_offers_created_through_the_api_are_indexed(self):
+        self.client.force_authenticate(user=self.owner)
+        details = [
+            {"title": offer_type, "revisions": 1, "delivery_time_in_days": 3, "price": 100,
+             "features": features, "offer_type": offer_type}
+            for offer_type, features in [
+                ("basic", ["Logo"]), ("standard", ["Logo", "Mockup"]), ("premium", ["Mockup"]),
+            ]
+        ]
+        res = self.client.post(
+            "/api/offers/", {"title": "API", "description": "Desc", "details": details}, format="json"
+        )
+        self.assertEqual(res.status_code, 201)
+
+        self.assertEqual(self.result_ids({"feature": "logo"}), [res.data["id"]])
+        self.assertEqual(
+            self.result_ids({"feature": "mockup", "feature_tier": "premium"}), [res.data["id"]]
+        )
+        self.assertIn(
+            {"feature": "Logo", "offers": 1}, self.client.get("/api/offers/top-features/").json()
+        )
+
+    def test_feature_filter_is_case_insensitive_and_tier_aware(self):
+        self.assertEqual(self.result_ids({"feature": "print ready"}), [self.logo.id, self.flyer.id])
+        self.assertEqual(self.result_ids({"feature": "LOGO DESIGN"}), [self.logo.id])
+        self.assertEqual(
+            self.result_ids({"feature": "Print ready", "feature_tier": "basic"}), [self.flyer.id]
+        )
+        self.assertEqual(self.result_ids({"feature": "Unknown"}), [])
+        self.assertEqual(self.result_ids({"feature_tier": "basic"}), sorted(
+            [self.logo.id, self.flyer.id, self.empty.id]
+        ))
+
+    def test_feature_filter_uses_the_index(self):
+        queryset = Offer.objects.filter(
+            pk__in=OfferFeature.objects.filter(key="print ready", offer_type="premium").values("offer_id")
+        )
+        self.assertIn("offer_feature_lookup_idx", queryset.explain())
+
+    def test_top_features(self):
+        res = self.client.get("/api/offers/top-features/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), [
+            {"feature": "Print  READY", "offers": 2},
+            {"feature": "Source files", "offers": 2},
+            {"feature": "Logo Design", "offers": 1},
+        ])
+
+        res = self.client.get("/api/offers/top-features/", {"offer_type": "basic", "limit": 1})
+        self.assertEqual(res.json(), [{"feature": "Logo Design", "offers": 1}])
+
+    def test_top_features_are_invalidated_by_detail_writes(self):
+        self.client.get("/api/offers/top-features/")
+        with self.assertNumQueries(0):
+            self.client.get("/api/offers/top-features/")
+
+        detail = self.empty.details.get(offer_type="basic")
+        detail.features = ["Logo design"]
+        detail.save()
+
+        res = self.client.get("/api/offers/top-features/", {"limit": 1})
+        self.assertEqual(res.json(), [{"feature": "Logo Design", "offers": 2}])
+
+    def test_top_features_rejects_invalid_params(self):
+        self.assertEqual(self.client.get("/api/offers/top-features/", {"limit": "x"}).status_code, 400)
+        self.assertEqual(
+            self.client.get("/api/offers/top-features/", {"offer_type": "gold"}).status_code, 400
+        )
@@ -0,0 +1,136 @@
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from offers_app.images import process_offer_image
+from offers_app.models import Offer, OfferDetail
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+def make_jpeg(name="photo.jpg", size=(2000, 1000)):
+    exif = Image.Exif()
+    exif[0x010F] = "CameraMaker"
+    buffer = BytesIO()
+    Image.new("RGB", size, "red").save(buffer, format="JPEG", exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+@override_settings(OFFERS_LIST_CACHE_TIMEOUT=0, OFFER_IMAGE_VARIANTS_ASYNC=False)
+class OfferImageVariantTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.client = APIClient()
+        User = get_user_model()
+        self.owner = User.objects.create_user(username="owner", password="pw123456")
+        ensure_profile(self.owner, "business")
+
+    def create_offer(self, image):
+        with self.captureOnCommitCallbacks(execute=True):
+            offer = Offer.objects.create(user=self.owner, title="A", description="B", image=image)
+            OfferDetail.objects.create(
+                offer=offer, title="Basic", revisions=1, delivery_time_in_days=3,
+                price=100, features=[], offer_type="basic"
+            )
+        offer.refresh_from_db()
+        return offer
+
+    def test_upload_builds_resized_variants_without_metadata(self):
+        offer = self.create_offer(make_jpeg())
+
+        for field, width in [("image_small", 480), ("image_large", 1280)]:
+            with self.subTest(field=field):
+                variant = getattr(offer, field)
+                self.assertTrue(variant.name.endswith(".webp"))
+                with variant.open("rb"), Image.open(variant) as image:
+                    self.assertEqual(image.format, "WEBP")
+                    self.assertEqual(image.size, (width, width // 2))
+                    self.assertEqual(len(image.getexif()), 0)
+
+    def test_small_images_are_not_upscaled(self):
+        offer = self.create_offer(make_jpeg(size=(300, 200)))
+
+        with offer.image_large.open("rb"), Image.open(offer.image_large) as image:
+            self.assertEqual(image.size, (300, 200))
+
+    def test_list_uses_small_and_retrieve_large_variant(self):
+        offer = self.create_offer(make_jpeg())
+
+        listed = self.client.get("/api/offers/").json()["results"][0]["image"]
+        with override_settings(OFFERS_LIST_FAST_PATH=False):
+            serialized = self.client.get("/api/offers/").json()["results"][0]["image"]
+        self.client.force_authenticate(user=self.owner)
+        retrieved = self.client.get(f"/api/offers/{offer.id}/").json()["image"]
+
+        self.assertTrue(listed.endswith(offer.image_small.url))
+        self.assertEqual(serialized, listed)
+        self.assertTrue(retrieved.endswith(offer.image_large.url))
+
+    def test_original_is_used_until_variants_exist(self):
+        offer = Offer.objects.create(user=self.owner, title="A", description="B", image="offers/x.png")
+
+        listed = self.client.get("/api/offers/").json()["results"][0]["image"]
+        self.assertTrue(listed.endswith("/media/offers/x.png"))
+        self.assertEqual(offer.image_small.name, None)
+
+    def test_replacing_and_removing_the_image_rebuilds_variants(self):
+        offer = self.create_offer(make_jpeg())
+        old_small = offer.image_small.name
+
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.image = make_jpeg("other.jpg", size=(800, 800))
+            offer.save()
+        offer.refresh_from_db()
+        self.assertIn("other", offer.image_small.name)
+        self.assertFalse(offer.image_small.storage.exists(old_small))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            offer.image = None
+            offer.save()
+        offer.refresh_from_db()
+        self.assertFalse(offer.image_small)
+        self.assertFalse(offer.image_large)
+
+    def test_saving_without_image_change_does_not_reprocess(self):
+        offer = self.create_offer(make_jpeg())
+
+        with mock.patch("offers_app.signals.schedule_image_processing") as schedule:
+            offer.title = "Renamed"
+            offer.save()
+        schedule.assert_not_called()
+
+    def test_backfill_command_processes_offers_without_variants(self):
+        with self.captureOnCommitCallbacks():
+            offer = Offer.objects.create(
+                user=self.owner, title="A", description="B", image=make_jpeg()
+            )
+        Offer.objects.create(user=self.owner, title="No image", description="B")
+
+        out = StringIO()
+        call_command("process_offer_images", stdout=out)
+
+        offer.refresh_from_db()
+        self.assertTrue(offer.image_small)
+        self.assertIn("Processed images of 1 offer(s), 0 failed.", out.getvalue())
+        self.assertFalse(process_offer_image(offer.id + 100))
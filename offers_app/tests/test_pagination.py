@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from django.test import TestCase
+from django.apps import apps
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from offers_app.models import Offer, OfferDetail
+
+
+def ensure_profile(user, profile_type: str):
+    Profile = apps.get_model("profiles_app", "Profile")
+    profile, created = Profile.objects.get_or_create(user=user, defaults={"type": profile_type})
+    if not created and getattr(profile, "type", None) != profile_type:
+        profile.type = profile_type
+        profile.save()
+    return profile
+
+
+def make_offer(owner, title, price):
+    offer = Offer.objects.create(user=owner, title=title, description="Desc", image=None)
+    OfferDetail.objects.create(
+        offer=offer, title="Basic", revisions=1, delivery_time_in_days=5,
+        price=price, features=[], offer_type="basic"
+    )
+    return offer
+
+
+class OfferPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.biz = User.objects.create_user(username="biz", password="pw123456")
+        ensure_profile(self.biz, "business")
+
+        # Two pairs share a min_price to exercise the id tie-breaker.
+        self.offers = [
+            make_offer(self.biz, f"Offer {i}", price)
+            for i, price in enumerate([50, 20, 50, 20, 80, 10, 30])
+        ]
+
+    def collect(self, url, params):
+        ids = []
+        res = self.client.get(url, params)
+        while True:
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertNotIn("count", res.data)
+            ids += [item["id"] for item in res.data["results"]]
+            if not res.data["next"]:
+                return ids, res
+            res = self.client.get(res.data["next"])
+
+    def test_cursor_mode_walks_all_offers_by_updated_at(self):
+        ids, _ = self.collect("/api/offers/", {"cursor": "", "page_size": 2})
+        expected = list(
+            Offer.objects.order_by("-updated_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(ids, expected)
+
+    def test_cursor_keeps_microsecond_precision(self):
+        base = timezone.now().replace(microsecond=500)
+        for offset, offer in enumerate(self.offers):
+            Offer.objects.filter(pk=offer.pk).update(updated_at=base + timedelta(microseconds=offset))
+
+        ids, _ = self.collect("/api/offers/", {"cursor": "", "page_size": 2})
+        self.assertEqual(ids, [offer.id for offer in reversed(self.offers)])
+
+    def test_cursor_mode_walks_all_offers_by_min_price_with_ties(self):
+        ids, _ = self.collect("/api/offers/", {"cursor": "", "page_size": 3, "ordering": "min_price"})
+        expected = list(Offer.objects.order_by("min_price", "id").values_list("id", flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_cursor_previous_link_returns_preceding_page(self):
+        first = self.client.get("/api/offers/", {"cursor": "", "page_size": 3, "ordering": "min_price"})
+        self.assertIsNone(first.data["previous"])
+
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [item["id"] for item in back.data["results"]],
+            [item["id"] for item in first.data["results"]],
+        )
+
+    def test_cursor_mode_rejects_unsupported_ordering(self):
+        res = self.client.get("/api/offers/", {"cursor": "", "search": "offer", "ordering": "rank"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_cursor_returns_404(self):
+        res = self.client.get("/api/offers/", {"cursor": "not-a-cursor"})
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_count_false_keeps_shape_without_count(self):
+        res = self.client.get("/api/offers/", {"count": "false", "page_size": 3, "page": 2})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsNone(res.data["count"])
+        self.assertEqual(len(res.data["results"]), 3)
+        self.assertIn("page=3", res.data["next"])
+        self.assertNotIn("page=", res.data["previous"])
+
+        last = self.client.get(res.data["next"])
+        self.assertEqual(len(last.data["results"]), 1)
+        self.assertIsNone(last.data["next"])
+
+    def test_default_mode_still_counts(self):
+        res = self.client.get("/api/offers/", {"page_size": 3})
+        self.assertEqual(res.data["count"], 7)
@@ -92,3 +92,46 @@ class OfferSearchFilterTests(TestCase):
         res = self.client.get(url)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(len(res.data["results"]), 2)
+
+
+class OfferFullTextSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        User = get_user_model()
+
+        self.biz = User.objects.create_user(username="biz", password="pw123456")
+        ensure_profile(self.biz, "business")
+
+        self.website = make_offer(self.biz, "Website Design", "Responsive Website und Shop", prices=(100, 200, 500), delivery=(7, 10, 14))
+        self.logo = make_offer(self.biz, "Logo Paket", "Logo Design fuer Websites", prices=(50, 120, 300), delivery=(5, 7, 10))
+
+    def search_ids(self, query):
+        res = self.client.get("/api/offers/", {"search": query, "page_size": 3})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [item["id"] for item in res.data["results"]]
+
+    def test_search_matches_substrings_and_requires_all_terms(self):
+        self.assertEqual(set(self.search_ids("ebsit")), {self.website.id, self.logo.id})
+        self.assertEqual(self.search_ids("website shop"), [self.website.id])
+
+    def test_index_follows_offer_updates_and_deletes(self):
+        self.website.title = "Podcast Schnitt"
+        self.website.description = "Audio"
+        self.website.save()
+        self.assertEqual(self.search_ids("podcast"), [self.website.id])
+        self.assertEqual(self.search_ids("responsive"), [])
+
+        self.website.delete()
+        self.assertEqual(self.search_ids("podcast"), [])
+
+    def test_ordering_by_rank_puts_best_match_first(self):
+        res = self.client.get("/api/offers/", {"search": "logo", "ordering": "rank"})
+        self.assertEqual(res.data["results"][0]["id"], self.logo.id)
+
+    def test_rank_ordering_without_search_uses_default_ordering(self):
+        res = self.client.get("/api/offers/", {"ordering": "rank"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["results"][0]["id"], self.logo.id)
+
+    def test_short_terms_fall_back_to_like_search(self):
+        self.assertEqual(self.search_ids("sh"), [self.website.id])
@@ -65,3 +65,28 @@ class OfferViewsTests(TestCase):
 
         res = self.client.post(url, {"x": 1}, format="json")
         self.assertEqual(res.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+    def test_list_expand_details_embeds_full_details(self):
+        with self.assertNumQueries(3):
+            res = self.client.get("/api/offers/", {"expand": "details"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        details = res.data["results"][0]["details"]
+        self.assertEqual(len(details), 3)
+        basic = next(d for d in details if d["offer_type"] == "basic")
+        self.assertEqual(basic["price"], "100.00")
+        self.assertEqual(basic["features"], ["A"])
+        self.assertNotIn("url", basic)
+
+    def test_list_without_expand_keeps_links(self):
+        res = self.client.get("/api/offers/")
+        self.assertEqual(set(res.data["results"][0]["details"][0]), {"id", "url"})
+
+    def test_retrieve_expand_details_matches_offerdetail_endpoint(self):
+        self.client.force_authenticate(user=self.viewer)
+        res = self.client.get(f"/api/offers/{self.offer.id}/", {"expand": "details"})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        for item in res.data["details"]:
+            single = self.client.get(f"/api/offerdetails/{item['id']}/")
+            self.assertEqual(item, single.data)
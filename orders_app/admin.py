@@ -1,9 +1,16 @@
 from django.contrib import admin
-from .models import Order
+from .models import ArchivedOrder, Order
 
 # Register your models here.
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
     list_display = ("id", "title", "customer_user", "business_user", "status", "created_at")
     list_filter = ("status", "created_at")
-    search_fields = ("title", "customer_user__username", "business_user__username")
\ No newline at end of file
+    search_fields = ("title", "customer_user__username", "business_user__username")
+
+
+@admin.register(ArchivedOrder)
+class ArchivedOrderAdmin(admin.ModelAdmin):
+    list_display = ("id", "title", "customer_user", "business_user", "status", "archived_at")
+    list_filter = ("status", "archived_at")
+    search_fields = ("title", "customer_user__username", "business_user__username")
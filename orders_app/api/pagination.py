@@ -0,0 +1,46 @@
+"""
+Pagination configuration for the orders list.
+
+The list stays a plain array unless the client opts in with `cursor` or
+`page_size`; then it is keyset-paginated on (created_at, id), newest first.
+
+Query params:
+- cursor: pass it empty for the first page, then follow the `next`/`previous` links
+- page_size: int (bounded by max_page_size)
+
+The hot orders come first: after their last page, `next` continues with the
+first page of the archived orders (`history=true`).
+"""
+
+from rest_framework.utils.urls import replace_query_param
+
+from core.api.pagination import KeysetPagination
+
+
+class OrdersCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for orders ({"next", "previous", "results"}).
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering_fields = ("created_at",)
+    default_ordering = ("-created_at",)
+    history_query_param = "history"
+    opt_in = True
+
+    def get_next_link(self):
+        link = super().get_next_link()
+        if link is None and not self.reverse and self.continues_in_archive():
+            url = replace_query_param(self.base_url, self.history_query_param, "true")
+            return replace_query_param(url, self.cursor_query_param, "")
+        return link
+
+    def continues_in_archive(self):
+        view = self.view
+        return (
+            view is not None
+            and not view.wants_history()
+            and view.has_archived_orders()
+        )
@@ -0,0 +1,87 @@
+"""
+Revenue of a business user over time, read from the RevenueRollup rows only.
+
+Query params:
+- period: day (default) | week | month
+- start, end: YYYY-MM-DD, inclusive bounds on the completion day
+- offer_type: basic|standard|premium
+"""
+
+from django.db.models import F, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from offers_app.models import OfferDetail
+from orders_app.models import RevenueRollup
+
+PERIODS = {
+    "day": None,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+
+
+def parse_revenue_params(query_params):
+    """
+    Validate the query params; returns (period, start, end, offer_type).
+    """
+    period = query_params.get("period") or "day"
+    if period not in PERIODS:
+        raise ValidationError({"period": "Must be one of day, week, month."})
+
+    bounds = []
+    for name in ("start", "end"):
+        value = query_params.get(name) or None
+        try:
+            day = parse_date(value) if value else None
+        except ValueError:
+            day = None
+        if value and day is None:
+            raise ValidationError({name: "Must be a date (YYYY-MM-DD)."})
+        bounds.append(day)
+
+    offer_type = query_params.get("offer_type") or None
+    if offer_type is not None and offer_type not in dict(OfferDetail.OFFER_TYPE_CHOICES):
+        raise ValidationError({"offer_type": "Must be one of basic, standard, premium."})
+    return period, bounds[0], bounds[1], offer_type
+
+
+def compute_revenue(business_user_id, period="day", start=None, end=None, offer_type=None):
+    """
+    Return revenue and completed order counts per period and offer type
+    (oldest first) plus the totals.
+    """
+    rollups = RevenueRollup.objects.filter(business_user_id=business_user_id, completed_orders__gt=0)
+    if start:
+        rollups = rollups.filter(day__gte=start)
+    if end:
+        rollups = rollups.filter(day__lte=end)
+    if offer_type:
+        rollups = rollups.filter(offer_type=offer_type)
+
+    trunc = PERIODS[period]
+    rows = list(
+        rollups.values("offer_type", period_start=trunc("day") if trunc else F("day"))
+        .annotate(revenue=Sum("revenue"), completed_orders=Sum("completed_orders"))
+        .order_by("period_start", "offer_type")
+    )
+
+    results = [
+        {
+            "period_start": row["period_start"].isoformat(),
+            "offer_type": row["offer_type"],
+            "revenue": f"{row['revenue']:.2f}",
+            "completed_orders": row["completed_orders"],
+        }
+        for row in rows
+    ]
+    revenue = sum((row["revenue"] for row in rows), 0)
+    return {
+        "period": period,
+        "results": results,
+        "total": {
+            "revenue": f"{revenue:.2f}",
+            "completed_orders": sum(row["completed_orders"] for row in rows),
+        },
+    }
@@ -3,8 +3,10 @@ Serializers for orders API:
 - Create flow based on OfferDetail snapshotting into Order
 - List output
 - Patch status only
+- Bulk status changes
 """
 
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers
 
@@ -89,10 +91,12 @@ class OrderCreateSerializer(serializers.Serializer):
 
     Behavior:
         - Copies (snapshots) OfferDetail fields into the Order at creation time.
+        - The business user's order counter is incremented in the same transaction.
     """
 
     offer_detail_id = serializers.IntegerField()
 
+    @transaction.atomic
     def create(self, validated_data):
         request = self.context["request"]
         offer_detail = get_object_or_404(
@@ -123,3 +127,24 @@ class OrderStatusPatchSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
         fields = ["status"]
+
+
+class OrderBulkStatusSerializer(serializers.Serializer):
+    """
+    Input of the bulk status action: order ids and the target status.
+    """
+
+    MAX_IDS = 100
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_IDS,
+    )
+    status = serializers.ChoiceField(choices=Order.Status.choices)
+
+    def validate_ids(self, value):
+        """
+        Drop duplicates, keep the request order.
+        """
+        return list(dict.fromkeys(value))
@@ -1,26 +1,52 @@
 """
 Orders endpoints:
 - list: authenticated, returns orders where user is customer or business
+  (`role=customer|business` narrows it to one side, `cursor`/`page_size`
+  enable keyset pagination, `history=true` lists archived orders,
+  `overdue=true`/`due_before=` filter by due date)
 - create: authenticated + customer, creates order from OfferDetail snapshot
+  (honors the `Idempotency-Key` header)
+- retrieve: authenticated, `ETag` header with the order version
 - partial_update: authenticated + business + business owner, status-only patch
+  (conditional on the current status, optional `If-Match`)
+- bulk_status: authenticated + business, one status change for many own orders
+- export: authenticated, streams all own orders (incl. archived) as CSV/NDJSON
+- revenue: authenticated + business, own revenue per day/week/month (rollups)
+- workload: authenticated + business, own in-progress orders due per day
 - destroy: admin-only
 
 Additional endpoints (APIView):
 - OrderCountView: count IN_PROGRESS orders for a business user
 - CompletedOrderCountView: count COMPLETED orders for a business user
+- OrderStatsView: all status counts for many business users at once
+
+All counts are read from the materialized BusinessOrderCounter rows.
 """
 
-from django.contrib.auth.models import User
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.http import parse_etags
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from orders_app.models import Order
+from core.api.idempotency import idempotent
+from core.api.params import parse_id_list
+from core.api.querysets import MergedQuerySet
+from orders_app.models import ArchivedOrder, BusinessOrderCounter, Order, RevenueRollup
+from .export import EXPORT_FORMATS, export_response
+from .pagination import OrdersCursorPagination
+from .revenue import compute_revenue, parse_revenue_params
+from .workload import compute_workload, due_filter, parse_workload_days
 from .permissions import IsBusinessUser, IsCustomerUser, IsOrderBusinessOwner
 from .serializers import (
+    OrderBulkStatusSerializer,
     OrderCreateResponseSerializer,
     OrderCreateSerializer,
     OrderListSerializer,
@@ -40,22 +66,62 @@ class OrdersViewSet(viewsets.ModelViewSet):
     """
 
     queryset = Order.objects.all()
+    pagination_class = OrdersCursorPagination
+
+    ROLE_FIELDS = {
+        "customer": "customer_user",
+        "business": "business_user",
+    }
 
     def get_queryset(self):
         """
         For list: return orders where the user is either customer or business.
         Otherwise: fall back to the base queryset.
+
+        The list avoids `customer_user = u OR business_user = u` (which cannot
+        use the per-side indexes): each side is its own index-backed query and
+        the results are merged by (created_at, id).
+
+        The list reads the hot Order table; `history=true` lists the archived
+        orders instead (see orders_app.archive). `overdue=true` and
+        `due_before=` filter on the stored due_at.
         """
         user = self.request.user
 
         if self.action == "list":
-            return (
-                Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
-                .order_by("-created_at")
+            model = ArchivedOrder if self.wants_history() else Order
+            due = due_filter(self.request.query_params)
+            return MergedQuerySet(
+                model.objects.filter(due, **{field: user}).order_by("-created_at", "-id")
+                for field in self.get_list_sides()
             )
 
         return Order.objects.all()
 
+    def wants_history(self):
+        return self.request.query_params.get("history", "").lower() in ("1", "true")
+
+    def has_archived_orders(self):
+        """
+        Return True if the list would have rows with `history=true`.
+        """
+        user = self.request.user
+        return any(
+            ArchivedOrder.objects.filter(**{field: user}).exists()
+            for field in self.get_list_sides()
+        )
+
+    def get_list_sides(self):
+        """
+        Order fields to list by, from the optional `role` query param.
+        """
+        role = self.request.query_params.get("role")
+        if not role:
+            return list(self.ROLE_FIELDS.values())
+        if role not in self.ROLE_FIELDS:
+            raise ValidationError({"role": "Must be 'customer' or 'business'."})
+        return [self.ROLE_FIELDS[role]]
+
     def get_permissions(self):
         """
         Permissions by action:
@@ -73,6 +139,9 @@ class OrdersViewSet(viewsets.ModelViewSet):
         if self.action in ["partial_update", "update"]:
             return [IsAuthenticated(), IsBusinessUser(), IsOrderBusinessOwner()]
 
+        if self.action in ["bulk_status", "revenue", "workload"]:
+            return [IsAuthenticated(), IsBusinessUser()]
+
         if self.action == "destroy":
             return [IsAuthenticated(), IsAdminUser()]
 
@@ -86,11 +155,16 @@ class OrdersViewSet(viewsets.ModelViewSet):
             return OrderCreateSerializer
         if self.action in ["partial_update", "update"]:
             return OrderStatusPatchSerializer
+        if self.action == "bulk_status":
+            return OrderBulkStatusSerializer
         return OrderListSerializer
 
+    @idempotent("orders:create")
     def create(self, request, *args, **kwargs):
         """
         Create an order by snapshotting fields from an OfferDetail.
+
+        Retries with the same `Idempotency-Key` header replay the first response.
         """
         serializer = OrderCreateSerializer(data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
@@ -101,11 +175,32 @@ class OrdersViewSet(viewsets.ModelViewSet):
             status=status.HTTP_201_CREATED,
         )
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Return one order; the `ETag` header carries its version for If-Match.
+        """
+        order = self.get_object()
+        return Response(
+            OrderListSerializer(order, context={"request": request}).data,
+            status=status.HTTP_200_OK,
+            headers={"ETag": order.etag},
+        )
+
+    @transaction.atomic
     def partial_update(self, request, *args, **kwargs):
         """
         Status-only patch for business owner.
 
-        Rejects any fields other than 'status'.
+        Rejects any fields other than 'status'. The change must be allowed by
+        Order.STATUS_TRANSITIONS (409 otherwise) and is written with one
+        conditional UPDATE (WHERE status/version are still the loaded ones),
+        so concurrent patches cannot overwrite each other: the loser gets
+        409, or 412 if it sent `If-Match`. An `If-Match` that does not match
+        the current ETag is rejected with 412 before writing.
+
+        The order, the business user's counters and revenue rollups are
+        updated in one transaction; the response is built from the written
+        values.
         """
         allowed_keys = {"status"}
         extra_keys = set(request.data.keys()) - allowed_keys
@@ -120,16 +215,186 @@ class OrdersViewSet(viewsets.ModelViewSet):
 
         serializer = OrderStatusPatchSerializer(order, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
 
-        order.refresh_from_db(fields=["updated_at", "status"])
+        if_match = request.headers.get("If-Match")
+        if if_match is not None and not self.etag_matches(order, if_match):
+            return self.precondition_failed(order)
+
+        source = order.status
+        target = serializer.validated_data.get("status", source)
+        if target != source:
+            if not Order.can_transition(source, target):
+                return Response(
+                    {"detail": f"Cannot change the status from '{source}' to '{target}'."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+            now = timezone.now()
+            completed_at = now if target == Order.Status.COMPLETED else None
+            updated = Order.objects.filter(pk=order.pk, status=source, version=order.version).update(
+                status=target, version=F("version") + 1, updated_at=now, completed_at=completed_at
+            )
+            if not updated:
+                current = Order.objects.filter(pk=order.pk).first()
+                if if_match is not None and current is not None:
+                    return self.precondition_failed(current)
+                return Response(
+                    {"detail": "The order was changed by another request."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+            # QuerySet.update() sends no signals.
+            BusinessOrderCounter.objects.adjust(order.business_user_id, source, -1)
+            BusinessOrderCounter.objects.adjust(order.business_user_id, target, 1)
+            if target == Order.Status.COMPLETED:
+                RevenueRollup.objects.add_orders(
+                    order.business_user_id, [(completed_at, order.offer_type, order.price)]
+                )
+            order.status, order.version, order.updated_at = target, order.version + 1, now
+            order.completed_at = completed_at
 
         return Response(
             OrderUpdateResponseSerializer(order, context={"request": request}).data,
             status=status.HTTP_200_OK,
+            headers={"ETag": order.etag},
+        )
+
+    @staticmethod
+    def etag_matches(order, if_match):
+        etags = parse_etags(if_match)
+        return "*" in etags or order.etag in etags
+
+    @staticmethod
+    def precondition_failed(order):
+        return Response(
+            {"detail": "The order does not match If-Match."},
+            status=status.HTTP_412_PRECONDITION_FAILED,
+            headers={"ETag": order.etag},
+        )
+
+    def perform_content_negotiation(self, request, force=False):
+        # The export picks its format from `export_format`, not from Accept.
+        return super().perform_content_negotiation(request, force=force or self.action == "export")
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request, *args, **kwargs):
+        """
+        Stream every order of the user (hot and archived, oldest first),
+        scoped like the list (`role`), as `export_format=csv|ndjson`.
+
+        Gzip-compressed on the fly if the client sends `Accept-Encoding: gzip`.
+        """
+        export_format = request.query_params.get("export_format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError({"export_format": "Must be 'csv' or 'ndjson'."})
+
+        return export_response(request, request.user, self.get_list_sides(), export_format)
+
+    @action(detail=False, methods=["get"], url_path="revenue")
+    def revenue(self, request, *args, **kwargs):
+        """
+        Revenue of the requesting business user's completed orders per
+        `period` (day|week|month) and offer type, optionally limited by
+        `start`/`end` (order day) and `offer_type`.
+
+        Reads only the RevenueRollup rows (no scan over the orders).
+        """
+        period, start, end, offer_type = parse_revenue_params(request.query_params)
+        data = compute_revenue(request.user.id, period, start, end, offer_type)
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="workload")
+    def workload(self, request, *args, **kwargs):
+        """
+        Histogram of the requesting business user's in-progress orders:
+        {"overdue": int, "days": [{"date", "due"}, ...]} for the next `days`
+        days (default 14).
+        """
+        data = compute_workload(request.user.id, parse_workload_days(request.query_params))
+        return Response(data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request, *args, **kwargs):
+        """
+        Move many orders of the requesting business user to one status.
+
+        Body: {"ids": [int, ...], "status": str}
+
+        All allowed changes are applied with one UPDATE scoped to the user's
+        orders (Order.STATUS_TRANSITIONS decides what is allowed); the
+        business counters and revenue rollups are adjusted in the same
+        transaction.
+
+        Returns:
+            {"status", "updated": int, "results": [{"id", "result"}, ...]} in
+            request order, result is "updated", "not_owned" (also unknown ids)
+            or "invalid_transition".
+        """
+        serializer = OrderBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+        target = serializer.validated_data["status"]
+
+        with transaction.atomic():
+            current = {
+                row["id"]: row
+                for row in Order.objects.select_for_update()
+                .filter(pk__in=ids, business_user=request.user)
+                .values("id", "status", "offer_type", "price")
+            }
+            updatable = [
+                pk for pk, row in current.items()
+                if Order.can_transition(row["status"], target)
+            ]
+            if updatable:
+                now = timezone.now()
+                completed_at = now if target == Order.Status.COMPLETED else None
+                Order.objects.filter(pk__in=updatable, business_user=request.user).update(
+                    status=target, version=F("version") + 1, updated_at=now,
+                    completed_at=completed_at,
+                )
+
+                moved = Counter(current[pk]["status"] for pk in updatable)
+                for source, count in moved.items():
+                    BusinessOrderCounter.objects.adjust(request.user.id, source, -count)
+                BusinessOrderCounter.objects.adjust(request.user.id, target, len(updatable))
+
+                if target == Order.Status.COMPLETED:
+                    RevenueRollup.objects.add_orders(
+                        request.user.id,
+                        [(completed_at, current[pk]["offer_type"], current[pk]["price"])
+                         for pk in updatable],
+                    )
+
+        updated = set(updatable)
+        results = []
+        for pk in ids:
+            if pk not in current:
+                result = "not_owned"
+            elif pk in updated:
+                result = "updated"
+            else:
+                result = "invalid_transition"
+            results.append({"id": pk, "result": result})
+
+        return Response(
+            {"status": target, "updated": len(updated), "results": results},
+            status=status.HTTP_200_OK,
         )
 
 
+def read_business_counter(business_user_id, status):
+    """
+    Return the `status` count of a business user (single primary-key read),
+    or None if the user has no business profile (no counter row).
+    """
+    return (
+        BusinessOrderCounter.objects.filter(pk=business_user_id)
+        .values_list(status, flat=True)
+        .first()
+    )
+
+
 class OrderCountView(APIView):
     """
     Return count of IN_PROGRESS orders for a given business user id.
@@ -145,17 +410,10 @@ class OrderCountView(APIView):
         Returns:
             {"order_count": int}
         """
-        user = get_object_or_404(User, pk=business_user_id)
-        profile = getattr(user, "profile", None)
-
-        if not profile or profile.type != "business":
+        count = read_business_counter(business_user_id, Order.Status.IN_PROGRESS)
+        if count is None:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        count = Order.objects.filter(
-            business_user_id=user.id,
-            status=Order.Status.IN_PROGRESS,
-        ).count()
-
         return Response({"order_count": count}, status=status.HTTP_200_OK)
 
 
@@ -174,15 +432,50 @@ class CompletedOrderCountView(APIView):
         Returns:
             {"completed_order_count": int}
         """
-        user = get_object_or_404(User, pk=business_user_id)
-        profile = getattr(user, "profile", None)
-
-        if not profile or profile.type != "business":
+        count = read_business_counter(business_user_id, Order.Status.COMPLETED)
+        if count is None:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        count = Order.objects.filter(
-            business_user_id=user.id,
-            status=Order.Status.COMPLETED,
-        ).count()
-
         return Response({"completed_order_count": count}, status=status.HTTP_200_OK)
+
+
+class OrderStatsView(APIView):
+    """
+    Return every status count for many business users in one query.
+
+    Query params:
+        business_user_id: repeatable and/or comma separated user PKs
+        (at most MAX_IDS)
+    """
+
+    permission_classes = [IsAuthenticated]
+    MAX_IDS = 100
+
+    def get(self, request, *args, **kwargs):
+        """
+        Returns:
+            {"results": [{"business_user_id", "status": 200, "in_progress",
+            "completed", "cancelled"} | {"business_user_id", "status": 404,
+            "detail"}, ...]} in request order; 404 entries are ids without a
+            business profile, like OrderCountView.
+        """
+        ids = parse_id_list(request.query_params, "business_user_id", self.MAX_IDS)
+        fields = BusinessOrderCounter.STATUS_FIELDS
+        counters = {
+            row["business_user_id"]: row
+            for row in BusinessOrderCounter.objects.filter(pk__in=ids).values(
+                "business_user_id", *fields
+            )
+        }
+
+        results = []
+        for pk in ids:
+            row = counters.get(pk)
+            if row is None:
+                results.append(
+                    {"business_user_id": pk, "status": 404, "detail": NotFound.default_detail}
+                )
+            else:
+                results.append({"business_user_id": pk, "status": 200, **{f: row[f] for f in fields}})
+
+        return Response({"results": results}, status=status.HTTP_200_OK)
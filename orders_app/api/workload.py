@@ -0,0 +1,100 @@
+"""
+Due-date queries on the stored, indexed Order.due_at:
+- `overdue=true` / `due_before=` filters of the orders list
+- the per-day workload histogram of a business user's in-progress orders
+
+Query params (workload):
+- days: int, number of days from today (default 14, max 90)
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from orders_app.models import Order
+
+DEFAULT_DAYS = 14
+MAX_DAYS = 90
+
+
+def parse_due_before(value):
+    """
+    Parse a datetime or a date (midnight, current time zone) into an aware datetime.
+    """
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            parsed = datetime.combine(day, time.min) if day else None
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValidationError({"due_before": "Must be a date or datetime (ISO 8601)."})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def due_filter(query_params):
+    """
+    Q for the optional `overdue=true` (in progress and past due) and
+    `due_before=` list params.
+    """
+    condition = Q()
+    if query_params.get("overdue", "").lower() in ("1", "true"):
+        condition &= Q(status=Order.Status.IN_PROGRESS, due_at__lt=timezone.now())
+    if query_params.get("due_before"):
+        condition &= Q(due_at__lt=parse_due_before(query_params["due_before"]))
+    return condition
+
+
+def parse_workload_days(query_params):
+    try:
+        days = int(query_params.get("days", DEFAULT_DAYS))
+    except ValueError:
+        raise ValidationError({"days": "A valid integer is required."})
+    if days < 1:
+        raise ValidationError({"days": "Must be at least 1."})
+    return min(days, MAX_DAYS)
+
+
+def compute_workload(business_user_id, days=DEFAULT_DAYS):
+    """
+    Count the in-progress orders of a business user that are overdue and
+    that are due on each of the next `days` days (today included).
+
+    One grouped query, a range scan on the (business_user, status, due_at)
+    index.
+    """
+    now = timezone.now()
+    today = timezone.localdate(now)
+    end = timezone.make_aware(datetime.combine(today + timedelta(days=days), time.min))
+
+    rows = (
+        Order.objects.filter(
+            business_user_id=business_user_id,
+            status=Order.Status.IN_PROGRESS,
+            due_at__lt=end,
+        )
+        .order_by()
+        .values(day=TruncDate("due_at"))
+        .annotate(due=Count("id"), overdue=Count("id", filter=Q(due_at__lt=now)))
+    )
+
+    overdue = 0
+    due = {}
+    for row in rows:
+        overdue += row["overdue"]
+        due[row["day"]] = row["due"] - row["overdue"]
+
+    return {
+        "overdue": overdue,
+        "days": [
+            {"date": day.isoformat(), "due": due.get(day, 0)}
+            for day in (today + timedelta(days=offset) for offset in range(days))
+        ],
+    }
@@ -0,0 +1,81 @@
+"""
+Hot/archive tiering for orders.
+
+Closed (completed/cancelled) orders whose last change is older than
+`ORDERS_ARCHIVE_AFTER_DAYS` are moved from Order to ArchivedOrder, so the
+hot table that the list, count and create paths use only grows with recent
+work. Each chunk is copied and deleted in its own short transaction.
+
+BusinessOrderCounter counts both tables, so archiving leaves it unchanged.
+"""
+
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from orders_app.models import ArchivedOrder, Order
+from orders_app.signals import counting_paused
+
+CLOSED_STATUSES = (Order.Status.COMPLETED, Order.Status.CANCELLED)
+DEFAULT_CHUNK_SIZE = 1000
+
+COPIED_FIELDS = [
+    field.attname for field in ArchivedOrder._meta.concrete_fields if field.name != "archived_at"
+]
+
+
+def get_archive_age():
+    return timedelta(days=getattr(settings, "ORDERS_ARCHIVE_AFTER_DAYS", 90))
+
+
+def archivable_orders(older_than=None):
+    """
+    Closed orders last changed before now - older_than.
+    """
+    cutoff = timezone.now() - (get_archive_age() if older_than is None else older_than)
+    return Order.objects.filter(status__in=CLOSED_STATUSES, updated_at__lt=cutoff)
+
+
+def archive_chunk(older_than=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Move up to `chunk_size` archivable orders (oldest ids first) in one
+    transaction. Returns the number of moved orders.
+    """
+    with transaction.atomic():
+        rows = list(
+            archivable_orders(older_than)
+            .select_for_update()
+            .order_by("pk")
+            .values(*COPIED_FIELDS)[:chunk_size]
+        )
+        if not rows:
+            return 0
+
+        archived_at = timezone.now()
+        ArchivedOrder.objects.bulk_create(
+            ArchivedOrder(**row, archived_at=archived_at) for row in rows
+        )
+        with counting_paused():
+            Order.objects.filter(pk__in=[row["id"] for row in rows]).delete()
+    return len(rows)
+
+
+def archive_orders(older_than=None, chunk_size=DEFAULT_CHUNK_SIZE, pause=0):
+    """
+    Move all archivable orders, chunk by chunk (sleeping `pause` seconds
+    between chunks to leave room for other writers).
+
+    Returns:
+        int: number of moved orders
+    """
+    total = 0
+    while True:
+        moved = archive_chunk(older_than, chunk_size)
+        total += moved
+        if moved < chunk_size:
+            return total
+        if pause:
+            time.sleep(pause)
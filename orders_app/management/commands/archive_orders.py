@@ -0,0 +1,46 @@
+"""
+Move closed orders older than ORDERS_ARCHIVE_AFTER_DAYS to the archive table.
+
+Usage:
+    python manage.py archive_orders
+    python manage.py archive_orders --older-than-days 30 --chunk-size 500 --pause 0.5
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from orders_app.archive import DEFAULT_CHUNK_SIZE, archive_orders
+
+
+class Command(BaseCommand):
+    help = "Move completed/cancelled orders out of the hot Order table in chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=None,
+            help="Archive orders last changed more than N days ago (default: ORDERS_ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Orders moved per transaction.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0,
+            help="Seconds to sleep between chunks.",
+        )
+
+    def handle(self, *args, **options):
+        days = options["older_than_days"]
+        moved = archive_orders(
+            older_than=None if days is None else timedelta(days=days),
+            chunk_size=options["chunk_size"],
+            pause=options["pause"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Archived {moved} order(s)."))
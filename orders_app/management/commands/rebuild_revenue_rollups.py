@@ -0,0 +1,28 @@
+"""
+Rebuild the RevenueRollup rows in bulk from completed (and archived) orders.
+
+Usage:
+    python manage.py rebuild_revenue_rollups
+    python manage.py rebuild_revenue_rollups --business-user-id 3
+"""
+
+from django.core.management.base import BaseCommand
+
+from orders_app.models import RevenueRollup
+
+
+class Command(BaseCommand):
+    help = "Recompute the revenue rollups (business user, day, offer type) from the orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--business-user-id",
+            type=int,
+            action="append",
+            dest="business_user_ids",
+            help="Only rebuild the given user (can be passed multiple times).",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = RevenueRollup.objects.rebuild(options["business_user_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} revenue rollup row(s)."))
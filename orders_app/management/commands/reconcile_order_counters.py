@@ -0,0 +1,28 @@
+"""
+Rebuild the materialized BusinessOrderCounter rows from Order.
+
+Usage:
+    python manage.py reconcile_order_counters
+    python manage.py reconcile_order_counters --business-user-id 3
+"""
+
+from django.core.management.base import BaseCommand
+
+from orders_app.models import BusinessOrderCounter
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-business order counters (in_progress/completed/cancelled)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--business-user-id",
+            type=int,
+            action="append",
+            dest="business_user_ids",
+            help="Only rebuild the given user (can be passed multiple times).",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = BusinessOrderCounter.objects.rebuild(options["business_user_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt order counters for {rebuilt} business user(s)."))
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.11 on 2026-10-18 05:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    Order = apps.get_model("orders_app", "Order")
+    Profile = apps.get_model("profiles_app", "Profile")
+    BusinessOrderCounter = apps.get_model("orders_app", "BusinessOrderCounter")
+
+    statuses = ["in_progress", "completed", "cancelled"]
+    business_ids = Profile.objects.filter(type="business").values_list("user_id", flat=True)
+    rows = {pk: BusinessOrderCounter(business_user_id=pk) for pk in business_ids}
+
+    totals = (
+        Order.objects.filter(business_user_id__in=list(rows))
+        .order_by()
+        .values("business_user_id")
+        .annotate(**{status: Count("id", filter=Q(status=status)) for status in statuses})
+    )
+    for total in totals:
+        for status in statuses:
+            setattr(rows[total["business_user_id"]], status, total[status])
+    BusinessOrderCounter.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('orders_app', '0002_order_side_created_indexes'),
+        ('profiles_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderCounter',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('cancelled', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.11 on 2026-10-18 05:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    RevenueRollup = apps.get_model("orders_app", "RevenueRollup")
+
+    rows = {}
+    for model_name in ("Order", "ArchivedOrder"):
+        totals = (
+            apps.get_model("orders_app", model_name).objects.filter(status="completed")
+            .order_by()
+            .values("business_user_id", "offer_type", day=TruncDate("created_at"))
+            .annotate(revenue=Sum("price"), completed_orders=Count("id"))
+        )
+        for total in totals:
+            key = (total["business_user_id"], total["day"], total["offer_type"])
+            row = rows.setdefault(key, RevenueRollup(
+                business_user_id=key[0], day=key[1], offer_type=key[2],
+                revenue=0, completed_orders=0,
+            ))
+            row.revenue += total["revenue"]
+            row.completed_orders += total["completed_orders"]
+    RevenueRollup.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0005_archived_order'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevenueRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('offer_type', models.CharField(choices=[('basic', 'Basic'), ('standard', 'Standard'), ('premium', 'Premium')], max_length=20)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('completed_orders', models.PositiveIntegerField(default=0)),
+                ('business_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='revenue_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('business_user', 'day', 'offer_type'), name='unique_revenue_rollup')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
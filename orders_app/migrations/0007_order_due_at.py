@@ -0,0 +1,47 @@
+# Generated by Django 5.2.11 on 2026-10-18 05:59
+
+from django.conf import settings
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def backfill_due_at(apps, schema_editor):
+    for model_name in ("Order", "ArchivedOrder"):
+        model = apps.get_model("orders_app", model_name)
+        orders = model.objects.only("created_at", "delivery_time_in_days").order_by("pk")
+        last_pk = 0
+        while True:
+            batch = list(orders.filter(pk__gt=last_pk)[:1000])
+            if not batch:
+                break
+            for order in batch:
+                order.due_at = order.created_at + timedelta(days=order.delivery_time_in_days)
+            model.objects.bulk_update(batch, ["due_at"])
+            last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0006_revenue_rollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedorder',
+            name='due_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='due_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['business_user', 'status', 'due_at'], name='order_business_due_idx'),
+        ),
+        migrations.RunPython(backfill_due_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.11 on 2026-10-18 06:25
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_completed_at(apps, schema_editor):
+    """
+    Completed orders are final, so their last change is the completion.
+    Then re-key the revenue rollups on the completion day.
+    """
+    RevenueRollup = apps.get_model("orders_app", "RevenueRollup")
+
+    rows = {}
+    for model_name in ("Order", "ArchivedOrder"):
+        completed = apps.get_model("orders_app", model_name).objects.filter(status="completed")
+        completed.filter(completed_at__isnull=True).update(completed_at=F("updated_at"))
+
+        totals = (
+            completed.order_by()
+            .values("business_user_id", "offer_type", day=TruncDate("completed_at"))
+            .annotate(revenue=Sum("price"), completed_orders=Count("id"))
+        )
+        for total in totals:
+            key = (total["business_user_id"], total["day"], total["offer_type"])
+            row = rows.setdefault(key, RevenueRollup(
+                business_user_id=key[0], day=key[1], offer_type=key[2],
+                revenue=0, completed_orders=0,
+            ))
+            row.revenue += total["revenue"]
+            row.completed_orders += total["completed_orders"]
+
+    RevenueRollup.objects.all().delete()
+    RevenueRollup.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0007_order_due_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedorder',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_completed_at, migrations.RunPython.noop),
+    ]
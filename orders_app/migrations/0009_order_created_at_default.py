@@ -0,0 +1,25 @@
+# Generated by Django 5.2.11 on 2026-10-18 06:27
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0008_order_completed_at'),
+    ]
+
+    # The column stays a NOT NULL datetime; only the Python-side default
+    # changes, so skip the table rebuild SQLite would do for an AlterField.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='order',
+                    name='created_at',
+                    field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+                ),
+            ],
+        ),
+    ]
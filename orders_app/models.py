@@ -1,26 +1,32 @@
+from datetime import timedelta
+from decimal import Decimal
+
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Greatest, TruncDate
+from django.utils import timezone
 
 from offers_app.models import OfferDetail
+from profiles_app.models import Profile
 
 
-class Order(models.Model):
+class OrderFields(models.Model):
+    """
+    Columns shared by the hot Order table and the ArchivedOrder table.
+    """
 
     class Status(models.TextChoices):
         IN_PROGRESS = "in_progress", "In Progress"
         COMPLETED = "completed", "Completed"
         CANCELLED = "cancelled", "Cancelled"
 
-    customer_user = models.ForeignKey(
-        settings.AUTH_USER_MODEL,
-        on_delete=models.CASCADE,
-        related_name="customer_orders",
-    )
-    business_user = models.ForeignKey(
-        settings.AUTH_USER_MODEL,
-        on_delete=models.CASCADE,
-        related_name="business_orders",
-    )
+    # Allowed status changes; completed and cancelled orders are final.
+    STATUS_TRANSITIONS = {
+        Status.IN_PROGRESS: {Status.COMPLETED, Status.CANCELLED},
+        Status.COMPLETED: set(),
+        Status.CANCELLED: set(),
+    }
 
     title = models.CharField(max_length=255)
     revisions = models.PositiveIntegerField()
@@ -38,9 +44,302 @@ class Order(models.Model):
         choices=Status.choices,
         default=Status.IN_PROGRESS,
     )
+    # Bumped by every status change; sent as the ETag of an order (If-Match on PATCH).
+    version = models.PositiveIntegerField(default=1)
+    # created_at + delivery_time_in_days, stored so overdue/workload queries can use an index.
+    due_at = models.DateTimeField(null=True, blank=True)
+    # Set when the status becomes completed; revenue is booked on this date.
+    completed_at = models.DateTimeField(null=True, blank=True)
 
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    class Meta:
+        abstract = True
 
     def __str__(self):
         return f"Order #{self.id} - {self.title}"
+
+    @property
+    def etag(self):
+        return f'"{self.version}"'
+
+    @classmethod
+    def can_transition(cls, source, target):
+        return target in cls.STATUS_TRANSITIONS.get(source, ())
+
+    @staticmethod
+    def compute_due_at(created_at, delivery_time_in_days):
+        return created_at + timedelta(days=delivery_time_in_days)
+
+
+class Order(OrderFields):
+    """
+    An order in the hot table: all open orders and recently closed ones.
+    """
+
+    customer_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="customer_orders",
+    )
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="business_orders",
+    )
+
+    # Set on instantiation (not on insert like auto_now_add) so save() can
+    # derive due_at from the stored value.
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Per-side list queries: WHERE <side> = :user ORDER BY created_at, id
+            models.Index(fields=["customer_user", "created_at"], name="order_customer_created_idx"),
+            models.Index(fields=["business_user", "created_at"], name="order_business_created_idx"),
+            # Overdue/workload queries: WHERE business_user = :user AND status = ... AND due_at < ...
+            models.Index(
+                fields=["business_user", "status", "due_at"], name="order_business_due_idx"
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Fill due_at (created_at + delivery_time_in_days) when it is unset.
+        bulk_create bypasses this and must set due_at itself.
+        """
+        if self.due_at is None and self.created_at and self.delivery_time_in_days is not None:
+            self.due_at = self.compute_due_at(self.created_at, self.delivery_time_in_days)
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "due_at"}
+        super().save(*args, **kwargs)
+
+
+class ArchivedOrder(OrderFields):
+    """
+    A closed order moved out of the hot table by `manage.py archive_orders`
+    (orders_app.archive). Keeps the id and all values of the Order row.
+    Still counted by BusinessOrderCounter.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+
+    customer_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_customer_orders",
+    )
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_business_orders",
+    )
+
+    # Copied from the Order row, not set on save.
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["customer_user", "created_at"], name="archived_order_customer_idx"
+            ),
+            models.Index(
+                fields=["business_user", "created_at"], name="archived_order_business_idx"
+            ),
+        ]
+
+
+class BusinessOrderCounterQuerySet(models.QuerySet):
+    def adjust(self, business_user_id, status, delta):
+        """
+        Add `delta` to the counter of `status` in a single UPDATE (never
+        below 0). Users without a counter row (non-business) are skipped.
+        """
+        return self.filter(pk=business_user_id).update(**{status: Greatest(F(status) + delta, 0)})
+
+    def rebuild(self, business_user_ids=None):
+        """
+        Recompute counters from Order and ArchivedOrder: one row per business
+        profile, rows of users that are no longer business are removed.
+
+        Args:
+            business_user_ids: only rebuild these users (default: all)
+
+        Returns:
+            int: number of written counter rows
+        """
+        businesses = Profile.objects.filter(type="business")
+        counters = self.all()
+        if business_user_ids is not None:
+            businesses = businesses.filter(user_id__in=business_user_ids)
+            counters = counters.filter(pk__in=business_user_ids)
+        business_ids = list(businesses.values_list("user_id", flat=True))
+
+        rows = {pk: BusinessOrderCounter(business_user_id=pk) for pk in business_ids}
+        for model in (Order, ArchivedOrder):
+            totals = (
+                model.objects.filter(business_user_id__in=business_ids)
+                .order_by()
+                .values("business_user_id")
+                .annotate(**{
+                    status: Count("id", filter=Q(status=status))
+                    for status in BusinessOrderCounter.STATUS_FIELDS
+                })
+            )
+            for total in totals:
+                row = rows[total["business_user_id"]]
+                for status in BusinessOrderCounter.STATUS_FIELDS:
+                    setattr(row, status, getattr(row, status) + total[status])
+
+        with transaction.atomic():
+            counters.exclude(pk__in=business_ids).delete()
+            self.bulk_create(
+                rows.values(),
+                update_conflicts=True,
+                unique_fields=["business_user"],
+                update_fields=list(BusinessOrderCounter.STATUS_FIELDS),
+            )
+        return len(rows)
+
+
+class BusinessOrderCounter(models.Model):
+    """
+    Materialized order counts per status for one business user.
+
+    A row exists exactly for users with a business profile. Counts are kept
+    current by orders_app.signals in the transaction of the order write;
+    `rebuild()` (manage.py reconcile_order_counters) recomputes them.
+    """
+
+    # Counter column names equal the Order.Status values.
+    STATUS_FIELDS = tuple(Order.Status.values)
+
+    business_user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="order_counter",
+    )
+    in_progress = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+
+    objects = BusinessOrderCounterQuerySet.as_manager()
+
+    def __str__(self):
+        return f"Order counter of user #{self.business_user_id}"
+
+
+class RevenueRollupQuerySet(models.QuerySet):
+    def add(self, business_user_id, day, offer_type, revenue, orders):
+        """
+        Add revenue/orders to one (business user, day, offer type) row with a
+        single UPDATE; the row is created on first use.
+        """
+        row = self.filter(business_user_id=business_user_id, day=day, offer_type=offer_type)
+        changes = {
+            "revenue": F("revenue") + revenue,
+            "completed_orders": F("completed_orders") + orders,
+        }
+        if row.update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                self.create(
+                    business_user_id=business_user_id, day=day, offer_type=offer_type,
+                    revenue=revenue, completed_orders=orders,
+                )
+        except IntegrityError:
+            # Created by a concurrent transaction in the meantime.
+            row.update(**changes)
+
+    def add_orders(self, business_user_id, orders, sign=1):
+        """
+        Add (sign=1) or remove (sign=-1) completed orders, given as
+        (completed_at, offer_type, price) tuples, grouped into one write per row.
+        """
+        totals = {}
+        for completed_at, offer_type, price in orders:
+            key = (timezone.localdate(completed_at), offer_type)
+            revenue, count = totals.get(key, (0, 0))
+            totals[key] = (revenue + Decimal(str(price)), count + 1)
+
+        for (day, offer_type), (revenue, count) in totals.items():
+            self.add(business_user_id, day, offer_type, sign * revenue, sign * count)
+
+    def rebuild(self, business_user_ids=None):
+        """
+        Recompute the rollups from completed Order and ArchivedOrder rows.
+
+        Args:
+            business_user_ids: only rebuild these users (default: all)
+
+        Returns:
+            int: number of written rollup rows
+        """
+        rows = {}
+        for model in (Order, ArchivedOrder):
+            orders = model.objects.filter(status=Order.Status.COMPLETED)
+            if business_user_ids is not None:
+                orders = orders.filter(business_user_id__in=business_user_ids)
+
+            totals = (
+                orders.order_by()
+                .values("business_user_id", "offer_type", day=TruncDate("completed_at"))
+                .annotate(revenue=Sum("price"), completed_orders=Count("id"))
+            )
+            for total in totals:
+                key = (total["business_user_id"], total["day"], total["offer_type"])
+                row = rows.setdefault(key, RevenueRollup(
+                    business_user_id=key[0], day=key[1], offer_type=key[2],
+                    revenue=0, completed_orders=0,
+                ))
+                row.revenue += total["revenue"]
+                row.completed_orders += total["completed_orders"]
+
+        rollups = self.all()
+        if business_user_ids is not None:
+            rollups = rollups.filter(business_user_id__in=business_user_ids)
+        with transaction.atomic():
+            rollups.delete()
+            self.bulk_create(rows.values(), batch_size=1000)
+        return len(rows)
+
+
+class RevenueRollup(models.Model):
+    """
+    Revenue of completed orders per business user, completion day and offer type.
+
+    Kept current by orders_app.signals (and the status update endpoints) in
+    the transaction of the order write; `rebuild()` (manage.py
+    rebuild_revenue_rollups) recomputes them. The day is the order's
+    completed_at date, so revenue is booked when the work is done and a
+    past day's rows stay as they are. Archived orders stay included.
+    """
+
+    business_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="revenue_rollups",
+    )
+    day = models.DateField()
+    offer_type = models.CharField(
+        max_length=20,
+        choices=OfferDetail.OFFER_TYPE_CHOICES,
+    )
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    completed_orders = models.PositiveIntegerField(default=0)
+
+    objects = RevenueRollupQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["business_user", "day", "offer_type"], name="unique_revenue_rollup"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Revenue of user #{self.business_user_id} on {self.day} ({self.offer_type})"
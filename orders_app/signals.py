@@ -0,0 +1,109 @@
+"""
+Signal handlers keeping BusinessOrderCounter and RevenueRollup rows in sync:
+- Order create/status change/delete adjust the counters of the business user
+  and, for completed orders, the revenue rollups (in the transaction of the
+  order write); `completed_at` is set when an order becomes completed
+- a business Profile gets a counter row (rebuilt from its orders), other
+  profile types lose theirs
+
+Bulk operations (bulk_create, QuerySet.update/delete without instances) do
+not send these signals and must adjust the counters and rollups themselves
+(or run `manage.py reconcile_order_counters` / `rebuild_revenue_rollups`). Archiving moves orders between tables
+without changing the counts, so it deletes inside `counting_paused()`.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from orders_app.models import ArchivedOrder, BusinessOrderCounter, Order, RevenueRollup
+from profiles_app.models import Profile
+
+_counting_paused = ContextVar("order_counting_paused", default=False)
+
+
+@contextmanager
+def counting_paused():
+    """
+    Do not adjust counters and rollups for Order deletes inside this block.
+    """
+    token = _counting_paused.set(True)
+    try:
+        yield
+    finally:
+        _counting_paused.reset(token)
+
+
+@receiver(post_init, sender=Order)
+def remember_order_state(sender, instance, **kwargs):
+    instance._counted = (instance.__dict__.get("business_user_id"), instance.__dict__.get("status"))
+    instance._completed_at = instance.__dict__.get("completed_at")
+
+
+@receiver(pre_save, sender=Order)
+def stamp_completion(sender, instance, **kwargs):
+    """
+    Set completed_at when the order becomes completed (cleared if it leaves it).
+    """
+    if instance.status != Order.Status.COMPLETED:
+        instance.completed_at = None
+    elif instance.completed_at is None or instance._counted[1] != Order.Status.COMPLETED:
+        instance.completed_at = timezone.now()
+
+
+@receiver(post_save, sender=Order)
+def count_order_write(sender, instance, created, **kwargs):
+    """
+    Move the order from its previous (business user, status) counter to the current one.
+    """
+    current = (instance.business_user_id, instance.status)
+    previous = None if created else instance._counted
+
+    if previous != current:
+        if previous and all(previous):
+            BusinessOrderCounter.objects.adjust(*previous, -1)
+            roll_up_revenue(instance, *previous, instance._completed_at, -1)
+        BusinessOrderCounter.objects.adjust(*current, 1)
+        roll_up_revenue(instance, *current, instance.completed_at, 1)
+    instance._counted = current
+    instance._completed_at = instance.completed_at
+
+
+@receiver(post_delete, sender=Order)
+def count_order_delete(sender, instance, **kwargs):
+    if _counting_paused.get():
+        return
+    business_user_id, status = instance._counted
+    if business_user_id and status:
+        BusinessOrderCounter.objects.adjust(business_user_id, status, -1)
+        roll_up_revenue(instance, business_user_id, status, instance._completed_at, -1)
+
+
+@receiver(post_delete, sender=ArchivedOrder)
+def count_archived_order_delete(sender, instance, **kwargs):
+    BusinessOrderCounter.objects.adjust(instance.business_user_id, instance.status, -1)
+    roll_up_revenue(
+        instance, instance.business_user_id, instance.status, instance.completed_at, -1
+    )
+
+
+def roll_up_revenue(order, business_user_id, status, completed_at, sign):
+    if status == Order.Status.COMPLETED:
+        RevenueRollup.objects.add_orders(
+            business_user_id, [(completed_at, order.offer_type, order.price)], sign
+        )
+
+
+@receiver(post_save, sender=Profile)
+def sync_business_counter(sender, instance, **kwargs):
+    """
+    Create (from existing orders) or drop the counter row with the profile type.
+    """
+    counters = BusinessOrderCounter.objects.filter(pk=instance.user_id)
+    if instance.type != "business":
+        counters.delete()
+    elif not counters.exists():
+        BusinessOrderCounter.objects.rebuild([instance.user_id])
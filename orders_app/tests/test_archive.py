@@ -0,0 +1,119 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from orders_app.archive import archive_orders
+from orders_app.models import ArchivedOrder, BusinessOrderCounter, Order
+from profiles_app.models import Profile
+
+
+@override_settings(ORDERS_ARCHIVE_AFTER_DAYS=30)
+class OrderArchiveTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+
+    def create_order(self, order_status="in_progress", days_ago=0):
+        order = Order.objects.create(
+            customer_user=self.customer, business_user=self.business, title="A",
+            revisions=1, delivery_time_in_days=1, price="10.00", features=["X"],
+            offer_type="basic", status=order_status,
+        )
+        changed = timezone.now() - timedelta(days=days_ago)
+        Order.objects.filter(pk=order.pk).update(created_at=changed, updated_at=changed)
+        return Order.objects.get(pk=order.pk)
+
+    def counts(self):
+        counter = BusinessOrderCounter.objects.get(pk=self.business.pk)
+        return counter.in_progress, counter.completed, counter.cancelled
+
+    def test_moves_only_old_closed_orders_and_keeps_their_values(self):
+        old_done = self.create_order("completed", days_ago=40)
+        old_cancelled = self.create_order("cancelled", days_ago=40)
+        old_open = self.create_order("in_progress", days_ago=40)
+        recent_done = self.create_order("completed", days_ago=2)
+
+        self.assertEqual(archive_orders(chunk_size=1), 2)
+
+        self.assertEqual(
+            set(Order.objects.values_list("id", flat=True)), {old_open.id, recent_done.id}
+        )
+        archived = ArchivedOrder.objects.get(pk=old_done.pk)
+        self.assertEqual(
+            (archived.status, archived.created_at, archived.updated_at, archived.features),
+            (old_done.status, old_done.created_at, old_done.updated_at, ["X"]),
+        )
+        self.assertTrue(ArchivedOrder.objects.filter(pk=old_cancelled.pk).exists())
+
+    def test_counts_stay_correct_across_both_tables(self):
+        self.create_order("completed", days_ago=40)
+        self.create_order("completed", days_ago=40)
+        self.create_order("cancelled", days_ago=40)
+        self.create_order("in_progress")
+        self.assertEqual(self.counts(), (1, 2, 1))
+
+        archive_orders()
+        self.assertEqual(self.counts(), (1, 2, 1))
+
+        BusinessOrderCounter.objects.rebuild()
+        self.assertEqual(self.counts(), (1, 2, 1))
+
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.get(reverse("completed-order-count", args=[self.business.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {"completed_order_count": 2})
+
+        ArchivedOrder.objects.filter(status="cancelled").get().delete()
+        self.assertEqual(self.counts(), (1, 2, 0))
+
+    def test_list_reads_the_archive_only_for_history(self):
+        archived = self.create_order("completed", days_ago=40)
+        hot = self.create_order("in_progress")
+        archive_orders()
+        self.client.force_authenticate(user=self.customer)
+        url = reverse("orders-list")
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([order["id"] for order in response.json()], [hot.id])
+
+        response = self.client.get(url, {"history": "true"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([order["id"] for order in response.json()], [archived.id])
+        self.assertEqual(response.json()[0]["status"], "completed")
+
+    def test_paging_past_the_hot_orders_continues_in_the_archive(self):
+        archived = [self.create_order("completed", days_ago=40 + i) for i in range(3)]
+        hot = [self.create_order("in_progress", days_ago=i) for i in range(2)]
+        archive_orders()
+        self.client.force_authenticate(user=self.business)
+
+        ids = []
+        response = self.client.get(reverse("orders-list"), {"page_size": 2})
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [order["id"] for order in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(ids, [o.id for o in hot] + [o.id for o in archived])
+
+    def test_archive_command(self):
+        self.create_order("completed", days_ago=10)
+        self.create_order("completed", days_ago=40)
+
+        out = StringIO()
+        call_command("archive_orders", "--older-than-days", "5", stdout=out)
+
+        self.assertIn("Archived 2 order(s).", out.getvalue())
+        self.assertFalse(Order.objects.exists())
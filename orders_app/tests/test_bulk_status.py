@@ -0,0 +1,102 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from orders_app.models import BusinessOrderCounter, Order
+from profiles_app.models import Profile
+
+
+class OrderBulkStatusTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.other = User.objects.create_user(username="other", password="pw123456")
+        Profile.objects.create(user=self.other, type="business")
+
+        self.url = reverse("orders-bulk-status")
+        self.client.force_authenticate(user=self.business)
+
+    def create_order(self, order_status="in_progress", business=None):
+        return Order.objects.create(
+            customer_user=self.customer, business_user=business or self.business, title="A",
+            revisions=1, delivery_time_in_days=1, price="10.00", features=[],
+            offer_type="basic", status=order_status,
+        )
+
+    def counts(self, user=None):
+        counter = BusinessOrderCounter.objects.get(pk=(user or self.business).pk)
+        return counter.in_progress, counter.completed, counter.cancelled
+
+    def test_applies_allowed_changes_and_reports_per_id(self):
+        first, second = self.create_order(), self.create_order()
+        done = self.create_order("completed")
+        foreign = self.create_order(business=self.other)
+
+        response = self.client.post(
+            self.url,
+            {"ids": [second.id, done.id, foreign.id, 999999, first.id, second.id], "status": "completed"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["updated"], 2)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"id": second.id, "result": "updated"},
+                {"id": done.id, "result": "invalid_transition"},
+                {"id": foreign.id, "result": "not_owned"},
+                {"id": 999999, "result": "not_owned"},
+                {"id": first.id, "result": "updated"},
+            ],
+        )
+        self.assertEqual(
+            set(Order.objects.filter(status="completed").values_list("id", flat=True)),
+            {first.id, second.id, done.id},
+        )
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, Order.Status.IN_PROGRESS)
+
+    def test_keeps_counters_consistent(self):
+        orders = [self.create_order() for _ in range(3)]
+        self.create_order(business=self.other)
+
+        self.client.post(self.url, {"ids": [o.id for o in orders[:2]], "status": "cancelled"}, format="json")
+
+        self.assertEqual(self.counts(), (1, 0, 2))
+        self.assertEqual(self.counts(self.other), (1, 0, 0))
+        BusinessOrderCounter.objects.rebuild()
+        self.assertEqual(self.counts(), (1, 0, 2))
+
+    def test_runs_one_update(self):
+        orders = [self.create_order() for _ in range(20)]
+
+        # savepoint, locked select, one UPDATE, two counter updates,
+        # one revenue rollup upsert (UPDATE + savepoint/INSERT/release), release
+        with self.assertNumQueries(10):
+            response = self.client.post(
+                self.url, {"ids": [o.id for o in orders], "status": "completed"}, format="json"
+            )
+        self.assertEqual(response.data["updated"], 20)
+        self.assertFalse(Order.objects.filter(status="in_progress").exists())
+
+    def test_customers_cannot_use_it(self):
+        order = self.create_order()
+        self.client.force_authenticate(user=self.customer)
+
+        response = self.client.post(self.url, {"ids": [order.id], "status": "completed"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_invalid_input_returns_400(self):
+        for payload in [
+            {"ids": [], "status": "completed"},
+            {"ids": [1], "status": "done"},
+            {"ids": ["x"], "status": "completed"},
+            {"ids": list(range(1, 102)), "status": "completed"},
+        ]:
+            response = self.client.post(self.url, payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
@@ -0,0 +1,106 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import BusinessOrderCounter, Order
+from profiles_app.models import Profile
+
+
+class BusinessOrderCounterTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+
+        offer = Offer.objects.create(user=self.business, title="Logo", description="desc")
+        self.detail = OfferDetail.objects.create(
+            offer=offer, title="Logo Design", revisions=3, delivery_time_in_days=5,
+            price="150.00", features=[], offer_type="basic",
+        )
+
+    def create_order(self, order_status="in_progress", business=None):
+        return Order.objects.create(
+            customer_user=self.customer, business_user=business or self.business, title="A",
+            revisions=1, delivery_time_in_days=1, price="10.00", features=[],
+            offer_type="basic", status=order_status,
+        )
+
+    def counts(self, user=None):
+        counter = BusinessOrderCounter.objects.get(pk=(user or self.business).pk)
+        return counter.in_progress, counter.completed, counter.cancelled
+
+    def test_api_create_and_status_patch_update_counters(self):
+        self.assertEqual(self.counts(), (0, 0, 0))
+
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.post(
+            reverse("orders-list"), {"offer_detail_id": self.detail.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.counts(), (1, 0, 0))
+
+        self.client.force_authenticate(user=self.business)
+        url = reverse("orders-detail", args=[response.data["id"]])
+        self.client.patch(url, {"status": "completed"}, format="json")
+        self.assertEqual(self.counts(), (0, 1, 0))
+
+        self.client.patch(url, {"status": "completed"}, format="json")
+        self.assertEqual(self.counts(), (0, 1, 0))
+
+    def test_orm_writes_and_deletes_update_counters(self):
+        order = self.create_order()
+        self.create_order("cancelled")
+        self.assertEqual(self.counts(), (1, 0, 1))
+
+        order.status = Order.Status.COMPLETED
+        order.save()
+        self.assertEqual(self.counts(), (0, 1, 1))
+
+        order.delete()
+        self.assertEqual(self.counts(), (0, 0, 1))
+
+    def test_count_endpoints_are_a_single_primary_key_read(self):
+        self.create_order()
+        self.create_order("completed")
+        self.client.force_authenticate(user=self.customer)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("order-count", args=[self.business.id]))
+        self.assertEqual(response.json(), {"order_count": 1})
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("completed-order-count", args=[self.business.id]))
+        self.assertEqual(response.json(), {"completed_order_count": 1})
+
+    def test_counter_rows_follow_the_profile_type(self):
+        late = User.objects.create_user(username="late", password="pw123456")
+        self.create_order(business=late)
+        self.create_order("completed", business=late)
+        self.assertFalse(BusinessOrderCounter.objects.filter(pk=late.pk).exists())
+
+        profile = Profile.objects.create(user=late, type="business")
+        self.assertEqual(self.counts(late), (1, 1, 0))
+
+        profile.type = "customer"
+        profile.save()
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.get(reverse("order-count", args=[late.id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_reconcile_command_rebuilds_counters(self):
+        self.create_order()
+        self.create_order()
+        Order.objects.update(status=Order.Status.CANCELLED)
+        self.assertEqual(self.counts(), (2, 0, 0))
+
+        out = StringIO()
+        call_command("reconcile_order_counters", stdout=out)
+
+        self.assertEqual(self.counts(), (0, 0, 2))
+        self.assertIn("Rebuilt order counters for 1 business user(s).", out.getvalue())
@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import Order
+from profiles_app.models import Profile
+
+
+class OrderDueDateTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.now = timezone.now()
+
+    def create_order(self, due_in, order_status="in_progress"):
+        return Order.objects.create(
+            customer_user=self.customer, business_user=self.business, title="A",
+            revisions=1, delivery_time_in_days=1, price="10.00", features=[],
+            offer_type="basic", status=order_status, due_at=self.now + due_in,
+        )
+
+    def list_ids(self, params):
+        response = self.client.get(reverse("orders-list"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {order["id"] for order in response.json()}
+
+    def test_create_stores_the_due_date(self):
+        offer = Offer.objects.create(user=self.business, title="Logo", description="desc")
+        detail = OfferDetail.objects.create(
+            offer=offer, title="Logo Design", revisions=3, delivery_time_in_days=5,
+            price="150.00", features=[], offer_type="basic",
+        )
+        self.client.force_authenticate(user=self.customer)
+
+        response = self.client.post(reverse("orders-list"), {"offer_detail_id": detail.id}, format="json")
+
+        order = Order.objects.get(pk=response.data["id"])
+        self.assertEqual(order.due_at, order.created_at + timedelta(days=5))
+
+    def test_orders_saved_elsewhere_get_a_due_date(self):
+        order = Order.objects.create(
+            customer_user=self.customer, business_user=self.business, title="A",
+            revisions=1, delivery_time_in_days=3, price="10.00", features=[],
+            offer_type="basic", created_at=self.now - timedelta(days=4),
+        )
+        self.assertEqual(Order.objects.get(pk=order.pk).due_at, self.now - timedelta(days=1))
+
+        self.client.force_authenticate(user=self.business)
+        self.assertEqual(self.list_ids({"overdue": "true"}), {order.id})
+
+        Order.objects.filter(pk=order.pk).update(due_at=None)
+        order = Order.objects.get(pk=order.pk)
+        order.save(update_fields=["title"])
+        self.assertEqual(Order.objects.get(pk=order.pk).due_at, self.now - timedelta(days=1))
+
+    def test_overdue_and_due_before_filters(self):
+        overdue = self.create_order(-timedelta(days=2))
+        late_but_done = self.create_order(-timedelta(days=2), "completed")
+        tomorrow = self.create_order(timedelta(days=1))
+        later = self.create_order(timedelta(days=10))
+        self.client.force_authenticate(user=self.business)
+
+        self.assertEqual(self.list_ids({"overdue": "true"}), {overdue.id})
+        due_before = (self.now + timedelta(days=3)).isoformat()
+        self.assertEqual(
+            self.list_ids({"due_before": due_before}), {overdue.id, late_but_done.id, tomorrow.id}
+        )
+        day = (self.now + timedelta(days=30)).date().isoformat()
+        self.assertEqual(
+            self.list_ids({"due_before": day, "role": "business"}),
+            {overdue.id, late_but_done.id, tomorrow.id, later.id},
+        )
+
+        response = self.client.get(reverse("orders-list"), {"due_before": "next week"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_workload_histogram(self):
+        self.create_order(-timedelta(days=3))
+        self.create_order(-timedelta(minutes=1))
+        self.create_order(timedelta(days=1))
+        self.create_order(timedelta(days=1))
+        self.create_order(timedelta(days=1), "completed")
+        self.create_order(timedelta(days=20))
+        self.client.force_authenticate(user=self.business)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("orders-workload"), {"days": 7})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["overdue"], 2)
+        self.assertEqual(len(response.data["days"]), 7)
+        self.assertEqual(response.data["days"][0]["date"], timezone.localdate().isoformat())
+        tomorrow = (timezone.localdate() + timedelta(days=1)).isoformat()
+        self.assertEqual(
+            {day["date"]: day["due"] for day in response.data["days"] if day["due"]}, {tomorrow: 2}
+        )
+
+    def test_workload_validation_and_permissions(self):
+        self.client.force_authenticate(user=self.business)
+        for days in ["x", "0"]:
+            response = self.client.get(reverse("orders-workload"), {"days": days})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.get(reverse("orders-workload"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_due_queries_use_the_composite_index(self):
+        plan = (
+            Order.objects.filter(
+                business_user=self.business, status="in_progress", due_at__lt=self.now
+            ).explain()
+        )
+        self.assertIn("order_business_due_idx", plan)
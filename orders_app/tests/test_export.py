@@ -0,0 +1,135 @@
+import csv
+import gzip
+import io
+import json
+import os
+import tracemalloc
+import unittest
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from orders_app.archive import archive_orders
+from orders_app.models import Order
+from profiles_app.models import Profile
+
+# Set ORDERS_EXPORT_TEST_ROWS=1000000 for the full-size run (a few minutes; peak stays ~5 MB).
+EXPORT_TEST_ROWS = int(os.getenv("ORDERS_EXPORT_TEST_ROWS", "20000"))
+MEMORY_CEILING = 16 * 1024 * 1024
+
+
+class OrderExportTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.url = reverse("orders-export")
+
+    def create_order(self, customer, business, order_status="in_progress", features=()):
+        return Order.objects.create(
+            customer_user=customer, business_user=business, title="Logo, \"final\"",
+            revisions=1, delivery_time_in_days=1, price="10.50", features=list(features),
+            offer_type="basic", status=order_status,
+        )
+
+    def read(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_csv_streams_hot_and_archived_orders_oldest_first(self):
+        first = self.create_order(self.customer, self.business, "completed", ["A", "B"])
+        second = self.create_order(self.customer, self.business)
+        own = self.create_order(self.business, self.business)
+        Order.objects.filter(pk=first.pk).update(updated_at="2000-01-01T00:00:00Z")
+        archive_orders()
+        self.client.force_authenticate(user=self.business)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertIn('filename="orders.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(io.StringIO(self.read(response).decode())))
+        self.assertEqual([int(row["id"]) for row in rows], [first.id, second.id, own.id])
+        self.assertEqual(
+            (rows[0]["title"], rows[0]["price"], rows[0]["features"], rows[0]["archived"]),
+            ('Logo, "final"', "10.50", "A; B", "True"),
+        )
+        self.assertEqual(rows[1]["archived"], "False")
+
+    def test_ndjson_with_role_filter(self):
+        sold = self.create_order(self.customer, self.business)
+        self.create_order(self.business, self.customer)
+        self.client.force_authenticate(user=self.business)
+
+        response = self.client.get(self.url, {"export_format": "ndjson", "role": "business"})
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        records = [json.loads(line) for line in self.read(response).decode().splitlines()]
+        self.assertEqual([record["id"] for record in records], [sold.id])
+        self.assertEqual(records[0]["business_user"], self.business.id)
+
+    def test_gzip_on_request(self):
+        self.create_order(self.customer, self.business)
+        self.client.force_authenticate(user=self.customer)
+
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        lines = gzip.decompress(self.read(response)).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+
+    def test_empty_export_has_the_header_only(self):
+        self.client.force_authenticate(user=self.customer)
+
+        response = self.client.get(self.url, HTTP_ACCEPT="text/csv")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(self.read(response).decode().startswith("id,customer_user,business_user,"))
+
+    def test_invalid_format_and_anonymous(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.get(self.url, {"export_format": "xlsx"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @unittest.skipUnless(connection.vendor == "sqlite", "seeds with SQLite date functions")
+    def test_memory_stays_flat_for_many_orders(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT INTO orders_app_order (
+                    title, revisions, delivery_time_in_days, price, features, offer_type,
+                    status, version, customer_user_id, business_user_id, created_at, updated_at
+                )
+                WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < %s)
+                SELECT 'Order ' || n, 1, 3, '99.00', '["Logo", "Source files"]', 'basic',
+                       'completed', 1, %s, %s,
+                       datetime('2020-01-01', '+' || n || ' seconds'),
+                       datetime('2020-01-01', '+' || n || ' seconds')
+                FROM seq
+                """,
+                [EXPORT_TEST_ROWS, self.customer.id, self.business.id],
+            )
+        self.client.force_authenticate(user=self.business)
+
+        response = self.client.get(self.url)
+        lines = size = 0
+        tracemalloc.start()
+        try:
+            for chunk in response.streaming_content:
+                lines += chunk.count(b"\n")
+                size += len(chunk)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(lines, EXPORT_TEST_ROWS + 1)
+        self.assertLess(peak, MEMORY_CEILING, f"peak {peak} bytes for {size} exported bytes")
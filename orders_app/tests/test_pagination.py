@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from orders_app.models import Order
+from profiles_app.models import Profile
+
+
+class OrdersListPaginationTests(APITestCase):
+    def setUp(self):
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.other = User.objects.create_user(username="other", password="pw123456")
+        Profile.objects.create(user=self.other, type="business")
+
+        # The business user is on both sides: seller of some orders, buyer of others.
+        now = timezone.now()
+        same_time = now - timedelta(hours=1)
+        sides = [
+            (self.customer, self.business, now - timedelta(hours=3)),
+            (self.business, self.other, now - timedelta(hours=2)),
+            (self.customer, self.business, same_time),
+            (self.business, self.other, same_time),
+            (self.customer, self.business, now),
+            (self.customer, self.other, now),
+        ]
+        for index, (customer, business, created_at) in enumerate(sides):
+            order = Order.objects.create(
+                customer_user=customer, business_user=business, title=f"Order {index}",
+                revisions=1, delivery_time_in_days=1, price="10.00", features=[],
+                offer_type="basic",
+            )
+            Order.objects.filter(pk=order.pk).update(created_at=created_at)
+
+        self.url = reverse("orders-list")
+        self.client.force_authenticate(user=self.business)
+
+    def expected_ids(self, **filters):
+        orders = Order.objects.filter(**filters) if filters else Order.objects.exclude(
+            customer_user=self.customer, business_user=self.other
+        )
+        return list(orders.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    def collect(self, params):
+        ids = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [order["id"] for order in response.data["results"]]
+            if not response.data["next"]:
+                return ids, response
+            response = self.client.get(response.data["next"])
+
+    def test_unpaginated_list_merges_both_sides(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([order["id"] for order in response.json()], self.expected_ids())
+
+    def test_cursor_pages_walk_all_orders_in_order(self):
+        ids, last = self.collect({"cursor": "", "page_size": 2})
+        self.assertEqual(ids, self.expected_ids())
+
+        back = self.client.get(last.data["previous"])
+        self.assertEqual([order["id"] for order in back.data["results"]], ids[2:4])
+
+    def test_each_page_runs_one_query_per_side(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(len(response.data["results"]), 2)
+
+        with self.assertNumQueries(1):
+            self.client.get(self.url, {"page_size": 1, "role": "customer"})
+
+        # The last hot page also checks whether archived orders follow.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"page_size": 2, "role": "customer"})
+        self.assertIsNone(response.data["next"])
+
+    def test_role_filter(self):
+        ids, _ = self.collect({"cursor": "", "role": "business"})
+        self.assertEqual(ids, self.expected_ids(business_user=self.business))
+
+        response = self.client.get(self.url, {"role": "customer"})
+        self.assertEqual(
+            [order["id"] for order in response.json()], self.expected_ids(customer_user=self.business)
+        )
+
+    def test_invalid_role_returns_400(self):
+        response = self.client.get(self.url, {"role": "admin"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_side_queries_use_the_composite_indexes(self):
+        plan = (
+            Order.objects.filter(business_user=self.business)
+            .order_by("-created_at", "-id")[:3]
+            .explain()
+        )
+        self.assertIn("order_business_created_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
@@ -0,0 +1,175 @@
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from offers_app.models import Offer, OfferDetail
+from orders_app.archive import archive_orders
+from orders_app.models import Order, RevenueRollup
+from profiles_app.models import Profile
+
+
+class RevenueRollupTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.url = reverse("orders-revenue")
+
+    def create_order(self, order_status="in_progress", price="10.00", offer_type="basic", **dates):
+        order = Order.objects.create(
+            customer_user=self.customer, business_user=self.business, title="A",
+            revisions=1, delivery_time_in_days=1, price=price, features=[],
+            offer_type=offer_type, status=order_status,
+        )
+        if dates:
+            Order.objects.filter(pk=order.pk).update(**dates)
+        return order
+
+    def rollups(self):
+        return sorted(
+            RevenueRollup.objects.filter(completed_orders__gt=0).values_list(
+                "day", "offer_type", "revenue", "completed_orders"
+            )
+        )
+
+    def assert_matches_rebuild(self):
+        incremental = self.rollups()
+        RevenueRollup.objects.rebuild()
+        self.assertEqual(incremental, self.rollups())
+
+    def test_api_create_and_completion_update_the_rollups(self):
+        offer = Offer.objects.create(user=self.business, title="Logo", description="desc")
+        detail = OfferDetail.objects.create(
+            offer=offer, title="Logo Design", revisions=3, delivery_time_in_days=5,
+            price="150.00", features=[], offer_type="premium",
+        )
+        self.client.force_authenticate(user=self.customer)
+        created = self.client.post(reverse("orders-list"), {"offer_detail_id": detail.id}, format="json")
+        self.assertEqual(self.rollups(), [])
+
+        self.client.force_authenticate(user=self.business)
+        self.client.patch(
+            reverse("orders-detail", args=[created.data["id"]]), {"status": "completed"}, format="json"
+        )
+
+        self.assertEqual(
+            self.rollups(), [(timezone.localdate(), "premium", Decimal("150.00"), 1)]
+        )
+        self.assert_matches_rebuild()
+
+    def test_bulk_completion_and_orm_writes_update_the_rollups(self):
+        orders = [self.create_order(price="10.00"), self.create_order(price="2.50", offer_type="standard")]
+        cancelled = self.create_order()
+        self.client.force_authenticate(user=self.business)
+
+        self.client.post(
+            reverse("orders-bulk-status"), {"ids": [o.id for o in orders], "status": "completed"}, format="json"
+        )
+        self.client.post(reverse("orders-bulk-status"), {"ids": [cancelled.id], "status": "cancelled"}, format="json")
+        direct = self.create_order("completed", price="5.00")
+
+        today = timezone.localdate()
+        self.assertEqual(
+            self.rollups(),
+            [(today, "basic", Decimal("15.00"), 2), (today, "standard", Decimal("2.50"), 1)],
+        )
+        self.assert_matches_rebuild()
+
+        direct.delete()
+        self.assertEqual(self.rollups()[0], (today, "basic", Decimal("10.00"), 1))
+        self.assert_matches_rebuild()
+
+    def test_revenue_is_booked_on_the_completion_day(self):
+        january = datetime(2026, 1, 31, 12, tzinfo=dt_timezone.utc)
+        patched = self.create_order(price="20.00", created_at=january)
+        bulk = self.create_order(price="5.00", created_at=january)
+        self.client.force_authenticate(user=self.business)
+
+        self.client.patch(reverse("orders-detail", args=[patched.id]), {"status": "completed"}, format="json")
+        self.client.post(reverse("orders-bulk-status"), {"ids": [bulk.id], "status": "completed"}, format="json")
+        orm = self.create_order(price="1.00", created_at=january)
+        orm.status = Order.Status.COMPLETED
+        orm.save()
+
+        today = timezone.localdate()
+        self.assertEqual(self.rollups(), [(today, "basic", Decimal("26.00"), 3)])
+        self.assertFalse(Order.objects.filter(completed_at__isnull=True).exists())
+        self.assert_matches_rebuild()
+
+        orm.status = Order.Status.IN_PROGRESS
+        orm.save()
+        self.assertIsNone(orm.completed_at)
+        self.assertEqual(self.rollups(), [(today, "basic", Decimal("25.00"), 2)])
+
+    def test_archiving_keeps_the_revenue(self):
+        order = self.create_order("completed", price="7.00")
+        Order.objects.filter(pk=order.pk).update(updated_at="2000-01-01T00:00:00Z")
+
+        archive_orders()
+
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(self.rollups(), [(timezone.localdate(), "basic", Decimal("7.00"), 1)])
+        self.assert_matches_rebuild()
+
+    def test_endpoint_groups_rollups_by_period(self):
+        for day, price, offer_type in [
+            (datetime(2026, 3, 2, 9, tzinfo=dt_timezone.utc), "10.00", "basic"),
+            (datetime(2026, 3, 4, 9, tzinfo=dt_timezone.utc), "20.00", "basic"),
+            (datetime(2026, 3, 4, 10, tzinfo=dt_timezone.utc), "5.00", "premium"),
+            (datetime(2026, 4, 1, 9, tzinfo=dt_timezone.utc), "40.00", "basic"),
+        ]:
+            self.create_order("completed", price=price, offer_type=offer_type, completed_at=day)
+        self.create_order("in_progress", price="99.00", created_at=datetime(2026, 3, 2, tzinfo=dt_timezone.utc))
+        call_command("rebuild_revenue_rollups", stdout=StringIO())
+        self.client.force_authenticate(user=self.business)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"period": "month"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"period_start": "2026-03-01", "offer_type": "basic", "revenue": "30.00", "completed_orders": 2},
+                {"period_start": "2026-03-01", "offer_type": "premium", "revenue": "5.00", "completed_orders": 1},
+                {"period_start": "2026-04-01", "offer_type": "basic", "revenue": "40.00", "completed_orders": 1},
+            ],
+        )
+        self.assertEqual(response.data["total"], {"revenue": "75.00", "completed_orders": 4})
+
+        response = self.client.get(
+            self.url, {"period": "week", "start": "2026-03-01", "end": "2026-03-31", "offer_type": "basic"}
+        )
+        self.assertEqual(
+            response.data["results"],
+            [{"period_start": "2026-03-02", "offer_type": "basic", "revenue": "30.00", "completed_orders": 2}],
+        )
+
+        response = self.client.get(self.url, {"end": "2026-03-03"})
+        self.assertEqual([row["period_start"] for row in response.data["results"]], ["2026-03-02"])
+
+    def test_endpoint_validation_and_permissions(self):
+        self.client.force_authenticate(user=self.business)
+        for params in [{"period": "year"}, {"start": "2026-13-01"}, {"end": "soon"}, {"offer_type": "gold"}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+        self.client.force_authenticate(user=self.customer)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_rebuild_command(self):
+        self.create_order("completed", price="3.00")
+        RevenueRollup.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_revenue_rollups", "--business-user-id", str(self.business.id), stdout=out)
+
+        self.assertIn("Rebuilt 1 revenue rollup row(s).", out.getvalue())
+        self.assertEqual(self.rollups(), [(timezone.localdate(), "basic", Decimal("3.00"), 1)])
@@ -0,0 +1,62 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from orders_app.models import Order
+from profiles_app.models import Profile
+
+
+class OrderStatsTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.biz1 = User.objects.create_user(username="biz1", password="pw123456")
+        Profile.objects.create(user=self.biz1, type="business")
+        self.biz2 = User.objects.create_user(username="biz2", password="pw123456")
+        Profile.objects.create(user=self.biz2, type="business")
+
+        for business, order_status in [
+            (self.biz1, "in_progress"),
+            (self.biz1, "in_progress"),
+            (self.biz1, "completed"),
+            (self.biz2, "cancelled"),
+        ]:
+            Order.objects.create(
+                customer_user=self.customer, business_user=business, title="A", revisions=1,
+                delivery_time_in_days=1, price="10.00", features=[], offer_type="basic",
+                status=order_status,
+            )
+
+        self.url = reverse("order-stats")
+
+    def test_requires_auth(self):
+        response = self.client.get(self.url, {"business_user_id": self.biz1.id})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_returns_all_counts_per_entry_in_one_query(self):
+        self.client.force_authenticate(user=self.customer)
+        ids = f"{self.biz2.id},{self.customer.id}"
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url, {"business_user_id": [self.biz1.id, ids, 999999, self.biz1.id]}
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"], [
+            {"business_user_id": self.biz1.id, "status": 200,
+             "in_progress": 2, "completed": 1, "cancelled": 0},
+            {"business_user_id": self.biz2.id, "status": 200,
+             "in_progress": 0, "completed": 0, "cancelled": 1},
+            {"business_user_id": self.customer.id, "status": 404, "detail": "Not found."},
+            {"business_user_id": 999999, "status": 404, "detail": "Not found."},
+        ])
+
+    def test_invalid_or_missing_ids_return_400(self):
+        self.client.force_authenticate(user=self.customer)
+
+        for params in [{}, {"business_user_id": "1,x"}, {"business_user_id": ",".join(map(str, range(101)))}]:
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,102 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from orders_app.api.views import OrdersViewSet
+from orders_app.models import BusinessOrderCounter, Order
+from profiles_app.models import Profile
+
+
+class ConditionalStatusUpdateTests(APITestCase):
+    def setUp(self):
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+
+        self.order = Order.objects.create(
+            customer_user=self.customer, business_user=self.business, title="A",
+            revisions=1, delivery_time_in_days=1, price="10.00", features=[],
+            offer_type="basic",
+        )
+        self.url = reverse("orders-detail", args=[self.order.id])
+        self.client.force_authenticate(user=self.business)
+
+    def patch(self, order_status, **headers):
+        return self.client.patch(self.url, {"status": order_status}, format="json", **headers)
+
+    def counts(self):
+        counter = BusinessOrderCounter.objects.get(pk=self.business.pk)
+        return counter.in_progress, counter.completed, counter.cancelled
+
+    def test_update_bumps_the_version_and_builds_the_response_without_a_reread(self):
+        # savepoint, order load, conditional UPDATE, 2 counter updates,
+        # revenue rollup upsert (first of the day: UPDATE + savepoint/INSERT/release), release
+        with self.assertNumQueries(10):
+            response = self.patch("completed")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "completed")
+        self.assertEqual(response["ETag"], '"2"')
+
+        self.order.refresh_from_db()
+        self.assertEqual((self.order.status, self.order.version), ("completed", 2))
+        self.assertEqual(response.data["updated_at"], self.client.get(self.url).data["updated_at"])
+        self.assertEqual(self.counts(), (0, 1, 0))
+
+    def test_final_statuses_cannot_be_left(self):
+        self.patch("cancelled")
+
+        response = self.patch("in_progress")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "cancelled")
+        self.assertEqual(self.counts(), (0, 0, 1))
+
+    def test_same_status_is_a_no_op(self):
+        self.patch("completed")
+
+        response = self.patch("completed")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], '"2"')
+
+    def test_if_match(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.assertEqual(etag, '"1"')
+
+        response = self.patch("completed", HTTP_IF_MATCH='"7"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.patch("completed", HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.patch("cancelled", HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "completed")
+
+    def test_concurrent_change_is_not_overwritten(self):
+        get_object = OrdersViewSet.get_object
+
+        def load_then_lose_the_race(view):
+            order = get_object(view)
+            Order.objects.filter(pk=order.pk).update(status="cancelled", version=2)
+            return order
+
+        with mock.patch.object(OrdersViewSet, "get_object", load_then_lose_the_race):
+            response = self.patch("completed")
+            self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+            Order.objects.filter(pk=self.order.pk).update(status="in_progress", version=1)
+            response = self.patch("completed", HTTP_IF_MATCH='"1"')
+            self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+            self.assertEqual(response["ETag"], '"2"')
+
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, "cancelled")
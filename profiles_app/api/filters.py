@@ -0,0 +1,40 @@
+"""
+django-filter FilterSet for the business/customer profile directories.
+Supports a username prefix search and filtering by location.
+"""
+
+import django_filters
+
+from profiles_app.models import Profile
+
+
+def prefix_upper_bound(prefix):
+    """
+    Smallest string greater than every string starting with `prefix`.
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class ProfileDirectoryFilter(django_filters.FilterSet):
+    """
+    Filter configuration for the profile directory querysets.
+
+    Query params:
+        - search: username prefix (case-sensitive, like usernames)
+        - location: case-insensitive exact match
+    """
+
+    search = django_filters.CharFilter(method="filter_username_prefix")
+    location = django_filters.CharFilter(field_name="location", lookup_expr="iexact")
+
+    class Meta:
+        model = Profile
+        fields = ["search", "location"]
+
+    def filter_username_prefix(self, queryset, name, value):
+        """
+        Match the prefix as a username range (`>= prefix AND < upper bound`),
+        which SQLite reads from the (type, username) index; `LIKE 'prefix%'`
+        cannot use it because LIKE is case-insensitive.
+        """
+        return queryset.filter(username__gte=value, username__lt=prefix_upper_bound(value))
@@ -0,0 +1,26 @@
+"""
+Pagination configuration for the business/customer profile directories:
+opt-in keyset pagination on the (unique) username.
+"""
+
+from core.api.pagination import KeysetPagination
+
+
+class ProfilesCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for profiles ({"next", "previous", "results"}).
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering_fields = ("username",)
+    default_ordering = ("username",)
+    opt_in = True
+
+    def get_ordering(self, queryset):
+        # Usernames are unique, so no id tie-breaker is needed. Without it a
+        # page is a single `username > :last` range on the (type, username)
+        # index; with it SQLite may answer the OR condition with a sort.
+        ordering = super().get_ordering(queryset)
+        return [term for term in ordering if term.lstrip("-") not in ("id", "pk")]
@@ -3,11 +3,14 @@ Profile serializers:
 - ProfileSerializer for "my profile" read/update use-case
 - ProfileSummarySerializer for listing business/customer profiles
 - NullToEmptyStringMixin to normalize None -> "" for specific fields
+- RatingSummaryMixin adds the rating summary of business profiles with `?expand=rating`
 """
 
 from rest_framework import serializers
 
+from core.api.expand import is_expanded
 from profiles_app.models import Profile
+from reviews_app.models import BusinessRatingSummary
 
 
 class NullToEmptyStringMixin:
@@ -30,6 +33,24 @@ class NullToEmptyStringMixin:
         return data
 
 
+class RatingSummaryMixin:
+    """
+    Add `rating` (review_count, average_rating, histogram) to business
+    profiles when `?expand=rating` is requested.
+
+    Reads `user.rating_summary`; list views select it with the profiles.
+    """
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if instance.type == "business" and is_expanded(self.context, "rating"):
+            summary = getattr(instance.user, "rating_summary", None)
+            if summary is None:
+                summary = BusinessRatingSummary(business_user_id=instance.user_id)
+            data["rating"] = summary.as_dict()
+        return data
+
+
 class BaseProfileSerializer(serializers.ModelSerializer):
     """
     Base serializer exposing full Profile model plus some user fields.
@@ -46,7 +67,7 @@ class BaseProfileSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class ProfileSerializer(RatingSummaryMixin, serializers.ModelSerializer):
     """
     Serializer for retrieving/updating the authenticated user's profile.
 
@@ -101,7 +122,7 @@ class ProfileSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class ProfileSummarySerializer(NullToEmptyStringMixin, BaseProfileSerializer):
+class ProfileSummarySerializer(RatingSummaryMixin, NullToEmptyStringMixin, BaseProfileSerializer):
     """
     Compact list serializer for business/customer listings.
 
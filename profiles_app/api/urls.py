@@ -3,6 +3,7 @@ Routes for profile endpoints:
 - /business/ : list business profiles
 - /customer/ : list customer profiles
 - /          : redirect to /<user_id>/ of current user
+- /bulk/      : profile summaries of many users (?user_id=1,2,3)
 - /<user_id>/ : profile viewset (lookup by user_id)
 """
 
@@ -1,18 +1,28 @@
 """
 Views for profile endpoints:
-- ProfileViewSet: exposes a single "my profile" via list() and user_id lookup
+- ProfileViewSet: exposes a single "my profile" via list() and user_id lookup,
+  plus bulk() for the profile summaries of many users at once
 - ProfileRedirectView: redirects /api/profile/ -> /api/profile/<user_id>/
 - BusinessProfileListView: lists all business profiles
 - CustomerProfileListView: lists all customer profiles
+
+Both directories are ordered by username, searchable by username prefix,
+filterable by location and keyset-paginated with `cursor`/`page_size`.
 """
 
 from django.shortcuts import get_object_or_404, redirect
-from rest_framework import generics, viewsets
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from core.api.expand import get_expand_fields
+from core.api.params import parse_id_list
 from profiles_app.models import Profile
+from .filters import ProfileDirectoryFilter
+from .pagination import ProfilesCursorPagination
 from .permissions import IsOwnerOrReadOnly
 from .serializers import ProfileSerializer, ProfileSummarySerializer
 
@@ -24,12 +34,14 @@ class ProfileViewSet(viewsets.ModelViewSet):
     Notes:
         - lookup_field is user_id, so detail routes look like /<user_id>/
         - list() is overridden to return the current user's profile as single object
+        - bulk() returns profile summaries for many user ids (at most MAX_IDS)
     """
 
     queryset = Profile.objects.all()
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
     lookup_field = "user_id"
+    MAX_IDS = 100
 
     def list(self, request, *args, **kwargs):
         """
@@ -39,6 +51,33 @@ class ProfileViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(profile)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["get"], url_path="bulk")
+    def bulk(self, request, *args, **kwargs):
+        """
+        Profile summaries for many users in one query.
+
+        Query params:
+            user_id: repeatable and/or comma separated user PKs (at most MAX_IDS)
+            expand: `rating` adds the rating summary of business profiles
+
+        Returns:
+            {"results": [profile summary, ...] in request order,
+             "missing": [ids without a profile]}
+        """
+        ids = parse_id_list(request.query_params, "user_id", self.MAX_IDS)
+
+        profiles = Profile.objects.select_related("user")
+        if "rating" in get_expand_fields(request):
+            profiles = profiles.select_related("user__rating_summary")
+        by_user = {profile.user_id: profile for profile in profiles.filter(user_id__in=ids)}
+
+        found = [by_user[pk] for pk in ids if pk in by_user]
+        serializer = ProfileSummarySerializer(found, many=True, context=self.get_serializer_context())
+        return Response(
+            {"results": serializer.data, "missing": [pk for pk in ids if pk not in by_user]},
+            status=status.HTTP_200_OK,
+        )
+
 
 class ProfileRedirectView(APIView):
     """
@@ -52,33 +91,43 @@ class ProfileRedirectView(APIView):
         return redirect(f"{profile.user.id}/")
 
 
-class BusinessProfileListView(generics.ListAPIView):
+class ProfileDirectoryView(generics.ListAPIView):
     """
-    List all business profiles.
+    Base list of all profiles of `profile_type`, ordered by username.
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = ProfileSummarySerializer
+    pagination_class = ProfilesCursorPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = ProfileDirectoryFilter
+    profile_type = None
 
     def get_queryset(self):
         return (
             Profile.objects.select_related("user")
-            .filter(type="business")
-            .order_by("user__username")
+            .filter(type=self.profile_type)
+            .order_by("username")
         )
 
 
-class CustomerProfileListView(generics.ListAPIView):
+class BusinessProfileListView(ProfileDirectoryView):
     """
-    List all customer profiles.
+    List all business profiles (`?expand=rating` adds each rating summary).
     """
 
-    permission_classes = [IsAuthenticated]
-    serializer_class = ProfileSummarySerializer
+    profile_type = "business"
 
     def get_queryset(self):
-        return (
-            Profile.objects.select_related("user")
-            .filter(type="customer")
-            .order_by("user__username")
-        )
+        profiles = super().get_queryset()
+        if "rating" in get_expand_fields(self.request):
+            profiles = profiles.select_related("user__rating_summary")
+        return profiles
+
+
+class CustomerProfileListView(ProfileDirectoryView):
+    """
+    List all customer profiles.
+    """
+
+    profile_type = "customer"
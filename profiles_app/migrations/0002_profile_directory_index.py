@@ -0,0 +1,34 @@
+# Generated by Django 5.2.11 on 2026-10-18 06:08
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_usernames(apps, schema_editor):
+    Profile = apps.get_model("profiles_app", "Profile")
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    Profile.objects.update(
+        username=Subquery(User.objects.filter(pk=OuterRef("user_id")).values("username")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='username',
+            field=models.CharField(blank=True, default='', editable=False, max_length=150),
+        ),
+        migrations.RunPython(copy_usernames, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['type', 'username'], name='profile_type_username_idx'),
+        ),
+    ]
@@ -15,9 +15,17 @@ class Profile(models.Model):
     description = models.TextField(blank=True, default="")
     working_hours = models.CharField(max_length=255, blank=True, default="")
     type = models.CharField(max_length=20, choices=USER_TYPES, default='customer')
+    # Copy of user.username (kept in sync by profiles_app.signals), so the
+    # directories order and search by username on the profile table alone.
+    username = models.CharField(max_length=150, blank=True, default="", editable=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Directory pages: WHERE type = :type [AND username range] ORDER BY username
+            models.Index(fields=["type", "username"], name="profile_type_username_idx"),
+        ]
 
     def __str__(self):
         return f"Profile of {self.user.username}"
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Signal handlers keeping Profile.username equal to the user's username.
+
+Bulk operations (bulk_create, QuerySet.update) do not send these signals and
+must set Profile.username themselves.
+"""
+
+from django.conf import settings
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from profiles_app.models import Profile
+
+
+@receiver(pre_save, sender=Profile)
+def copy_username(sender, instance, **kwargs):
+    instance.username = instance.user.username
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_profile_username(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Follow user renames; ignore saves that cannot change the username
+    (e.g. last_login updates).
+    """
+    if created:
+        return
+    if update_fields is None or "username" in update_fields:
+        Profile.objects.filter(user_id=instance.pk).exclude(username=instance.username).update(
+            username=instance.username
+        )
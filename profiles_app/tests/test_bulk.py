@@ -0,0 +1,59 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from profiles_app.models import Profile
+from reviews_app.models import Review
+
+
+class ProfileBulkLookupTests(APITestCase):
+    def setUp(self):
+        self.business = User.objects.create_user(username="biz", password="pw123456", first_name="Bea")
+        Profile.objects.create(user=self.business, type="business")
+        self.customer = User.objects.create_user(username="cust", password="pw123456")
+        Profile.objects.create(user=self.customer, type="customer")
+        self.no_profile = User.objects.create_user(username="plain", password="pw123456")
+
+        self.url = reverse("profile-bulk")
+        self.client.force_authenticate(user=self.customer)
+
+    def test_returns_summaries_in_request_order_and_missing_ids(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url,
+                {"user_id": [f"{self.customer.id},{self.business.id}", self.no_profile.id, 9999]},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([p["user"] for p in results], [self.customer.id, self.business.id])
+        self.assertEqual(results[1]["first_name"], "Bea")
+        self.assertEqual(results[0]["location"], "")
+        self.assertEqual(response.data["missing"], [self.no_profile.id, 9999])
+
+    def test_duplicate_ids_are_returned_once(self):
+        response = self.client.get(self.url, {"user_id": f"{self.business.id},{self.business.id}"})
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_expand_rating(self):
+        Review.objects.create(business_user=self.business, reviewer=self.customer, rating=4)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.url, {"user_id": f"{self.business.id},{self.customer.id}", "expand": "rating"}
+            )
+
+        self.assertEqual(response.data["results"][0]["rating"]["average_rating"], 4.0)
+        self.assertNotIn("rating", response.data["results"][1])
+
+    def test_invalid_requests_return_400(self):
+        for params in ({}, {"user_id": "1,x"}, {"user_id": ",".join(map(str, range(1, 102)))}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+            self.assertIn("user_id", response.data)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url, {"user_id": self.business.id})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,88 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from profiles_app.models import Profile
+
+
+class ProfileDirectoryTests(APITestCase):
+    def setUp(self):
+        names = ["anna", "Anton", "ben", "bea", "carl", "anja", "bernd", "ana"]
+        for index, name in enumerate(names):
+            user = User.objects.create_user(username=name, password="pw123456")
+            Profile.objects.create(
+                user=user,
+                type="business" if index % 4 else "customer",
+                location="Berlin" if index % 2 else "Hamburg",
+            )
+
+        self.url = reverse("business-profile-list")
+        self.client.force_authenticate(user=user)
+
+    def expected_usernames(self, **filters):
+        profiles = Profile.objects.filter(type="business", **filters).order_by("username")
+        return list(profiles.values_list("username", flat=True))
+
+    def collect(self, params):
+        usernames = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            usernames += [profile["username"] for profile in response.data["results"]]
+            if not response.data["next"]:
+                return usernames, response
+            response = self.client.get(response.data["next"])
+
+    def test_list_stays_unpaginated_without_opt_in(self):
+        response = self.client.get(self.url)
+        self.assertEqual([p["username"] for p in response.json()], self.expected_usernames())
+
+    def test_cursor_pages_walk_the_directory_by_username(self):
+        usernames, last = self.collect({"page_size": 2})
+        self.assertEqual(usernames, self.expected_usernames())
+
+        back = self.client.get(last.data["previous"])
+        self.assertEqual([p["username"] for p in back.data["results"]], usernames[2:4])
+
+        response = self.client.get(reverse("customer-profile-list"), {"cursor": ""})
+        self.assertEqual(
+            [p["username"] for p in response.data["results"]],
+            list(
+                Profile.objects.filter(type="customer")
+                .order_by("username")
+                .values_list("username", flat=True)
+            ),
+        )
+
+    def test_each_page_is_one_query(self):
+        response = self.client.get(self.url, {"page_size": 2})
+        with self.assertNumQueries(1):
+            response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_username_prefix_search_and_location_filter(self):
+        response = self.client.get(self.url, {"search": "an"})
+        self.assertEqual([p["username"] for p in response.json()], ["ana", "anja"])
+
+        usernames, _ = self.collect({"search": "b", "location": "berlin", "page_size": 1})
+        self.assertEqual(usernames, self.expected_usernames(username__startswith="b", location="Berlin"))
+
+    def test_pages_read_the_type_username_index(self):
+        profiles = Profile.objects.select_related("user").filter(type="business")
+        for queryset in (
+            profiles.order_by("username"),
+            profiles.filter(username__lt="b").order_by("-username"),
+            profiles.filter(username__gte="an", username__lt="ao").order_by("username"),
+        ):
+            plan = queryset[:3].explain()
+            self.assertIn("profile_type_username_idx", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_username_follows_user_renames(self):
+        user = User.objects.get(username="Anton")
+        user.username = "zoe"
+        user.save()
+
+        self.assertEqual(Profile.objects.get(user=user).username, "zoe")
+        self.assertEqual(self.client.get(self.url, {"search": "zo"}).json()[0]["user"], user.id)
@@ -0,0 +1,20 @@
+"""
+Pagination configuration for the reviews list: opt-in keyset pagination on
+the requested `ordering` (updated_at or rating, newest first by default)
+plus id.
+"""
+
+from core.api.pagination import KeysetPagination
+
+
+class ReviewsCursorPagination(KeysetPagination):
+    """
+    Opt-in keyset pagination for reviews ({"next", "previous", "results"}).
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering_fields = ("updated_at", "rating")
+    default_ordering = ("-updated_at",)
+    opt_in = True
@@ -1,6 +1,7 @@
 """
 Serializers for reviews API:
-- list/detail output
+- list/detail output (`?expand=reviewer,business_user` embeds profile summaries
+  instead of user ids)
 - create with validation:
     - business_user must be a business profile
     - rating must be 1..5
@@ -8,14 +9,23 @@ Serializers for reviews API:
 - patch allows only rating/description
 """
 
+from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import serializers
 
+from core.api.expand import is_expanded
+from profiles_app.api.serializers import ProfileSummarySerializer
 from reviews_app.models import Review
 
+EXPANDABLE_USERS = ("reviewer", "business_user")
+
 
 class ReviewListSerializer(serializers.ModelSerializer):
     """
     Read-only serializer for listing reviews.
+
+    `?expand=reviewer,business_user` replaces the user ids with the users'
+    profile summaries; the list view selects users and profiles in the same
+    query.
     """
 
     class Meta:
@@ -31,6 +41,23 @@ class ReviewListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        for name in EXPANDABLE_USERS:
+            if is_expanded(self.context, name):
+                data[name] = self.get_profile_summary(getattr(instance, name))
+        return data
+
+    def get_profile_summary(self, user):
+        """
+        Profile summary of a user, or None if the user has no profile.
+        """
+        try:
+            profile = user.profile
+        except ObjectDoesNotExist:
+            return None
+        return ProfileSummarySerializer(profile, context=self.context).data
+
 
 class ReviewCreateSerializer(serializers.ModelSerializer):
     """
@@ -1,21 +1,35 @@
 """
 Reviews endpoint:
-- list: authenticated, filterable + orderable
+- list: authenticated, filterable + orderable; `cursor`/`page_size` enable
+  keyset pagination, `expand=reviewer,business_user` embeds profile summaries
 - create: authenticated + customer only
 - partial_update: authenticated + review owner, only rating/description allowed
 - destroy: authenticated + review owner
+
+Writes update the business user's BusinessRatingSummary in the same
+transaction (reviews_app.signals).
+
+Additional endpoint (APIView):
+- RatingSummaryView: review count, average rating and star histogram of a
+  business user, read from the summary row
 """
 
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins, status, viewsets
 from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from reviews_app.models import Review
+from core.api.expand import get_expand_fields
+from profiles_app.models import Profile
+from reviews_app.models import BusinessRatingSummary, Review
 from .filters import ReviewFilter
+from .pagination import ReviewsCursorPagination
 from .permissions import IsCustomerUser, IsReviewOwner
 from .serializers import (
+    EXPANDABLE_USERS,
     ReviewCreateSerializer,
     ReviewDetailSerializer,
     ReviewListSerializer,
@@ -37,6 +51,7 @@ class ReviewsViewSet(
 
     queryset = Review.objects.all()
     permission_classes = [IsAuthenticated]
+    pagination_class = ReviewsCursorPagination
 
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_class = ReviewFilter
@@ -58,6 +73,21 @@ class ReviewsViewSet(
 
         return permissions
 
+    def get_queryset(self):
+        """
+        List: select the expanded users with their profiles (and the business
+        user's rating summary for `expand=rating`) in the same query.
+        """
+        queryset = super().get_queryset()
+        if self.action != "list":
+            return queryset
+
+        expand = get_expand_fields(self.request)
+        related = [f"{name}__profile" for name in EXPANDABLE_USERS if name in expand]
+        if "business_user" in expand and "rating" in expand:
+            related.append("business_user__rating_summary")
+        return queryset.select_related(*related) if related else queryset
+
     def get_serializer_class(self):
         """
         Serializer by action.
@@ -70,6 +100,7 @@ class ReviewsViewSet(
             return ReviewListSerializer
         return ReviewDetailSerializer
 
+    @transaction.atomic
     def create(self, request, *args, **kwargs):
         """
         Create a review and return a detail payload.
@@ -83,6 +114,7 @@ class ReviewsViewSet(
             status=status.HTTP_201_CREATED,
         )
 
+    @transaction.atomic
     def partial_update(self, request, *args, **kwargs):
         """
         Patch rating/description only. Reject any other keys.
@@ -108,6 +140,7 @@ class ReviewsViewSet(
             status=status.HTTP_200_OK,
         )
 
+    @transaction.atomic
     def destroy(self, request, *args, **kwargs):
         """
         Delete the review and return 204.
@@ -115,3 +148,30 @@ class ReviewsViewSet(
         review = self.get_object()
         review.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class RatingSummaryView(APIView):
+    """
+    Return the rating summary of a business user.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, business_user_id, *args, **kwargs):
+        """
+        Args:
+            business_user_id: User PK that must belong to a business profile.
+
+        Returns:
+            {"business_user", "review_count", "average_rating", "histogram"}
+        """
+        summary = BusinessRatingSummary.objects.filter(pk=business_user_id).first()
+        if summary is None:
+            if not Profile.objects.filter(user_id=business_user_id, type="business").exists():
+                return Response(status=status.HTTP_404_NOT_FOUND)
+            summary = BusinessRatingSummary(business_user_id=business_user_id)
+
+        return Response(
+            {"business_user": business_user_id, **summary.as_dict()},
+            status=status.HTTP_200_OK,
+        )
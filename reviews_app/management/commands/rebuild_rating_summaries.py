@@ -0,0 +1,28 @@
+"""
+Rebuild the materialized BusinessRatingSummary rows from Review.
+
+Usage:
+    python manage.py rebuild_rating_summaries
+    python manage.py rebuild_rating_summaries --business-user-id 3
+"""
+
+from django.core.management.base import BaseCommand
+
+from reviews_app.models import BusinessRatingSummary
+
+
+class Command(BaseCommand):
+    help = "Recompute review count, rating sum and star histogram per business user."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--business-user-id",
+            type=int,
+            action="append",
+            dest="business_user_ids",
+            help="Only rebuild the given user (can be passed multiple times).",
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = BusinessRatingSummary.objects.rebuild(options["business_user_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt rating summaries for {rebuilt} business user(s)."))
@@ -1,5 +1,6 @@
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Q, Sum
 
 
 class Review(models.Model):
@@ -27,6 +28,132 @@ class Review(models.Model):
                 name="unique_review_per_business_user_and_reviewer",
             ),
         ]
+        indexes = [
+            # Filtered list pages: WHERE <side> = :user ORDER BY updated_at|rating, id
+            models.Index(fields=["business_user", "updated_at"], name="review_business_updated_idx"),
+            models.Index(fields=["business_user", "rating"], name="review_business_rating_idx"),
+            models.Index(fields=["reviewer", "updated_at"], name="review_reviewer_updated_idx"),
+            models.Index(fields=["reviewer", "rating"], name="review_reviewer_rating_idx"),
+            # Unfiltered list pages in the default ordering.
+            models.Index(fields=["updated_at"], name="review_updated_idx"),
+        ]
 
     def __str__(self):
         return f"Review #{self.id} ({self.rating})"
+
+
+class BusinessRatingSummaryQuerySet(models.QuerySet):
+    def apply(self, business_user_id, rating_deltas):
+        """
+        Apply {rating: +n/-n} review changes of one business user in a single
+        UPDATE; the row is created on first use.
+        """
+        changes = {
+            "review_count": F("review_count") + sum(rating_deltas.values()),
+            "rating_sum": F("rating_sum") + sum(r * d for r, d in rating_deltas.items()),
+        }
+        for rating, delta in rating_deltas.items():
+            field = BusinessRatingSummary.star_field(rating)
+            changes[field] = F(field) + delta
+
+        row = self.filter(pk=business_user_id)
+        if row.update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                self.create(business_user_id=business_user_id)
+        except IntegrityError:
+            # Created by a concurrent transaction in the meantime.
+            pass
+        row.update(**changes)
+
+    def rebuild(self, business_user_ids=None):
+        """
+        Recompute the summaries from Review: one row per reviewed business
+        user, rows without reviews are removed.
+
+        Returns:
+            int: number of written summary rows
+        """
+        reviews = Review.objects.all()
+        summaries = self.all()
+        if business_user_ids is not None:
+            reviews = reviews.filter(business_user_id__in=business_user_ids)
+            summaries = summaries.filter(pk__in=business_user_ids)
+
+        totals = (
+            reviews.order_by()
+            .values("business_user_id")
+            .annotate(
+                review_count=Count("id"),
+                rating_sum=Sum("rating"),
+                **{
+                    BusinessRatingSummary.star_field(star): Count("id", filter=Q(rating=star))
+                    for star in BusinessRatingSummary.STARS
+                },
+            )
+        )
+        rows = [BusinessRatingSummary(**total) for total in totals]
+
+        with transaction.atomic():
+            summaries.exclude(pk__in=[row.business_user_id for row in rows]).delete()
+            self.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["business_user"],
+                update_fields=BusinessRatingSummary.COUNT_FIELDS,
+            )
+        return len(rows)
+
+
+class BusinessRatingSummary(models.Model):
+    """
+    Materialized review count, rating sum and 1-5 star histogram of one
+    business user.
+
+    Kept current by reviews_app.signals in the transaction of the review
+    write; `rebuild()` (manage.py rebuild_rating_summaries) recomputes them.
+    Business users without reviews have no row.
+    """
+
+    STARS = range(1, 6)
+    COUNT_FIELDS = ["review_count", "rating_sum"] + [f"stars_{star}" for star in STARS]
+
+    business_user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="rating_summary",
+    )
+    review_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    stars_1 = models.PositiveIntegerField(default=0)
+    stars_2 = models.PositiveIntegerField(default=0)
+    stars_3 = models.PositiveIntegerField(default=0)
+    stars_4 = models.PositiveIntegerField(default=0)
+    stars_5 = models.PositiveIntegerField(default=0)
+
+    objects = BusinessRatingSummaryQuerySet.as_manager()
+
+    def __str__(self):
+        return f"Rating summary of user #{self.business_user_id}"
+
+    @staticmethod
+    def star_field(rating):
+        return f"stars_{rating}"
+
+    @property
+    def average_rating(self):
+        if not self.review_count:
+            return 0.0
+        return round(self.rating_sum / self.review_count, 1)
+
+    def as_dict(self):
+        """
+        API payload: review_count, average_rating (1 decimal), histogram {"1".."5": int}.
+        """
+        return {
+            "review_count": self.review_count,
+            "average_rating": self.average_rating,
+            "histogram": {str(star): getattr(self, self.star_field(star)) for star in self.STARS},
+        }
@@ -0,0 +1,45 @@
+"""
+Signal handlers keeping BusinessRatingSummary rows in sync: review create,
+rating change and delete adjust the summary of the business user in the
+transaction of the review write.
+
+Bulk operations (bulk_create, QuerySet.update/delete without instances) do
+not send these signals; run `manage.py rebuild_rating_summaries` after them.
+"""
+
+from collections import Counter, defaultdict
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from reviews_app.models import BusinessRatingSummary, Review
+
+
+@receiver(post_init, sender=Review)
+def remember_review_rating(sender, instance, **kwargs):
+    instance._rated = (instance.__dict__.get("business_user_id"), instance.__dict__.get("rating"))
+
+
+@receiver(post_save, sender=Review)
+def summarize_review_write(sender, instance, created, **kwargs):
+    """
+    Move the review from its previous (business user, rating) to the current one.
+    """
+    current = (instance.business_user_id, instance.rating)
+    previous = None if created else instance._rated
+
+    if previous != current:
+        deltas = defaultdict(Counter)
+        if previous and all(previous):
+            deltas[previous[0]][previous[1]] -= 1
+        deltas[current[0]][current[1]] += 1
+        for business_user_id, rating_deltas in deltas.items():
+            BusinessRatingSummary.objects.apply(business_user_id, rating_deltas)
+    instance._rated = current
+
+
+@receiver(post_delete, sender=Review)
+def summarize_review_delete(sender, instance, **kwargs):
+    business_user_id, rating = instance._rated
+    if business_user_id and rating:
+        BusinessRatingSummary.objects.apply(business_user_id, {rating: -1})
@@ -0,0 +1,66 @@
+from django.contrib.auth.models import User
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from profiles_app.models import Profile
+from reviews_app.models import Review
+
+
+class ReviewsExpandTests(APITestCase):
+    def setUp(self):
+        self.business = User.objects.create_user(
+            username="biz", password="pw123456", first_name="Bea", last_name="Biz"
+        )
+        Profile.objects.create(user=self.business, type="business", location="Berlin")
+        for index in range(4):
+            customer = User.objects.create_user(username=f"cust{index}", password="pw123456")
+            Profile.objects.create(user=customer, type="customer")
+            Review.objects.create(business_user=self.business, reviewer=customer, rating=index + 1)
+
+        self.url = reverse("reviews-list")
+        self.client.force_authenticate(user=customer)
+
+    def test_without_expand_users_are_ids(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["business_user"], self.business.id)
+
+    def test_expand_embeds_profile_summaries(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"expand": "reviewer,business_user"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        review = response.json()[0]
+        self.assertEqual(review["business_user"]["user"], self.business.id)
+        self.assertEqual(review["business_user"]["first_name"], "Bea")
+        self.assertEqual(review["business_user"]["location"], "Berlin")
+        self.assertEqual(review["business_user"]["type"], "business")
+        self.assertEqual(review["reviewer"]["type"], "customer")
+        self.assertTrue(review["reviewer"]["username"].startswith("cust"))
+
+    def test_expand_query_count_is_constant_per_page(self):
+        params = {"expand": "reviewer", "page_size": 2}
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, params)
+        with self.assertNumQueries(1):
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsInstance(response.data["results"][0]["business_user"], int)
+        self.assertEqual(response.data["results"][0]["reviewer"]["type"], "customer")
+
+    def test_expand_rating_adds_business_rating_summary(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"expand": "business_user,rating"})
+
+        rating = response.json()[0]["business_user"]["rating"]
+        self.assertEqual(rating["review_count"], 4)
+        self.assertEqual(rating["average_rating"], 2.5)
+
+    def test_user_without_profile_is_null(self):
+        Profile.objects.filter(user=self.business).delete()
+
+        response = self.client.get(self.url, {"expand": "business_user"})
+        self.assertIsNone(response.json()[0]["business_user"])
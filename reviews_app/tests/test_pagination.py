@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from profiles_app.models import Profile
+from reviews_app.models import Review
+
+
+class ReviewsListPaginationTests(APITestCase):
+    def setUp(self):
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.other = User.objects.create_user(username="other", password="pw123456")
+        Profile.objects.create(user=self.other, type="business")
+
+        # Repeated timestamps and ratings so pages split inside ties.
+        now = timezone.now()
+        for index in range(7):
+            customer = User.objects.create_user(username=f"cust{index}", password="pw123456")
+            Profile.objects.create(user=customer, type="customer")
+            for business in (self.business, self.other):
+                review = Review.objects.create(
+                    business_user=business, reviewer=customer, rating=index % 3 + 1
+                )
+                Review.objects.filter(pk=review.pk).update(
+                    updated_at=now - timedelta(hours=index // 2)
+                )
+
+        self.url = reverse("reviews-list")
+        self.client.force_authenticate(user=customer)
+
+    def expected_ids(self, *ordering):
+        reviews = Review.objects.filter(business_user=self.business).order_by(*ordering)
+        return list(reviews.values_list("id", flat=True))
+
+    def collect(self, params):
+        ids = []
+        response = self.client.get(self.url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [review["id"] for review in response.data["results"]]
+            if not response.data["next"]:
+                return ids, response
+            response = self.client.get(response.data["next"])
+
+    def test_list_stays_unpaginated_without_opt_in(self):
+        response = self.client.get(self.url, {"business_user_id": self.business.id})
+        self.assertEqual(len(response.json()), 7)
+
+    def test_cursor_pages_walk_both_orderings(self):
+        params = {"business_user_id": self.business.id, "page_size": 3}
+
+        ids, last = self.collect(params)
+        self.assertEqual(ids, self.expected_ids("-updated_at", "-id"))
+
+        back = self.client.get(last.data["previous"])
+        self.assertEqual([review["id"] for review in back.data["results"]], ids[3:6])
+
+        ids, _ = self.collect({**params, "ordering": "rating"})
+        self.assertEqual(ids, self.expected_ids("rating", "id"))
+
+        ids, _ = self.collect({**params, "ordering": "-rating"})
+        self.assertEqual(ids, self.expected_ids("-rating", "-id"))
+
+    def test_each_page_is_one_query(self):
+        response = self.client.get(self.url, {"business_user_id": self.business.id, "page_size": 2})
+        with self.assertNumQueries(1):
+            response = self.client.get(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(self.url, {"cursor": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_filtered_pages_use_the_composite_indexes(self):
+        for side, ordering, index in [
+            ("business_user", "updated_at", "review_business_updated_idx"),
+            ("business_user", "rating", "review_business_rating_idx"),
+            ("reviewer", "updated_at", "review_reviewer_updated_idx"),
+            ("reviewer", "rating", "review_reviewer_rating_idx"),
+        ]:
+            plan = (
+                Review.objects.filter(**{side: self.business})
+                .order_by(f"-{ordering}", "-id")[:3]
+                .explain()
+            )
+            self.assertIn(index, plan)
+            self.assertNotIn("TEMP B-TREE", plan)
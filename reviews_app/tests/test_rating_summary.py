@@ -0,0 +1,120 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from profiles_app.models import Profile
+from reviews_app.models import BusinessRatingSummary, Review
+
+
+class BusinessRatingSummaryTests(APITestCase):
+    def setUp(self):
+        self.business = User.objects.create_user(username="biz", password="pw123456")
+        Profile.objects.create(user=self.business, type="business")
+        self.other_business = User.objects.create_user(username="biz2", password="pw123456")
+        Profile.objects.create(user=self.other_business, type="business")
+        self.customers = []
+        for index in range(3):
+            customer = User.objects.create_user(username=f"cust{index}", password="pw123456")
+            Profile.objects.create(user=customer, type="customer")
+            self.customers.append(customer)
+
+    def summary(self, user=None):
+        return BusinessRatingSummary.objects.get(pk=(user or self.business).pk).as_dict()
+
+    def post_review(self, customer, rating):
+        self.client.force_authenticate(user=customer)
+        return self.client.post(
+            reverse("reviews-list"),
+            {"business_user": self.business.id, "rating": rating, "description": "ok"},
+            format="json",
+        )
+
+    def test_api_writes_keep_the_summary_current(self):
+        first = self.post_review(self.customers[0], 5)
+        self.post_review(self.customers[1], 3)
+        self.assertEqual(
+            self.summary(),
+            {"review_count": 2, "average_rating": 4.0,
+             "histogram": {"1": 0, "2": 0, "3": 1, "4": 0, "5": 1}},
+        )
+
+        self.client.force_authenticate(user=self.customers[0])
+        url = reverse("reviews-detail", args=[first.data["id"]])
+        self.client.patch(url, {"rating": 2}, format="json")
+        self.assertEqual(self.summary()["histogram"], {"1": 0, "2": 1, "3": 1, "4": 0, "5": 0})
+        self.assertEqual(self.summary()["average_rating"], 2.5)
+
+        self.client.patch(url, {"description": "changed"}, format="json")
+        self.client.delete(url)
+        self.assertEqual(self.summary()["review_count"], 1)
+        self.assertEqual(self.summary()["average_rating"], 3.0)
+
+        incremental = self.summary()
+        BusinessRatingSummary.objects.rebuild()
+        self.assertEqual(self.summary(), incremental)
+
+    def test_orm_move_between_business_users(self):
+        review = Review.objects.create(business_user=self.business, reviewer=self.customers[0], rating=4)
+
+        review.business_user = self.other_business
+        review.save()
+
+        self.assertEqual(self.summary()["review_count"], 0)
+        self.assertEqual(self.summary(self.other_business)["histogram"]["4"], 1)
+
+    def test_rating_summary_endpoint(self):
+        self.post_review(self.customers[0], 4)
+        self.client.force_authenticate(user=self.customers[1])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("rating-summary", args=[self.business.id]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["business_user"], self.business.id)
+        self.assertEqual(response.data["review_count"], 1)
+
+        response = self.client.get(reverse("rating-summary", args=[self.other_business.id]))
+        self.assertEqual(response.data["review_count"], 0)
+        self.assertEqual(response.data["average_rating"], 0.0)
+
+        response = self.client.get(reverse("rating-summary", args=[self.customers[0].id]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_business_profiles_expand_rating(self):
+        self.post_review(self.customers[0], 5)
+        self.client.force_authenticate(user=self.customers[1])
+
+        response = self.client.get(reverse("business-profile-list"))
+        self.assertNotIn("rating", response.json()[0])
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("business-profile-list"), {"expand": "rating"})
+        ratings = {profile["user"]: profile["rating"]["review_count"] for profile in response.json()}
+        self.assertEqual(ratings, {self.business.id: 1, self.other_business.id: 0})
+
+        response = self.client.get(
+            reverse("profile-detail", args=[self.business.id]), {"expand": "rating"}
+        )
+        self.assertEqual(response.data["rating"]["average_rating"], 5.0)
+
+        response = self.client.get(
+            reverse("profile-detail", args=[self.customers[0].id]), {"expand": "rating"}
+        )
+        self.assertNotIn("rating", response.data)
+
+    def test_rebuild_command(self):
+        Review.objects.bulk_create([
+            Review(business_user=self.business, reviewer=customer, rating=rating)
+            for customer, rating in zip(self.customers, [1, 1, 4])
+        ])
+        self.assertFalse(BusinessRatingSummary.objects.exists())
+
+        out = StringIO()
+        call_command("rebuild_rating_summaries", stdout=out)
+
+        self.assertIn("Rebuilt rating summaries for 1 business user(s).", out.getvalue())
+        self.assertEqual(self.summary()["histogram"], {"1": 2, "2": 0, "3": 0, "4": 1, "5": 0})
+        self.assertEqual(self.summary()["average_rating"], 2.0)